@@ -1,35 +1,65 @@
+import csv
+import io
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 from app.core.database import SessionLocal, engine
-from app.models.models import Base, RewardPoint, User
+from app.models.models import Base, Reward, RewardPoint, User
+
+# Above this many missing rows, stream the backfill through COPY instead of INSERT
+COPY_THRESHOLD = 5000
+
+
+def copy_reward_points(db: Session, user_ids):
+    """Bulk-load zeroed reward_points rows for the given users using PostgreSQL COPY"""
+    buf = io.StringIO()
+    writer = csv.writer(buf, delimiter='\t', lineterminator='\n')
+    for user_id in user_ids:
+        writer.writerow((user_id, 0))
+    buf.seek(0)
+
+    # COPY needs the raw psycopg2 cursor; it runs inside the session's transaction.
+    # created_at/updated_at are filled in by the column defaults
+    raw_conn = db.connection().connection
+    with raw_conn.cursor() as cur:
+        cur.copy_from(buf, 'reward_points', columns=('user_id', 'total_points'), sep='\t')
+
 
 def add_reward_tables():
     """Add reward tables to existing database"""
-    
-    # Create new tables
-    Base.metadata.create_all(bind=engine)
-    
+
+    # Create only the reward tables (don't inspect every model's table)
+    Base.metadata.create_all(bind=engine, tables=[Reward.__table__, RewardPoint.__table__])
+
     db = SessionLocal()
-    
-    # Initialize reward points for existing users
-    existing_users = db.query(User).all()
-    
-    for user in existing_users:
-        # Check if user already has reward points record
-        existing_points = db.query(RewardPoint).filter(
-            RewardPoint.user_id == user.id
-        ).first()
-        
-        if not existing_points:
-            # Create initial reward points record
-            reward_points = RewardPoint(
-                user_id=user.id,
-                total_points=0
+
+    # Find users that don't have a reward points record yet
+    missing_ids = db.execute(text("""
+        SELECT u.id
+        FROM users u
+        LEFT JOIN reward_points rp ON rp.user_id = u.id
+        WHERE rp.user_id IS NULL
+    """)).scalars().all()
+
+    if len(missing_ids) > COPY_THRESHOLD:
+        copy_reward_points(db, missing_ids)
+        initialized = len(missing_ids)
+    elif missing_ids:
+        # Small backfill: single set-based statement, anti-join runs in the database
+        result = db.execute(text("""
+            INSERT INTO reward_points (user_id, total_points)
+            SELECT u.id, 0
+            FROM users u
+            WHERE NOT EXISTS (
+                SELECT 1 FROM reward_points rp WHERE rp.user_id = u.id
             )
-            db.add(reward_points)
-    
+        """))
+        initialized = result.rowcount
+    else:
+        initialized = 0
+
     db.commit()
-    print(f"Initialized reward points for {len(existing_users)} users!")
+    print(f"Initialized reward points for {initialized} users!")
     db.close()
 
 if __name__ == "__main__":
-    add_reward_tables()
\ No newline at end of file
+    add_reward_tables()
@@ -1,21 +1,51 @@
+from typing import AsyncIterator
+
 from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from .config import settings
 
-# Conservative connection pooling for 50 RPS with 2 workers
+
+def _pool_options(pool_size: int, max_overflow: int) -> dict:
+    """
+    Pool arguments for one engine. The sync and async engines each get their own
+    budget from settings; a worker's connection ceiling is the sum of both
+    """
+    if settings.db_use_pgbouncer:
+        # PgBouncer in transaction mode already pools server connections
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_pre_ping": True,     # Verify connections are alive
+        "pool_recycle": 1800,      # Recycle connections after 30 minutes
+    }
+
+
 engine = create_engine(
     settings.database_url,
-    pool_size=10,              # 5 per worker (10 total)
-    max_overflow=10,           # Allow 10 additional (20 max total)
-    pool_timeout=10,           # Wait 10s for connection (fail fast)
-    pool_pre_ping=True,        # Verify connections are alive
-    pool_recycle=1800          # Recycle connections after 30 minutes
+    insertmanyvalues_page_size=1000,  # Batch executemany INSERTs into 1000-row multi-VALUES statements
+    executemany_mode="values_plus_batch",  # psycopg2 execute_batch() for executemany UPDATE/DELETE too
+    executemany_batch_page_size=500,    # Statements per execute_batch() round trip
+    **_pool_options(settings.db_pool_size, settings.db_max_overflow)
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base = declarative_base()
+# asyncpg engine for routers that run on the event loop instead of the threadpool
+async_engine = create_async_engine(
+    make_url(settings.database_url).set(drivername="postgresql+asyncpg"),
+    # asyncpg's prepared statement cache doesn't survive PgBouncer handing the next
+    # transaction to a different server connection
+    connect_args={"statement_cache_size": 0} if settings.db_use_pgbouncer else {},
+    **_pool_options(settings.db_async_pool_size, settings.db_async_max_overflow)
+)
+
+# expire_on_commit=False: attributes read after commit would otherwise need an implicit (sync) reload
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 
 def get_db():
@@ -23,4 +53,9 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -3,18 +3,34 @@ RBAC (Role-Based Access Control) utilities
 Provides decorators and functions for permission checking
 """
 
-from functools import wraps
-from typing import List, Set
+import time
+from functools import reduce, wraps
+from operator import or_
+from typing import Collection, Dict, FrozenSet, List, Optional, Tuple
 from fastapi import Depends, HTTPException, status
+from sqlalchemy import bindparam, exists, select
 from sqlalchemy.orm import Session
-from ..core.security import get_current_user
+from ..core.config import settings
+from ..core.security import Principal, get_current_principal_async, get_current_user
 from ..core.database import get_db
 from ..models.models import User, Permission, RolePermission, UserCustomPermission, UserRole
 
 
-# Default permissions for each role
+# Every permission the application checks, defined once (matches the seeded permissions table)
+ALL_PERMISSIONS = (
+    'read:posts', 'write:posts', 'update:posts', 'delete:posts', 'manage:posts',
+    'read:alerts', 'write:alerts', 'update:alerts', 'delete:alerts', 'manage:alerts',
+    'read:files', 'write:files', 'update:files', 'delete:files', 'manage:files',
+    'read:folders', 'write:folders', 'update:folders', 'delete:folders', 'manage:folders',
+    'read:rewards', 'write:rewards', 'manage:rewards',
+    'read:store', 'write:store', 'manage:store',
+    'read:users', 'write:users', 'update:users', 'delete:users', 'manage:users',
+    'read:ai', 'manage:ai',
+)
+
+# Default permissions for each role (immutable, shared by every permission check)
 ROLE_PERMISSIONS = {
-    UserRole.STUDENT: {
+    UserRole.STUDENT: frozenset({
         # Posts
         'read:posts', 'write:posts', 'update:posts', 'delete:posts',
         # Alerts
@@ -31,8 +47,8 @@ ROLE_PERMISSIONS = {
         'read:users',
         # AI
         'read:ai',
-    },
-    UserRole.STAFF: {
+    }),
+    UserRole.STAFF: frozenset({
         # Posts
         'read:posts', 'write:posts', 'update:posts', 'delete:posts', 'manage:posts',
         # Alerts
@@ -49,8 +65,8 @@ ROLE_PERMISSIONS = {
         'read:users', 'update:users',
         # AI
         'read:ai',
-    },
-    UserRole.ADMIN: {
+    }),
+    UserRole.ADMIN: frozenset({
         # Posts
         'read:posts', 'write:posts', 'update:posts', 'delete:posts', 'manage:posts',
         # Alerts
@@ -67,42 +83,174 @@ ROLE_PERMISSIONS = {
         'read:users', 'write:users', 'update:users', 'delete:users', 'manage:users',
         # AI
         'read:ai', 'manage:ai',
-    }
+    }),
+}
+
+# One bit per known permission name, and each role's defaults as a single mask,
+# so role checks are an integer AND instead of per-name set lookups
+PERMISSION_BITS = {name: 1 << i for i, name in enumerate(ALL_PERMISSIONS)}
+ROLE_MASKS = {
+    role: reduce(or_, (PERMISSION_BITS[name] for name in perms), 0)
+    for role, perms in ROLE_PERMISSIONS.items()
 }
 
+# Each role's defaults in display order, sorted once instead of on every admin request
+SORTED_ROLE_PERMISSIONS = {role: sorted(perms) for role, perms in ROLE_PERMISSIONS.items()}
+
+
+# Statements built once at import; only the bound user id / names change per call
+_CUSTOM_PERMISSIONS_STMT = select(Permission.name, UserCustomPermission.granted).join(
+    UserCustomPermission, UserCustomPermission.permission_id == Permission.id
+).where(
+    UserCustomPermission.user_id == bindparam("user_id")
+)
+_REVOCATIONS_STMT = select(exists().where(
+    UserCustomPermission.user_id == bindparam("user_id"),
+    UserCustomPermission.granted == False,
+    UserCustomPermission.permission_id == Permission.id,
+    Permission.name.in_(bindparam("names", expanding=True))
+))
+
+
+def _validate_permission(permission: str) -> None:
+    """
+    Reject unknown permission names when a checker is declared, so typos fail at startup
+    """
+    if permission not in PERMISSION_BITS:
+        raise ValueError(f"Unknown permission: {permission}")
+
+
+def permission_mask(permission_names: List[str]) -> int:
+    """
+    OR together the bits of the given permissions (unknown names contribute nothing)
+    """
+    return reduce(or_, (PERMISSION_BITS.get(name, 0) for name in permission_names), 0)
+
+
+def _get_permission_cache(db: Session) -> dict:
+    """
+    Request-scoped permission cache stored on the session
+    (get_db creates one session per request, so the cache dies with it)
+    """
+    return db.info.setdefault('perm_cache', {})
+
+
+# Effective permissions shared by every request in this worker: user_id -> (expires_at, role, permissions).
+# Overrides change rarely; changes made through this worker invalidate immediately, other
+# workers pick them up within settings.permission_cache_seconds. Entries are only used while
+# the user's role still matches, so role changes never serve another role's defaults
+MAX_CACHED_PERMISSIONS = 10_000
+permission_cache: Dict[int, Tuple[float, UserRole, FrozenSet[str]]] = {}
+
+
+def clear_permission_cache() -> None:
+    permission_cache.clear()
+
+
+def _cache_permissions(user: User, permissions: FrozenSet[str], db: Session) -> None:
+    _get_permission_cache(db)[user.id] = permissions
+    if len(permission_cache) >= MAX_CACHED_PERMISSIONS:
+        permission_cache.clear()
+    permission_cache[user.id] = (time.monotonic() + settings.permission_cache_seconds, user.role, permissions)
+
+
+def _cached_permissions(user: User, db: Session) -> Optional[FrozenSet[str]]:
+    """
+    The user's effective permissions from the request cache, else the worker-wide cache
+    """
+    request_cache = _get_permission_cache(db)
+    cached = request_cache.get(user.id)
+    if cached is not None:
+        return cached
+    
+    entry = permission_cache.get(user.id)
+    if entry is None:
+        return None
+    expires_at, role, permissions = entry
+    if role != user.role or expires_at < time.monotonic():
+        return None
+    request_cache[user.id] = permissions
+    return permissions
+
+
+def invalidate_user_permissions(db: Session, user_id: int) -> None:
+    """
+    Drop a user's cached permissions after their role or custom permissions change
+    """
+    _get_permission_cache(db).pop(user_id, None)
+    permission_cache.pop(user_id, None)
+
 
-def get_user_permissions(user: User, db: Session) -> Set[str]:
+def get_user_permissions(user: User, db: Session) -> FrozenSet[str]:
     """
     Get all permissions for a user based on role and custom permissions
+    Results are cached for the request and, for a short TTL, across requests
     """
-    # Start with role-based permissions
-    permissions = set(ROLE_PERMISSIONS.get(user.role, set()))
+    cached = _cached_permissions(user, db)
+    if cached is not None:
+        return cached
     
-    # Apply custom permissions (overrides)
-    custom_perms = db.query(UserCustomPermission).filter(
-        UserCustomPermission.user_id == user.id
-    ).all()
+    # Start with role-based permissions
+    base_permissions = ROLE_PERMISSIONS.get(user.role, frozenset())
     
-    for custom_perm in custom_perms:
-        perm = db.query(Permission).filter(Permission.id == custom_perm.permission_id).first()
-        if perm:
-            if custom_perm.granted:
-                permissions.add(perm.name)
-            else:
-                permissions.discard(perm.name)
+    # Apply custom permissions (overrides) - single JOIN instead of one lookup per row
+    custom_perms = db.execute(_CUSTOM_PERMISSIONS_STMT, {"user_id": user.id}).all()
+
+    if not custom_perms:
+        # Common case: no overrides, share the role table without copying
+        _cache_permissions(user, base_permissions, db)
+        return base_permissions
+
+    permissions = set(base_permissions)
+    for name, granted in custom_perms:
+        if granted:
+            permissions.add(name)
+        else:
+            permissions.discard(name)
     
+    permissions = frozenset(permissions)
+    _cache_permissions(user, permissions, db)
     return permissions
 
 
-def has_permission(user: User, required_permission: str, db: Session) -> bool:
+def _has_revocations(user: User, permission_names: List[str], db: Session) -> bool:
     """
-    Check if user has a specific permission
+    Check whether any of the given permissions is explicitly revoked for the user
+    """
+    return db.execute(_REVOCATIONS_STMT, {"user_id": user.id, "names": list(permission_names)}).scalar()
+
+
+def _roles_granting(permission: str) -> FrozenSet[UserRole]:
+    """
+    Roles whose default permission set includes the given permission
+    """
+    bit = PERMISSION_BITS.get(permission, 0)
+    return frozenset(role for role, mask in ROLE_MASKS.items() if mask & bit)
+
+
+def _check_permission(user: User, permission: str, granting_roles: FrozenSet[UserRole], db: Session) -> bool:
+    """
+    Permission check with the granting roles precomputed by the caller
     """
     if not user.is_active:
         return False
     
-    user_permissions = get_user_permissions(user, db)
-    return required_permission in user_permissions
+    cached = _cached_permissions(user, db)
+    if cached is not None:
+        return permission in cached
+    
+    # Role grants it: only an explicit revocation can take it away
+    if user.role in granting_roles:
+        return not _has_revocations(user, [permission], db)
+    
+    return permission in get_user_permissions(user, db)
+
+
+def has_permission(user: User, required_permission: str, db: Session) -> bool:
+    """
+    Check if user has a specific permission
+    """
+    return _check_permission(user, required_permission, _roles_granting(required_permission), db)
 
 
 def has_any_permission(user: User, required_permissions: List[str], db: Session) -> bool:
@@ -112,6 +260,14 @@ def has_any_permission(user: User, required_permissions: List[str], db: Session)
     if not user.is_active:
         return False
     
+    # Fast path: role grants one of them and none of those are revoked
+    if _cached_permissions(user, db) is None:
+        role_mask = ROLE_MASKS.get(user.role, 0)
+        if role_mask & permission_mask(required_permissions):
+            granted_by_role = [perm for perm in required_permissions if role_mask & PERMISSION_BITS.get(perm, 0)]
+            if not _has_revocations(user, granted_by_role, db):
+                return True
+    
     user_permissions = get_user_permissions(user, db)
     return any(perm in user_permissions for perm in required_permissions)
 
@@ -123,11 +279,19 @@ def has_all_permissions(user: User, required_permissions: List[str], db: Session
     if not user.is_active:
         return False
     
+    # Fast path: role grants all of them and none are revoked
+    if _cached_permissions(user, db) is None:
+        required_mask = permission_mask(required_permissions)
+        known = all(perm in PERMISSION_BITS for perm in required_permissions)
+        role_grants_all = known and ROLE_MASKS.get(user.role, 0) & required_mask == required_mask
+        if role_grants_all and not _has_revocations(user, required_permissions, db):
+            return True
+    
     user_permissions = get_user_permissions(user, db)
     return all(perm in user_permissions for perm in required_permissions)
 
 
-def has_role(user: User, required_roles: List[UserRole]) -> bool:
+def has_role(user: User, required_roles: Collection[UserRole]) -> bool:
     """
     Check if user has one of the required roles
     """
@@ -146,6 +310,11 @@ def require_permission(permission: str):
         async def create_post(...):
             ...
     """
+    # Resolved once at decoration time; ROLE_PERMISSIONS is fixed at startup
+    _validate_permission(permission)
+    granting_roles = _roles_granting(permission)
+    denied_detail = f"Permission denied. Required: {permission}"
+    
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -159,10 +328,10 @@ def require_permission(permission: str):
                     detail="Missing authentication or database dependency"
                 )
             
-            if not has_permission(current_user, permission, db):
+            if not _check_permission(current_user, permission, granting_roles, db):
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Permission denied. Required: {permission}"
+                    detail=denied_detail
                 )
             
             return await func(*args, **kwargs)
@@ -179,6 +348,9 @@ def require_role(*roles: UserRole):
         async def create_user(...):
             ...
     """
+    allowed_roles = frozenset(roles)
+    denied_detail = f"Access denied. Required roles: {', '.join([r.value for r in roles])}"
+    
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -190,10 +362,10 @@ def require_role(*roles: UserRole):
                     detail="Missing authentication dependency"
                 )
             
-            if not has_role(current_user, list(roles)):
+            if not has_role(current_user, allowed_roles):
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Access denied. Required roles: {', '.join([r.value for r in roles])}"
+                    detail=denied_detail
                 )
             
             return await func(*args, **kwargs)
@@ -215,14 +387,16 @@ class PermissionChecker:
             ...
     """
     def __init__(self, permission: str):
+        _validate_permission(permission)
         self.permission = permission
+        self.granting_roles = _roles_granting(permission)
     
     def __call__(
         self,
         current_user: User = Depends(get_current_user),
         db: Session = Depends(get_db)
     ):
-        if not has_permission(current_user, self.permission, db):
+        if not _check_permission(current_user, self.permission, self.granting_roles, db):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Permission denied. Required: {self.permission}"
@@ -244,9 +418,10 @@ class RoleChecker:
     """
     def __init__(self, *roles: UserRole):
         self.roles = roles
+        self.allowed_roles = frozenset(roles)
     
     def __call__(self, current_user: User = Depends(get_current_user)):
-        if not has_role(current_user, list(self.roles)):
+        if not has_role(current_user, self.allowed_roles):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Access denied. Required roles: {', '.join([r.value for r in self.roles])}"
@@ -254,6 +429,16 @@ class RoleChecker:
         return None
 
 
+
+class AsyncRoleChecker(RoleChecker):
+    """
+    RoleChecker for routers on the async session (see get_async_db): resolves the
+    caller through get_current_principal_async, which the route shares
+    """
+    def __call__(self, current_user: Principal = Depends(get_current_principal_async)):
+        return super().__call__(current_user)
+
+
 # Helper to check if user owns a resource
 def check_ownership(user: User, resource_owner_id: int, permission: str = None):
     """
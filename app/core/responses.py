@@ -0,0 +1,15 @@
+from typing import Any, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def json_response(content: Any, adapter: Optional[TypeAdapter] = None) -> Response:
+    """
+    Serialize a response in one pydantic-core pass: a model via its own serializer, or a
+    list of models via `adapter` (a module-level TypeAdapter). Returning a Response skips
+    FastAPI re-validating the content and walking it with jsonable_encoder; the route's
+    response_model still documents the shape.
+    """
+    body = adapter.dump_json(content) if adapter is not None else content.model_dump_json()
+    return Response(content=body, media_type="application/json")
@@ -1,11 +1,15 @@
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from .config import settings
+from .database import get_async_db, get_db
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
@@ -38,30 +42,93 @@ def verify_token(token: str):
         return None
 
 
-def get_current_user(token: str = Depends(oauth2_scheme)):
-    """Get current authenticated user from JWT token"""
-    from .database import SessionLocal
-    from ..models.models import User
-    
-    credentials_exception = HTTPException(
+@dataclass(slots=True)
+class Principal:
+    """
+    Identity columns of the authenticated user, for endpoints that only need
+    to scope queries (id/college_id) or check access (role/is_active)
+    """
+    id: int
+    role: Any
+    is_active: bool
+    college_id: int
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
+
+
+def _username_from_token(token: str) -> str:
     payload = verify_token(token)
     if payload is None:
-        raise credentials_exception
+        raise _credentials_exception()
     
     username: str = payload.get("sub")
     if username is None:
-        raise credentials_exception
+        raise _credentials_exception()
+    return username
+
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+    """
+    Get current authenticated user from JWT token
+    Reuses the request's session (FastAPI caches get_db per request), so auth
+    doesn't check out a second pooled connection
+    """
+    from ..models.models import User
     
-    db = SessionLocal()
-    try:
-        user = db.query(User).filter(User.username == username).first()
-        if user is None:
-            raise credentials_exception
-        return user
-    finally:
-        db.close()
\ No newline at end of file
+    username = _username_from_token(token)
+    
+    user = db.query(User).filter(User.username == username).first()
+    if user is None:
+        raise _credentials_exception()
+    # Detach the loaded user so the handler's commits don't expire it (and reload it
+    # on the next attribute read), then end the auth transaction so the connection
+    # goes back to the pool instead of idling in transaction until the handler's next query
+    db.expunge(user)
+    db.commit()
+    return user
+
+
+def get_current_principal(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> Principal:
+    """
+    Like get_current_user, but selects only the identity columns instead of
+    hydrating the full User row
+    """
+    from ..models.models import User
+    
+    username = _username_from_token(token)
+    
+    row = db.execute(
+        select(User.id, User.role, User.is_active, User.college_id).where(User.username == username)
+    ).first()
+    if row is None:
+        raise _credentials_exception()
+    # End the auth transaction; see get_current_user
+    db.commit()
+    return Principal(*row)
+
+
+async def get_current_principal_async(
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    """
+    get_current_principal for routers on the async session: reuses the request's
+    AsyncSession, so auth doesn't check out a second (sync) connection
+    """
+    from ..models.models import User
+    
+    username = _username_from_token(token)
+    
+    row = (await db.execute(
+        select(User.id, User.role, User.is_active, User.college_id).where(User.username == username)
+    )).first()
+    if row is None:
+        raise _credentials_exception()
+    # End the auth transaction; see get_current_user
+    await db.commit()
+    return Principal(*row)
@@ -1,27 +1,67 @@
+from bisect import bisect_right
 from datetime import datetime
+from typing import List, Optional
 
+# Optional dependency for batch formatting
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
-def time_ago(created_at: datetime) -> str:
-    """Convert datetime to human readable time ago format."""
-    now = datetime.utcnow()
-    diff = now - created_at
-    
-    seconds = diff.total_seconds()
-    
-    if seconds < 60:
-        return "Just now"
-    elif seconds < 3600:  # Less than 1 hour
-        minutes = int(seconds // 60)
-        return f"{minutes} {'minute' if minutes == 1 else 'minutes'} ago"
-    elif seconds < 86400:  # Less than 1 day
-        hours = int(seconds // 3600)
-        return f"{hours} {'hour' if hours == 1 else 'hours'} ago"
-    elif seconds < 604800:  # Less than 1 week
-        days = int(seconds // 86400)
-        return f"{days} {'day' if days == 1 else 'days'} ago"
-    else:
-        weeks = int(seconds // 604800)
-        if weeks < 4:
-            return f"{weeks} {'week' if weeks == 1 else 'weeks'} ago"
+
+def _plural(count: int, unit: str) -> str:
+    return f"{count} {unit if count == 1 else unit + 's'} ago"
+
+
+# Upper bound (exclusive, in seconds) of each bucket and the formatter for it
+_THRESHOLDS = (60, 3600, 86400, 604800, 2419200)
+_FORMATTERS = (
+    lambda seconds, created_at: "Just now",
+    lambda seconds, created_at: _plural(int(seconds // 60), "minute"),
+    lambda seconds, created_at: _plural(int(seconds // 3600), "hour"),
+    lambda seconds, created_at: _plural(int(seconds // 86400), "day"),
+    lambda seconds, created_at: _plural(int(seconds // 604800), "week"),
+    lambda seconds, created_at: created_at.strftime("%B %d, %Y"),
+)
+# Unit name and seconds per unit for each bucket (first and last bucket have no count)
+_UNITS = (None, "minute", "hour", "day", "week", None)
+if NUMPY_AVAILABLE:
+    _THRESHOLD_ARRAY = np.array(_THRESHOLDS, dtype=np.float64)
+    _DIVISORS = np.array((1, 60, 3600, 86400, 604800, 1), dtype=np.float64)
+
+
+def time_ago(created_at: datetime, now: Optional[datetime] = None) -> str:
+    """
+    Convert datetime to human readable time ago format.
+    Pass `now` to share a single clock read across a batch of rows.
+    """
+    seconds = ((now or datetime.utcnow()) - created_at).total_seconds()
+    return _FORMATTERS[bisect_right(_THRESHOLDS, seconds)](seconds, created_at)
+
+
+def time_ago_batch(created_ats: List[datetime], now: Optional[datetime] = None) -> List[str]:
+    """
+    Vectorized time_ago for a page of rows: bucket lookup and unit division
+    happen as array ops, only the final string assembly is per row.
+    """
+    if not created_ats:
+        return []
+    now = now or datetime.utcnow()
+    if not NUMPY_AVAILABLE:
+        return [time_ago(created_at, now) for created_at in created_ats]
+
+    seconds = (np.datetime64(now, "us") - np.array(created_ats, dtype="datetime64[us]")) / np.timedelta64(1, "s")
+    buckets = np.digitize(seconds, _THRESHOLD_ARRAY)
+    counts = np.floor_divide(seconds, _DIVISORS[buckets]).astype(np.int64)
+
+    result = []
+    for bucket, count, created_at in zip(buckets.tolist(), counts.tolist(), created_ats):
+        unit = _UNITS[bucket]
+        if unit is not None:
+            result.append(_plural(count, unit))
+        elif bucket == 0:
+            result.append("Just now")
         else:
-            return created_at.strftime("%B %d, %Y")
\ No newline at end of file
+            result.append(created_at.strftime("%B %d, %Y"))
+    return result
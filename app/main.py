@@ -1,17 +1,48 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-from .core.database import engine
+from .core.config import settings
+from .core.database import async_engine, engine
 from .models.models import Base
+from .models.schemas import build_schemas
 from .routers import auth, users, posts, rewards, files, ai, alerts, news, store, admin, engagement, pool
+from .services.background import run_periodically
+from .services.leaderboard import refresh_leaderboard
+from .services.post_counters import refresh_post_counters
+
+# Create database tables only when explicitly requested (RUN_DDL_ON_STARTUP=1);
+# otherwise every worker boot would re-inspect the whole schema
+if settings.run_ddl_on_startup:
+    Base.metadata.create_all(bind=engine)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schemas are deferred at import; build them before serving so no request pays for it
+    await asyncio.to_thread(build_schemas)
+    jobs = [
+        # Like/ignite counters are reconciled in the background instead of per click
+        asyncio.create_task(run_periodically(refresh_post_counters, settings.post_counter_refresh_seconds)),
+        asyncio.create_task(run_periodically(refresh_leaderboard, settings.leaderboard_refresh_seconds)),
+    ]
+    yield
+    for job in jobs:
+        job.cancel()
+    await async_engine.dispose()
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
     title="College Community API",
     description="A multi-tenant SaaS college community application",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # Routes that return dicts or models are encoded with orjson; list endpoints
+    # already hand back bytes via core.responses.json_response
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
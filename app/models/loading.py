@@ -0,0 +1,27 @@
+"""
+Loader options for list endpoints.
+
+Each list query declares exactly the relationships it renders and raises on
+anything else, so a stray attribute access in a response builder fails loudly
+instead of quietly issuing one query per row.
+"""
+
+from sqlalchemy.orm import selectinload, raiseload
+
+from .models import Post, Order, Alert, File, Product
+
+# Relationships each model's list endpoints render. Post, Alert and Product lists
+# join the author/creator columns into the row, so they eager-load nothing and the
+# wildcard also switches off the mapper-level selectin defaults for them.
+EAGER = {
+    Post: [],
+    Alert: [],
+    Product: [],
+    Order: [selectinload(Order.items).raiseload("*")],
+    File: [selectinload(File.uploader).raiseload("*"), selectinload(File.college).raiseload("*")],
+}
+
+
+def eager(model) -> list:
+    """Options for a list query over `model`: its declared eager loads, raiseload for the rest"""
+    return [*EAGER[model], raiseload("*")]
@@ -1,18 +1,80 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Enum, JSON, Numeric, Boolean
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
-from datetime import datetime
+from sqlalchemy import Column, Integer, BigInteger, SmallInteger, String, DateTime, ForeignKey, Text, Enum, Numeric, Boolean, Index, UniqueConstraint, Computed, Identity, Sequence, FetchedValue, DDL, MetaData, Table, event
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.orm import DeclarativeBase, relationship, deferred
+from sqlalchemy.ext.asyncio import AsyncAttrs
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.sql import func, text
 import enum
 
-Base = declarative_base()
+class Base(AsyncAttrs, DeclarativeBase):
+    """AsyncAttrs adds `obj.awaitable_attrs.<relationship>` for use with AsyncSession"""
 
+# Timestamps are filled in by PostgreSQL as naive UTC, matching the DateTime columns
+utc_now = func.timezone('utc', func.now())
 
+
+class TimestampMixin:
+    """
+    created_at/updated_at for mutable rows. Models that index or partition on created_at,
+    or are append-only, declare their own column instead.
+    """
+    created_at = Column(DateTime, server_default=utc_now)
+    updated_at = Column(DateTime, server_default=utc_now, onupdate=utc_now)
+
+
+def string_enum(enum_class, constraint_name):
+    """
+    VARCHAR + CHECK constraint instead of a PostgreSQL ENUM type; Python code
+    still reads and writes the enum members
+    """
+    return Enum(enum_class, native_enum=False, create_constraint=True, length=50, name=constraint_name)
+
+
+class CodedString(TypeDecorator):
+    """
+    Stores one of a small fixed set of values (strings or enum members) as a
+    SMALLINT code (its position in `values`); Python code still reads and writes
+    the values themselves. Enum members can also be bound by their string value.
+    `values` and `name` (the column, for error messages) make up the statement cache key.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, values: tuple, name: str):
+        super().__init__()
+        self.values = tuple(values)
+        self.name = name
+        self.codes = {value: code for code, value in enumerate(self.values)}
+        self.codes.update(
+            (value.value, code) for code, value in enumerate(self.values) if isinstance(value, enum.Enum)
+        )
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        try:
+            return self.codes[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid value for {self.name}") from None
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else self.values[value]
+
+
+# Codes are positional - only ever append to these
+INDEXING_STATES = ("pending", "indexed", "failed")
+TASK_STATES = ("pending", "processing", "completed", "failed")
+
+
+# Stored as CodedString positions - only ever append members
 class UserRole(enum.Enum):
     ADMIN = "admin"
     STAFF = "staff"
     STUDENT = "student"
 
 
+# Stored as CodedString positions - only ever append members
 class RewardType(enum.Enum):
     HELPFUL_POST = "HELPFUL_POST"
     ACADEMIC_EXCELLENCE = "ACADEMIC_EXCELLENCE"
@@ -27,51 +89,69 @@ class RewardType(enum.Enum):
 class College(Base):
     __tablename__ = "colleges"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(255), nullable=False)
     slug = Column(String(100), unique=True, nullable=False, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now)
 
-    users = relationship("User", back_populates="college")
-    posts = relationship("Post", back_populates="college")
+    # Collections are raise_on_sql: load them explicitly (selectinload / awaitable_attrs)
+    users = relationship("User", back_populates="college", lazy="raise_on_sql")
+    posts = relationship("Post", back_populates="college", lazy="raise_on_sql")
 
 
-class User(Base):
+class User(TimestampMixin, Base):
     __tablename__ = "users"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     username = Column(String(100), unique=True, nullable=False, index=True)
     email = Column(String(255), unique=True, nullable=False, index=True)
-    hashed_password = Column(String(255), nullable=False)
+    # Only login and change-password read the hash; keep it out of every other SELECT on users
+    hashed_password = deferred(Column(String(255), nullable=False))
     full_name = Column(String(255), nullable=False)
     department = Column(String(100), nullable=False)
     class_name = Column(String(50), nullable=False)
     academic_year = Column(String(20), nullable=False)
-    college_id = Column(Integer, ForeignKey("colleges.id"), nullable=False)
+    # Deferred to COMMIT (as are the posts/rewards user and college FKs) so bulk imports can
+    # COPY colleges, users, posts and rewards in any order within one transaction
+    college_id = Column(Integer, ForeignKey("colleges.id", deferrable=True, initially="DEFERRED"), nullable=False)
     
     # RBAC fields
-    role = Column(Enum(UserRole, values_callable=lambda obj: [e.value for e in obj]), 
-                  default=UserRole.STUDENT, nullable=False, index=True)
-    is_active = Column(Boolean, default=True, nullable=False, index=True)
-    
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # SMALLINT code: 0 = admin, 1 = staff, 2 = student (UserRole declaration order)
+    role = Column(CodedString(tuple(UserRole), "users.role"), default=UserRole.STUDENT, server_default=text("2"),
+                  nullable=False, index=True)
+    is_active = Column(Boolean, default=True, nullable=False)
 
     college = relationship("College", back_populates="users")
-    posts = relationship("Post", back_populates="author")
+    # passive_deletes: the user's rows go with it through ON DELETE CASCADE, so deleting
+    # a user never loads these collections
+    posts = relationship("Post", back_populates="author", lazy="raise_on_sql", passive_deletes=True)
     
     # Reward relationships
-    given_rewards = relationship("Reward", foreign_keys="Reward.giver_id", back_populates="giver")
-    received_rewards = relationship("Reward", foreign_keys="Reward.receiver_id", back_populates="receiver")
-    reward_points = relationship("RewardPoint", back_populates="user")
+    # Never rendered through the ORM; reward listings query with explicit joins
+    given_rewards = relationship("Reward", foreign_keys="Reward.giver_id", back_populates="giver", lazy="raise",
+                                 passive_deletes=True)
+    received_rewards = relationship("Reward", foreign_keys="Reward.receiver_id", back_populates="receiver", lazy="raise",
+                                    passive_deletes=True)
+    reward_points = relationship("RewardPoint", back_populates="user", lazy="raise_on_sql", passive_deletes=True)
     
     # Store relationships
-    cart = relationship("Cart", back_populates="user", uselist=False)
-    orders = relationship("Order", back_populates="user")
-    point_transactions = relationship("PointTransaction", back_populates="user")
-    wishlist_items = relationship("WishlistItem", back_populates="user")
+    cart = relationship("Cart", back_populates="user", uselist=False, passive_deletes=True)
+    orders = relationship("Order", back_populates="user", lazy="raise_on_sql", passive_deletes=True)
+    point_transactions = relationship("PointTransaction", back_populates="user", lazy="raise_on_sql",
+                                      passive_deletes=True)
+    wishlist_items = relationship("WishlistItem", back_populates="user", lazy="raise_on_sql", passive_deletes=True)
+
+    __table_args__ = (
+        # Directory and admin user lists scope by college and include deactivated accounts,
+        # so this one stays a full index
+        Index("ix_users_college", college_id),
+        # One admin per college
+        Index("idx_one_admin_per_college", college_id, unique=True,
+              postgresql_where=text("role = 0")),  # admin
+    )
 
 
+# Stored as CodedString positions - only ever append members
 class PostType(enum.Enum):
     ANNOUNCEMENT = "ANNOUNCEMENT"
     INFO = "INFO"
@@ -83,62 +163,113 @@ class PostType(enum.Enum):
 class Post(Base):
     __tablename__ = "posts"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     title = Column(String(255), nullable=False)
     content = Column(Text, nullable=False)
     image_url = Column(String(500), nullable=True)  # New field for image URL
-    post_type = Column(Enum(PostType), default=PostType.GENERAL, nullable=False)
-    post_metadata = Column(JSON, default=lambda: {"likes": 0, "comments": 0, "shares": 0}, nullable=False)  # Renamed from metadata
+    post_type = Column(CodedString(tuple(PostType), "posts.post_type"), default=PostType.GENERAL, server_default=text("4"), nullable=False)
+    post_metadata = Column(JSONB, server_default=text("'{}'::jsonb"), nullable=False)  # Renamed from metadata
     
     # Denormalized counters for performance
     like_count = Column(Integer, default=0, nullable=False)
     comment_count = Column(Integer, default=0, nullable=False)
     ignite_count = Column(Integer, default=0, nullable=False)
+    share_count = Column(Integer, server_default=text("0"), nullable=False)
     
-    author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    college_id = Column(Integer, ForeignKey("colleges.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    author_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE", deferrable=True, initially="DEFERRED"), nullable=False)
+    college_id = Column(Integer, ForeignKey("colleges.id", deferrable=True, initially="DEFERRED"), nullable=False)
+    created_at = Column(DateTime, server_default=utc_now)
+    updated_at = Column(DateTime, server_default=utc_now, onupdate=utc_now)
+    
+    # Maintained by PostgreSQL; only searches read it, so feed queries don't load it
+    search_tsv = deferred(Column(TSVECTOR, Computed(
+        "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(content, ''))", persisted=True
+    )))
+
+    author = relationship("User", back_populates="posts", lazy="selectin")
+    college = relationship("College", back_populates="posts", lazy="selectin")
+    # The FKs are ON DELETE CASCADE, so deleting a post doesn't need to load these first
+    likes = relationship("PostLike", back_populates="post", cascade="all, delete-orphan", passive_deletes=True,
+                         lazy="raise_on_sql")
+    comments = relationship("PostComment", back_populates="post", cascade="all, delete-orphan", passive_deletes=True,
+                            lazy="raise_on_sql")
+    ignites = relationship("PostIgnite", back_populates="post", cascade="all, delete-orphan", passive_deletes=True,
+                           lazy="raise_on_sql")
 
-    author = relationship("User", back_populates="posts")
-    college = relationship("College", back_populates="posts")
-    likes = relationship("PostLike", back_populates="post", cascade="all, delete-orphan")
-    comments = relationship("PostComment", back_populates="post", cascade="all, delete-orphan")
-    ignites = relationship("PostIgnite", back_populates="post", cascade="all, delete-orphan")
+    __table_args__ = (
+        # College feed: WHERE college_id = ? ORDER BY created_at DESC
+        Index("idx_posts_feed_optimization", college_id, created_at.desc()),
+        # Full-text search: search_tsv @@ plainto_tsquery('english', :q)
+        Index("ix_posts_search", search_tsv, postgresql_using="gin"),
+    )
+    # INSERT/UPDATE ... RETURNING brings back created_at, updated_at, post_metadata and the
+    # other server-side values, so a flushed post can be rendered without a refresh SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
 
-class RewardPoint(Base):
+class RewardPoint(TimestampMixin, Base):
     __tablename__ = "reward_points"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     total_points = Column(Integer, default=0, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     user = relationship("User", back_populates="reward_points")
 
+    __table_args__ = (
+        # One balance row per user; balance changes upsert against it
+        UniqueConstraint("user_id", name="uq_reward_points_user"),
+    )
+
+
+class LeaderboardEntry(Base):
+    """
+    Read-only row of the mv_college_leaderboard materialized view: a college's users ranked by
+    reward points, refreshed by services/leaderboard.py. The Table sits in its own MetaData
+    so create_all never creates it as a table; the view itself is created by the DDL below.
+    """
+    __table__ = Table(
+        "mv_college_leaderboard", MetaData(),
+        Column("user_id", Integer, primary_key=True),
+        Column("college_id", Integer, nullable=False),
+        Column("rank", BigInteger, nullable=False),
+        Column("total_points", Integer, nullable=False),
+        Column("full_name", String(255), nullable=False),
+        Column("department", String(100), nullable=False),
+    )
+
 
 class Reward(Base):
     __tablename__ = "rewards"
 
-    id = Column(Integer, primary_key=True, index=True)
-    giver_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    receiver_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    giver_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE", deferrable=True, initially="DEFERRED"), nullable=False)
+    receiver_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE", deferrable=True, initially="DEFERRED"), nullable=False)
     points = Column(Integer, nullable=False)
-    reward_type = Column(Enum(RewardType), nullable=False)
+    reward_type = Column(CodedString(tuple(RewardType), "rewards.reward_type"), nullable=False)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
-    post_id = Column(Integer, ForeignKey("posts.id"), nullable=True)  # Optional: link to specific post
-    college_id = Column(Integer, ForeignKey("colleges.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="SET NULL"), nullable=True)  # Optional: link to specific post
+    college_id = Column(Integer, ForeignKey("colleges.id", deferrable=True, initially="DEFERRED"), nullable=False)
+    created_at = Column(DateTime, server_default=utc_now)
 
     giver = relationship("User", foreign_keys=[giver_id], back_populates="given_rewards")
     receiver = relationship("User", foreign_keys=[receiver_id], back_populates="received_rewards")
-    post = relationship("Post")
+    post = relationship("Post", lazy="raise")
     college = relationship("College")
 
+    __table_args__ = (
+        # Per-user history and the college-wide feed, newest first
+        Index("ix_rewards_giver_created", giver_id, created_at.desc()),
+        Index("ix_rewards_receiver_created", receiver_id, created_at.desc()),
+        Index("ix_rewards_college_created", college_id, created_at.desc()),
+        # Append-only: date-range scans via BRIN instead of a full B-tree
+        Index("brin_rewards_created", created_at, postgresql_using="brin",
+              postgresql_with={"pages_per_range": 32}),
+    )
 
+
+# Stored as CodedString positions - only ever append members
 class FileType(enum.Enum):
     DOCUMENT = "DOCUMENT"  # PDF, DOC, DOCX
     PRESENTATION = "PRESENTATION"  # PPT, PPTX
@@ -154,73 +285,140 @@ class FileType(enum.Enum):
 class File(Base):
     __tablename__ = "files"
 
-    id = Column(Integer, primary_key=True, index=True)
-    filename = Column(String(255), nullable=False)
-    original_filename = Column(String(255), nullable=False)
-    file_path = Column(String(500), nullable=False)
+    # Columns are declared widest-alignment first (8-byte, 4-byte, 2/1-byte, then
+    # variable length) so CREATE TABLE lays rows out without alignment padding
+    id = Column(Integer, primary_key=True)
     file_size = Column(Integer, nullable=False)  # Size in bytes
-    file_type = Column(Enum(FileType), nullable=False)
-    mime_type = Column(String(100), nullable=False)
-    description = Column(Text, nullable=True)
     
-    # Folder support
-    folder_path = Column(String(1000), default="/", nullable=False, index=True)  # Virtual folder path
-    is_folder = Column(Boolean, default=False, nullable=False)  # True if this is a folder entry
-    parent_folder_id = Column(Integer, ForeignKey("files.id"), nullable=True)  # For hierarchical structure
+    # Timestamps
+    created_at = Column(DateTime, server_default=utc_now, index=True)
+    updated_at = Column(DateTime, server_default=utc_now, onupdate=utc_now)
     
-    # Categorization
-    department = Column(String(100), nullable=False, index=True)
-    college_id = Column(Integer, ForeignKey("colleges.id"), nullable=False, index=True)
+    # Ownership
+    college_id = Column(Integer, ForeignKey("colleges.id"), nullable=False)
+    uploaded_by = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     
-    # Upload metadata
-    uploaded_by = Column(Integer, ForeignKey("users.id"), nullable=False)
-    upload_metadata = Column(JSON, default=lambda: {"downloads": 0, "views": 0}, nullable=False)
+    # Counters live in their own columns so a view/download is an in-place integer bump
+    view_count = Column(Integer, server_default=text("0"), nullable=False)
+    download_count = Column(Integer, server_default=text("0"), nullable=False)
     
     # AI indexing
-    is_indexed = Column(String(20), default="pending", nullable=False)  # pending, indexed, failed
+    is_indexed = Column(CodedString(INDEXING_STATES, "files.is_indexed"), default="pending", server_default=text("0"), nullable=False)
     
-    # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    filename = Column(String(255), nullable=False)
+    original_filename = Column(String(255), nullable=False)
+    file_path = Column(Text, nullable=False)
+    file_type = Column(CodedString(tuple(FileType), "files.file_type"), nullable=False)
+    mime_type = Column(String(100), nullable=False)
+    folder_path = Column(Text, default="/", nullable=False)  # Virtual folder path
+    department = Column(String(100), nullable=False)
+    description = Column(Text, nullable=True)
+    upload_metadata = Column(JSONB, server_default=text("'{}'::jsonb"), nullable=False)
+    
+    # Maintained by PostgreSQL; only the file search reads it
+    search_tsv = deferred(Column(TSVECTOR, Computed(
+        "to_tsvector('english', coalesce(original_filename, '') || ' ' || coalesce(description, ''))", persisted=True
+    )))
 
     # Relationships
     college = relationship("College")
     uploader = relationship("User")
-    parent_folder = relationship("File", remote_side=[id], foreign_keys=[parent_folder_id])
+
+    __table_args__ = (
+        # Subtree scans are `folder_path LIKE '/a/b%'`; pattern_ops lets the B-tree serve
+        # the prefix match (the default collation can't), and still covers equality
+        Index("ix_files_college_folder_path", college_id, folder_path,
+              postgresql_ops={"folder_path": "text_pattern_ops"}),
+        # Department browsing: WHERE college_id = ? AND department = ? [AND folder_path = ?]
+        Index("ix_files_college_department_folder", college_id, department, folder_path),
+        Index("ix_files_search", search_tsv, postgresql_using="gin"),
+    )
+    # Same as Post: server-side values come back with the INSERT/UPDATE itself
+    __mapper_args__ = {"eager_defaults": True}
+
+
+class Folder(TimestampMixin, Base):
+    """
+    A virtual directory. Files point at their folder through `File.folder_path`, so
+    listing a folder's files never touches this table and folder lookups never scan files.
+    """
+    __tablename__ = "folders"
+
+    id = Column(Integer, primary_key=True)
+    parent_id = Column(Integer, ForeignKey("folders.id", ondelete="CASCADE"), nullable=True)  # None at the root
+    college_id = Column(Integer, ForeignKey("colleges.id"), nullable=False)
+    # Folders are shared with the college, so they outlive their creator
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    name = Column(String(255), nullable=False)
+    path = Column(Text, nullable=False)  # Full virtual path, e.g. /notes/semester-1
+    department = Column(String(100), nullable=False)
+    description = Column(Text, nullable=True)
+
+    # Relationships
+    college = relationship("College")
+    creator = relationship("User")
+    parent = relationship("Folder", remote_side=[id])
+
+    __table_args__ = (
+        Index("ix_folders_parent", parent_id),
+        # Same prefix-scan shape as ix_files_college_folder_path
+        Index("ix_folders_college_path", college_id, path,
+              postgresql_ops={"path": "text_pattern_ops"}),
+    )
 
 
 class AIConversation(Base):
     __tablename__ = "ai_conversations"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # BIGSERIAL rather than IDENTITY: before PostgreSQL 17 partitioned tables can't have identity columns
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     college_id = Column(Integer, ForeignKey("colleges.id"), nullable=False)
     query = Column(Text, nullable=False)
     response = Column(Text, nullable=False)
-    context_docs = Column(JSON, nullable=True)  # Store referenced documents
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    # Store referenced documents; listings only need the count below
+    context_docs = deferred(Column(JSONB, nullable=True))
+    # GENERATED ALWAYS in PostgreSQL, set once when the conversation is stored
+    sources_count = Column(Integer, Computed("coalesce(jsonb_array_length(context_docs), 0)", persisted=True))
+    # Partition key, so it has to be part of the primary key
+    created_at = Column(DateTime, primary_key=True, server_default=utc_now)
 
     # Relationships
     user = relationship("User")
     college = relationship("College")
 
+    __table_args__ = (
+        Index("ix_ai_conversations_user_created", user_id, created_at.desc()),
+        Index("brin_ai_conversations_created", created_at, postgresql_using="brin",
+              postgresql_with={"pages_per_range": 32}),
+        # Monthly partitions; see create_monthly_partitions below
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
 
 class IndexingTask(Base):
     __tablename__ = "indexing_tasks"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     content_type = Column(String(50), nullable=False)  # file, post, college_info
     content_id = Column(Integer, nullable=False)
     college_id = Column(Integer, ForeignKey("colleges.id"), nullable=False)
-    status = Column(String(20), default="pending", nullable=False)  # pending, processing, completed, failed
+    status = Column(CodedString(TASK_STATES, "indexing_tasks.status"), default="pending", server_default=text("0"), nullable=False)
     error_message = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime, server_default=utc_now, index=True)
     processed_at = Column(DateTime, nullable=True)
 
     # Relationships
     college = relationship("College")
 
+    __table_args__ = (
+        # Indexing workers look up the pending task for a piece of content
+        Index("ix_indexing_tasks_pending", content_type, content_id,
+              postgresql_where=text("status = 0")),  # pending
+    )
+
 
+# Stored as CodedString positions - only ever append members
 class AlertType(enum.Enum):
     EVENT_NOTIFICATION = "EVENT_NOTIFICATION"
     FEE_REMINDER = "FEE_REMINDER"
@@ -234,29 +432,39 @@ class AlertType(enum.Enum):
 class Alert(Base):
     __tablename__ = "alerts"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
-    title = Column(String(255), nullable=False)
-    message = Column(Text, nullable=False)
-    alert_type = Column(Enum(AlertType), default=AlertType.GENERAL, nullable=False)
-    is_enabled = Column(Boolean, default=True, nullable=False)  # True=enabled, False=disabled
-    is_read = Column(Boolean, default=False, nullable=False)  # True=read, False=unread
+    # Declared widest-alignment first, like File, so rows carry no alignment padding
+    id = Column(BigInteger, Identity(), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    created_at = Column(DateTime, server_default=utc_now)
+    updated_at = Column(DateTime, server_default=utc_now, onupdate=utc_now)
     expires_at = Column(DateTime, nullable=True)  # Optional expiry date
-    post_id = Column(Integer, ForeignKey("posts.id"), nullable=True)  # Optional link to post
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="SET NULL"), nullable=True)  # Optional link to post
     college_id = Column(Integer, ForeignKey("colleges.id"), nullable=False)
-    created_by = Column(Integer, ForeignKey("users.id"), nullable=False)  # Who created the alert
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)  # Who created the alert
+    is_enabled = Column(Boolean, default=True, nullable=False)  # True=enabled, False=disabled
+    is_read = Column(Boolean, default=False, nullable=False)  # True=read, False=unread
+    alert_type = Column(CodedString(tuple(AlertType), "alerts.alert_type"), default=AlertType.GENERAL, server_default=text("6"), nullable=False)
+    title = Column(String(255), nullable=False)
+    message = Column(Text, nullable=False)
 
     # Relationships
     user = relationship("User", foreign_keys=[user_id])
     creator = relationship("User", foreign_keys=[created_by])
-    post = relationship("Post")
+    post = relationship("Post", lazy="selectin")
     college = relationship("College")
 
+    __table_args__ = (
+        # Alert list / unread count: equality on user_id (+ is_read), newest first
+        Index("ix_alerts_user_isread_created", user_id, is_read, created_at.desc()),
+        # Unread badge: only the small unread+enabled subset is indexed
+        Index("ix_alerts_unread", user_id, created_at,
+              postgresql_where=text("is_read = false AND is_enabled = true")),
+    )
+
 
 # ==================== REWARDS STORE MODELS ====================
 
+# Stored as CodedString positions - only ever append members
 class ProductCategory(enum.Enum):
     ELECTRONICS = "ELECTRONICS"
     BOOKS = "BOOKS"
@@ -278,29 +486,39 @@ class ProductStatus(enum.Enum):
 class Product(Base):
     __tablename__ = "products"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
-    category = Column(Enum(ProductCategory), nullable=False)
+    category = Column(CodedString(tuple(ProductCategory), "products.category"), nullable=False)
     points_required = Column(Integer, nullable=False)  # Points needed to redeem
     original_price = Column(Numeric(10, 2), nullable=True)  # Original price for reference
     stock_quantity = Column(Integer, default=0, nullable=False)
     max_quantity_per_user = Column(Integer, default=1, nullable=False)  # Max per user per order
-    status = Column(Enum(ProductStatus), default=ProductStatus.ACTIVE, nullable=False)
+    status = Column(string_enum(ProductStatus, "ck_products_status"), default=ProductStatus.ACTIVE, nullable=False)
     image_url = Column(String(500), nullable=True)
     brand = Column(String(100), nullable=True)
-    specifications = Column(JSON, nullable=True)  # JSON field for product specs
+    specifications = Column(JSONB, nullable=True)  # JSON field for product specs
     college_id = Column(Integer, ForeignKey("colleges.id"), nullable=False)
-    created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # Kept (unlinked) when the creator is deleted: order items still reference the product
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime, server_default=utc_now, index=True)
+    updated_at = Column(DateTime, server_default=utc_now, onupdate=utc_now)
 
     # Relationships
     college = relationship("College")
     creator = relationship("User", foreign_keys=[created_by])
-    cart_items = relationship("CartItem", back_populates="product")
-    order_items = relationship("OrderItem", back_populates="product")
-    wishlists = relationship("WishlistItem", back_populates="product")
+    cart_items = relationship("CartItem", back_populates="product", lazy="raise_on_sql")
+    order_items = relationship("OrderItem", back_populates="product", lazy="raise_on_sql")
+    wishlists = relationship("WishlistItem", back_populates="product", lazy="raise_on_sql")
+
+    __table_args__ = (
+        # Catalog queries only ever show ACTIVE products: WHERE college_id = ? [AND category = ?]
+        Index("ix_products_active", college_id, category,
+              postgresql_where=text("status = 'ACTIVE'")),
+        # Containment (@>) lookups on specs; jsonb_path_ops keeps the index small
+        Index("ix_products_specs_gin", specifications, postgresql_using="gin",
+              postgresql_ops={"specifications": "jsonb_path_ops"}),
+    )
 
 
 class OrderStatus(enum.Enum):
@@ -313,110 +531,143 @@ class OrderStatus(enum.Enum):
     REFUNDED = "REFUNDED"
 
 
+# Order numbers come from PostgreSQL, so an order INSERT doesn't need to supply one.
+# Sequential numbers also keep inserts into the unique index on its right edge.
+order_number_seq = Sequence("order_number_seq", metadata=Base.metadata)
+
+
 class Order(Base):
     __tablename__ = "orders"
 
-    id = Column(Integer, primary_key=True, index=True)
-    order_number = Column(String(50), unique=True, nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    order_number = Column(String(50), server_default=text(
+        "'ORD-' || to_char(nextval('order_number_seq'), 'FM0000000000')"
+    ), unique=True, nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     total_points = Column(Integer, nullable=False)
     total_items = Column(Integer, nullable=False)
-    status = Column(Enum(OrderStatus), default=OrderStatus.PENDING, nullable=False)
+    status = Column(string_enum(OrderStatus, "ck_orders_status"), default=OrderStatus.PENDING, nullable=False)
     notes = Column(Text, nullable=True)  # Admin notes or special instructions
     pickup_location = Column(String(255), nullable=True)  # Where to pickup items
     estimated_pickup_date = Column(DateTime, nullable=True)
     college_id = Column(Integer, ForeignKey("colleges.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now)
+    updated_at = Column(DateTime, server_default=utc_now, onupdate=utc_now)
 
     # Relationships
     user = relationship("User", back_populates="orders")
     college = relationship("College")
-    items = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan")
+    # Orders are always rendered with their items: one IN query per page of orders
+    items = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan",
+                         lazy="selectin", passive_deletes=True)
+
+    __table_args__ = (
+        Index("idx_orders_user_created", user_id, created_at.desc()),
+        # Points held by in-flight orders (balance summary)
+        Index("ix_orders_active", user_id,
+              postgresql_where=text("status IN ('PENDING', 'CONFIRMED', 'PROCESSING')")),
+    )
 
 
 class OrderItem(Base):
     __tablename__ = "order_items"
 
-    id = Column(Integer, primary_key=True, index=True)
-    order_id = Column(Integer, ForeignKey("orders.id"), nullable=False)
+    id = Column(BigInteger, Identity(), primary_key=True)
+    order_id = Column(Integer, ForeignKey("orders.id", ondelete="CASCADE"), nullable=False, index=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
     quantity = Column(Integer, nullable=False)
     points_per_item = Column(Integer, nullable=False)  # Points at time of order
     total_points = Column(Integer, nullable=False)  # quantity * points_per_item
     product_name = Column(String(255), nullable=False)  # Store product name at time of order
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now)
 
     # Relationships
     order = relationship("Order", back_populates="items")
-    product = relationship("Product", back_populates="order_items")
+    product = relationship("Product", back_populates="order_items", lazy="selectin")
 
 
-class Cart(Base):
+class Cart(TimestampMixin, Base):
     __tablename__ = "carts"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     college_id = Column(Integer, ForeignKey("colleges.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     user = relationship("User", back_populates="cart")
     college = relationship("College")
-    items = relationship("CartItem", back_populates="cart", cascade="all, delete-orphan")
+    items = relationship("CartItem", back_populates="cart", cascade="all, delete-orphan", passive_deletes=True,
+                         lazy="selectin")
 
 
 class CartItem(Base):
     __tablename__ = "cart_items"
 
-    id = Column(Integer, primary_key=True, index=True)
-    cart_id = Column(Integer, ForeignKey("carts.id"), nullable=False)
+    id = Column(Integer, primary_key=True)
+    cart_id = Column(Integer, ForeignKey("carts.id", ondelete="CASCADE"), nullable=False)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
     quantity = Column(Integer, nullable=False)
-    added_at = Column(DateTime, default=datetime.utcnow)
+    added_at = Column(DateTime, server_default=utc_now)
 
     # Relationships
     cart = relationship("Cart", back_populates="items")
-    product = relationship("Product", back_populates="cart_items")
+    product = relationship("Product", back_populates="cart_items", lazy="selectin")
+
+    __table_args__ = (
+        # One row per product per cart; the index also serves "all items in this cart"
+        UniqueConstraint("cart_id", "product_id", name="uq_cart_items_cart_product"),
+    )
 
 
 class PointTransaction(Base):
     __tablename__ = "point_transactions"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    # BIGSERIAL for the same reason as AIConversation.id
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     transaction_type = Column(String(50), nullable=False)  # "EARNED", "SPENT", "REFUNDED"
     points = Column(Integer, nullable=False)  # Positive for earned, negative for spent
-    balance_after = Column(Integer, nullable=False)  # Balance after this transaction
+    # Filled in by the trg_point_transactions_balance trigger, which also applies `points`
+    # to reward_points; the ORM reads it back through INSERT ... RETURNING
+    balance_after = Column(Integer, server_default=FetchedValue(), nullable=False)
     description = Column(String(500), nullable=False)
     reference_type = Column(String(50), nullable=True)  # "order", "reward", "manual"
     reference_id = Column(Integer, nullable=True)  # Order ID, Reward ID, etc.
     college_id = Column(Integer, ForeignKey("colleges.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    # Partition key, so it has to be part of the primary key
+    created_at = Column(DateTime, primary_key=True, server_default=utc_now)
 
     # Relationships
-    user = relationship("User", back_populates="point_transactions")
+    user = relationship("User", back_populates="point_transactions", lazy="selectin")
     college = relationship("College")
 
+    __table_args__ = (
+        Index("idx_point_transactions_user_created", user_id, created_at.desc()),
+        # Append-only ledger: date-range scans via BRIN instead of a full B-tree
+        Index("brin_point_transactions_created", created_at, postgresql_using="brin",
+              postgresql_with={"pages_per_range": 32}),
+        # Monthly partitions; see create_monthly_partitions below
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
 
 class WishlistItem(Base):
     __tablename__ = "wishlist_items"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
     college_id = Column(Integer, ForeignKey("colleges.id"), nullable=False)
-    added_at = Column(DateTime, default=datetime.utcnow)
+    added_at = Column(DateTime, server_default=utc_now)
 
     # Relationships
     user = relationship("User", back_populates="wishlist_items")
-    product = relationship("Product", back_populates="wishlists")
+    product = relationship("Product", back_populates="wishlists", lazy="selectin")
     college = relationship("College")
 
-    # Ensure unique combination of user and product
+    # Ensure unique combination of user and product (its index also serves user_id lookups)
     __table_args__ = (
-        {"extend_existing": True},
+        UniqueConstraint("user_id", "product_id", name="uq_wishlist_user_product"),
     )
 
 
@@ -425,52 +676,54 @@ class WishlistItem(Base):
 class Permission(Base):
     __tablename__ = "permissions"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     name = Column(String(100), unique=True, nullable=False)  # e.g., 'read:posts'
     resource = Column(String(50), nullable=False, index=True)  # e.g., 'posts', 'files'
     action = Column(String(50), nullable=False)  # e.g., 'read', 'write', 'delete'
     description = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now)
 
 
 class RolePermission(Base):
     __tablename__ = "role_permissions"
 
-    id = Column(Integer, primary_key=True, index=True)
-    role = Column(Enum(UserRole, values_callable=lambda obj: [e.value for e in obj]), 
-                  nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    role = Column(CodedString(tuple(UserRole), "role_permissions.role"), nullable=False, index=True)
     permission_id = Column(Integer, ForeignKey("permissions.id"), nullable=False)
     college_id = Column(Integer, ForeignKey("colleges.id"), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now)
 
     # Relationships
     permission = relationship("Permission")
     college = relationship("College")
 
-    # Ensure unique combination
+    # Ensure unique combination (named as the rbac migration's inline UNIQUE created it)
     __table_args__ = (
-        {"extend_existing": True},
+        UniqueConstraint("role", "permission_id", "college_id",
+                         name="role_permissions_role_permission_id_college_id_key"),
     )
 
 
 class UserCustomPermission(Base):
     __tablename__ = "user_custom_permissions"
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     permission_id = Column(Integer, ForeignKey("permissions.id"), nullable=False)
     granted = Column(Boolean, default=True, nullable=False)  # TRUE = grant, FALSE = revoke
-    created_at = Column(DateTime, default=datetime.utcnow)
-    granted_by = Column(Integer, ForeignKey("users.id"), nullable=True)
+    created_at = Column(DateTime, server_default=utc_now)
+    granted_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
 
     # Relationships
     user = relationship("User", foreign_keys=[user_id])
     permission = relationship("Permission")
     granter = relationship("User", foreign_keys=[granted_by])
 
-    # Ensure unique combination
+    # Ensure unique combination (named as the rbac migration's inline UNIQUE created it)
     __table_args__ = (
-        {"extend_existing": True},
+        UniqueConstraint("user_id", "permission_id", name="user_custom_permissions_user_id_permission_id_key"),
+        # Covers the permission-override JOIN in rbac.get_user_permissions (index-only scan)
+        Index("idx_user_custom_permissions_lookup", "user_id", "permission_id", "granted"),
     )
 
 # ==================== POST ENGAGEMENT MODELS ====================
@@ -478,92 +731,102 @@ class UserCustomPermission(Base):
 class PostLike(Base):
     __tablename__ = "post_likes"
 
-    id = Column(Integer, primary_key=True, index=True)
-    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(BigInteger, Identity(), primary_key=True)
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now)
 
     # Relationships
     post = relationship("Post", back_populates="likes")
     user = relationship("User")
 
-    # Ensure unique combination
+    # Ensure unique combination (its index also serves post_id lookups)
     __table_args__ = (
-        {"extend_existing": True},
+        UniqueConstraint("post_id", "user_id", name="unique_post_like"),
     )
 
 
 class PostComment(Base):
     __tablename__ = "post_comments"
 
-    id = Column(Integer, primary_key=True, index=True)
-    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(BigInteger, Identity(), primary_key=True)
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     content = Column(Text, nullable=False)  # Max 500 chars enforced in validation
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now)
+    updated_at = Column(DateTime, server_default=utc_now, onupdate=utc_now)
 
     # Relationships
     post = relationship("Post", back_populates="comments")
     user = relationship("User")
 
+    __table_args__ = (
+        # Comment thread for a post, newest first; also serves plain post_id lookups
+        Index("idx_post_comments_created_at", post_id, created_at.desc()),
+    )
+
 
 class PostIgnite(Base):
     __tablename__ = "post_ignites"
 
-    id = Column(Integer, primary_key=True, index=True)
-    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(BigInteger, Identity(), primary_key=True)
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), nullable=False)
     giver_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     receiver_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now)
 
     # Relationships
     post = relationship("Post", back_populates="ignites")
     giver = relationship("User", foreign_keys=[giver_id])
     receiver = relationship("User", foreign_keys=[receiver_id])
 
-    # Ensure unique combination
+    # Ensure unique combination (its index also serves post_id lookups)
     __table_args__ = (
-        {"extend_existing": True},
+        UniqueConstraint("post_id", "giver_id", name="unique_post_ignite"),
     )
 
 
+class PostCounterQueue(Base):
+    """
+    Posts whose like/ignite counters need recounting. Filled by triggers on post_likes and
+    post_ignites, drained by services/post_counters.py; no FK so deleted posts just drop out.
+    """
+    __tablename__ = "post_counter_queue"
+
+    post_id = Column(Integer, primary_key=True, autoincrement=False)
+
+
 # ==================== CENTRALIZED REWARD POOL MODELS ====================
 
-class CollegeRewardPool(Base):
+class CollegeRewardPool(TimestampMixin, Base):
     __tablename__ = "college_reward_pools"
 
-    id = Column(Integer, primary_key=True, index=True)
-    college_id = Column(Integer, ForeignKey("colleges.id", ondelete="CASCADE"), unique=True, nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    college_id = Column(Integer, ForeignKey("colleges.id", ondelete="CASCADE"), unique=True, nullable=False)
     total_balance = Column(Integer, default=0, nullable=False)
     reserved_balance = Column(Integer, default=0, nullable=False)
-    # available_balance is computed in DB, we'll calculate it in code
+    # GENERATED ALWAYS in PostgreSQL, so balance filters run in the database
+    available_balance = Column(Integer, Computed("total_balance - reserved_balance", persisted=True))
     initial_allocation = Column(Integer, default=0, nullable=False)
     lifetime_credits = Column(Integer, default=0, nullable=False)
     lifetime_debits = Column(Integer, default=0, nullable=False)
     low_balance_threshold = Column(Integer, default=1000, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
     college = relationship("College")
 
-    @property
-    def available_balance(self):
-        """Calculate available balance (total - reserved)"""
-        return self.total_balance - self.reserved_balance
-
-    @property
+    @hybrid_property
     def is_low_balance(self):
-        """Check if pool is running low"""
+        """Check if pool is running low (also usable in filters: CollegeRewardPool.is_low_balance)"""
         return self.available_balance < self.low_balance_threshold
 
 
 class PoolTransaction(Base):
     __tablename__ = "pool_transactions"
 
-    id = Column(Integer, primary_key=True, index=True)
-    college_id = Column(Integer, ForeignKey("colleges.id", ondelete="CASCADE"), nullable=False, index=True)
+    # BIGSERIAL rather than IDENTITY: before PostgreSQL 17 partitioned tables can't have identity columns
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    college_id = Column(Integer, ForeignKey("colleges.id", ondelete="CASCADE"), nullable=False)
     transaction_type = Column(String(50), nullable=False, index=True)  # CREDIT, DEBIT
     amount = Column(Integer, nullable=False)
     balance_before = Column(Integer, nullable=False)
@@ -572,12 +835,135 @@ class PoolTransaction(Base):
     description = Column(Text)
     reference_type = Column(String(50))
     reference_id = Column(Integer)
-    beneficiary_user_id = Column(Integer, ForeignKey("users.id"))
-    created_by = Column(Integer, ForeignKey("users.id"))
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    meta_data = Column(JSON)  # Renamed from 'metadata' to avoid SQLAlchemy conflict
+    beneficiary_user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    # Partition key, so it has to be part of the primary key
+    created_at = Column(DateTime, primary_key=True, server_default=utc_now)
+    meta_data = Column(JSONB)  # Renamed from 'metadata' to avoid SQLAlchemy conflict
 
     # Relationships
     college = relationship("College")
     beneficiary = relationship("User", foreign_keys=[beneficiary_user_id])
     creator = relationship("User", foreign_keys=[created_by])
+
+    __table_args__ = (
+        # Pool history: WHERE college_id = ? ORDER BY created_at DESC
+        Index("ix_pool_transactions_college_created", college_id, created_at.desc()),
+        # Monthly partitions; see create_monthly_partitions below
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+
+# Rows of these tables are rewritten in place over and over (balances, cart contents,
+# order status). Leaving 20% of each heap page free lets those updates stay on the same
+# page as HOT updates instead of moving the row and touching every index.
+for _table in (RewardPoint.__table__, Cart.__table__, CartItem.__table__, Order.__table__):
+    event.listen(_table, "after_create", DDL("ALTER TABLE %(table)s SET (fillfactor = 80)"))
+
+
+# Every point_transactions row is applied to reward_points by the INSERT itself. SPENT rows
+# must be covered by the balance; other debits (e.g. a removed ignite) stop at 0.
+# Mirrors migrations/20241119_150000_point_transaction_trigger.sql for create_all databases.
+event.listen(PointTransaction.__table__, "after_create", DDL("""
+CREATE OR REPLACE FUNCTION apply_point_transaction() RETURNS trigger AS $$
+BEGIN
+    IF NEW.transaction_type = 'SPENT' THEN
+        UPDATE reward_points
+        SET total_points = total_points + NEW.points,
+            updated_at = timezone('utc', now())
+        WHERE user_id = NEW.user_id AND total_points + NEW.points >= 0
+        RETURNING total_points INTO NEW.balance_after;
+
+        IF NOT FOUND THEN
+            RAISE EXCEPTION 'Insufficient points' USING ERRCODE = 'check_violation';
+        END IF;
+    ELSE
+        INSERT INTO reward_points (user_id, total_points)
+        VALUES (NEW.user_id, GREATEST(NEW.points, 0))
+        ON CONFLICT ON CONSTRAINT uq_reward_points_user DO UPDATE
+        SET total_points = GREATEST(reward_points.total_points + NEW.points, 0),
+            updated_at = timezone('utc', now())
+        RETURNING total_points INTO NEW.balance_after;
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_point_transactions_balance
+    BEFORE INSERT ON point_transactions
+    FOR EACH ROW EXECUTE FUNCTION apply_point_transaction();
+"""))
+
+
+# Append-only, time-ordered tables are range-partitioned by month on created_at. Each
+# gets a DEFAULT partition plus partitions through `months_ahead` months from now;
+# `python db_setup.py --maintain-partitions` (also run after every --migrate) keeps
+# creating the upcoming months. Mirrors migrations/20241119_170000_partition_append_only_tables.sql
+# and migrations/20241120_130000_partition_pool_transactions.sql.
+event.listen(Base.metadata, "before_create", DDL("""
+CREATE OR REPLACE FUNCTION create_monthly_partitions(parent TEXT, months_ahead INTEGER DEFAULT 3)
+RETURNS void AS $$
+DECLARE
+    first_month DATE := date_trunc('month', timezone('utc', now()))::date;
+    month_start DATE;
+BEGIN
+    EXECUTE format('CREATE TABLE IF NOT EXISTS %%I PARTITION OF %%I DEFAULT', parent || '_default', parent);
+
+    FOR i IN 0..months_ahead LOOP
+        month_start := first_month + make_interval(months => i);
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %%I PARTITION OF %%I FOR VALUES FROM (%%L) TO (%%L)',
+            parent || '_' || to_char(month_start, 'YYYYMM'),
+            parent,
+            month_start,
+            month_start + make_interval(months => 1)
+        );
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+"""))
+
+for _table in (PointTransaction.__table__, AIConversation.__table__, PoolTransaction.__table__):
+    event.listen(_table, "after_create", DDL("SELECT create_monthly_partitions('%(table)s')"))
+
+
+# A like or ignite only queues its post (ON CONFLICT DO NOTHING never waits on a committed
+# row), so a busy post doesn't serialize every click on an UPDATE of its posts row; the
+# counters are recounted in batches by services/post_counters.py.
+# Mirrors migrations/20241120_120000_queued_post_counters.sql for create_all databases.
+event.listen(Base.metadata, "before_create", DDL("""
+CREATE OR REPLACE FUNCTION queue_post_counter_refresh() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO post_counter_queue (post_id)
+    VALUES (CASE WHEN TG_OP = 'DELETE' THEN OLD.post_id ELSE NEW.post_id END)
+    ON CONFLICT DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""))
+
+for _table in (PostLike.__table__, PostIgnite.__table__):
+    event.listen(_table, "after_create", DDL("""
+CREATE TRIGGER trg_%(table)s_queue_counters
+    AFTER INSERT OR DELETE ON %(table)s
+    FOR EACH ROW EXECUTE FUNCTION queue_post_counter_refresh();
+"""))
+
+
+# Leaderboard ranks are precomputed per college (row_number, so ties keep a stable order by
+# user id). The unique (college_id, rank) index serves the top-N read and is what
+# REFRESH ... CONCURRENTLY requires. Mirrors migrations/20241120_160000_college_leaderboard_view.sql.
+event.listen(Base.metadata, "after_create", DDL("""
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_college_leaderboard AS
+SELECT rp.user_id,
+       u.college_id,
+       row_number() OVER (PARTITION BY u.college_id ORDER BY rp.total_points DESC, rp.user_id) AS rank,
+       rp.total_points,
+       u.full_name,
+       u.department
+FROM reward_points rp
+JOIN users u ON u.id = rp.user_id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_college_leaderboard_rank ON mv_college_leaderboard (college_id, rank);
+"""))
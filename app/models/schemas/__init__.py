@@ -0,0 +1,46 @@
+"""
+Request and response schemas, split by domain. Everything is re-exported here so
+routers can keep importing from app.models.schemas
+"""
+
+from ..models import (
+    PostType, RewardType, FileType, AlertType, ProductCategory, ProductStatus, OrderStatus
+)
+from .base import build_schemas
+from .user import (
+    UserBase, UserCreate, UserResponse, UserListItem, UserProfile, Token, TokenData, LoginRequest,
+    PasswordUpdateRequest, CollegeBase, CollegeCreate, CollegeResponse, PermissionItem
+)
+from .post import (
+    PostBase, PostCreate, PostUpdate, PostMetadata, PostResponse, PostMetadataUpdate
+)
+from .engagement import (
+    CommentCreate, CommentResponse, CommentListResponse, LikeResponse, LikeListResponse,
+    LikeToggleResponse, IgniteResponse, IgniteToggleResponse, IgniteListResponse,
+    PostEngagementResponse
+)
+from .reward import (
+    RewardBase, RewardCreate, RewardResponse, RewardPointsResponse,
+    RewardLeaderboardResponse, RewardSummaryResponse, PoolBalanceResponse,
+    PoolTransactionResponse, PoolCreditRequest, PoolAnalyticsResponse, PoolTransactionType
+)
+from .file import (
+    FileMetadata, FileUploadResponse, FileResponse, FileUpdate, FileListResponse,
+    FileSearchQuery, FolderCreate, FolderItem, Breadcrumb, FolderContentsResponse
+)
+from .ai import (
+    AIQuery, AIResponse, IndexRequest, IndexResponse, SearchResult, KnowledgeSearchQuery,
+    ConversationResponse, AIIndexingStats, AIConversationStats, AIStatsResponse,
+    ContentRewriteRequest, ContentRewriteResponse
+)
+from .alert import (
+    AlertBase, AlertCreate, AlertUpdate, AlertResponse, AlertListResponse, PostAlertCreate
+)
+from .store import (
+    ProductBase, ProductCreate, ProductUpdate, ProductResponse, ProductListResponse,
+    CartItemAdd, CartItemUpdate, CartItemResponse, CartResponse, CheckoutRequest,
+    OrderItemResponse, OrderResponse, OrderListResponse, OrderStatusUpdate,
+    PointTransactionResponse, BalanceResponse, BalanceHistoryResponse, WishlistAdd,
+    WishlistItemResponse, WishlistResponse, CategoryResponse, OrderStatusDisplay,
+    PointTransactionType
+)
@@ -0,0 +1,84 @@
+"""
+AI assistant schemas
+"""
+
+from typing import Optional, Dict, Any, List
+from datetime import datetime
+
+from .base import _Schema
+
+
+# AI schemas
+class AIQuery(_Schema):
+    question: str
+    context_filter: Optional[str] = None  # "files", "posts", "all"
+
+
+class AIResponse(_Schema):
+    answer: str
+    sources: List[Dict[str, Any]]
+    conversation_id: int
+
+
+class IndexRequest(_Schema):
+    content_type: str  # "file", "post", "all"
+    content_ids: Optional[List[int]] = None
+
+
+class IndexResponse(_Schema):
+    message: str
+    tasks_created: int
+
+
+class SearchResult(_Schema):
+    doc_id: str
+    similarity: float
+    metadata: Dict[str, Any]
+
+
+class KnowledgeSearchQuery(_Schema):
+    query: str
+    content_type: Optional[str] = None  # "file", "post", "college_info"
+    limit: int = 5
+
+
+class ConversationResponse(_Schema):
+    id: int
+    query: str
+    response: str
+    sources_count: int
+    created_at: datetime
+
+
+class AIIndexingStats(_Schema):
+    indexed_files: int = 0
+    pending_files: int = 0
+    failed_files: int = 0
+
+
+class AIConversationStats(_Schema):
+    total_college_conversations: int = 0
+    user_conversations: int = 0
+
+
+class AIStatsResponse(_Schema):
+    vector_database: Dict[str, Any]
+    indexing: AIIndexingStats
+    conversations: AIConversationStats
+
+
+class ContentRewriteRequest(_Schema):
+    content: str
+    style: Optional[str] = "professional"  # "professional", "casual", "formal", "engaging"
+    tone: Optional[str] = "friendly"      # "friendly", "neutral", "enthusiastic", "informative"
+    max_length: Optional[int] = None      # Optional character limit
+
+
+class ContentRewriteResponse(_Schema):
+    original_content: str
+    rewritten_content: str
+    style: str
+    tone: str
+    improvements: List[str]
+    word_count_before: int
+    word_count_after: int
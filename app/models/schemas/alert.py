@@ -0,0 +1,83 @@
+"""
+Alert schemas
+"""
+
+from pydantic import ConfigDict, Field, ValidationInfo, computed_field, field_validator
+from typing import Optional, List
+from datetime import datetime
+
+from ...core import utils
+from ..models import AlertType
+from .base import _Schema, _ORMModel
+
+
+# Alert schemas
+class AlertBase(_Schema):
+    title: str
+    message: str
+    alert_type: AlertType = AlertType.GENERAL
+    expires_at: Optional[datetime] = None
+    post_id: Optional[int] = None
+
+
+class AlertCreate(AlertBase):
+    user_id: int
+
+
+class AlertUpdate(_Schema):
+    title: Optional[str] = None
+    message: Optional[str] = None
+    alert_type: Optional[AlertType] = None
+    is_enabled: Optional[bool] = None  # True=enabled, False=disabled
+    is_read: Optional[bool] = None  # True=read, False=unread
+    expires_at: Optional[datetime] = None
+
+
+class AlertResponse(AlertBase, _ORMModel):
+    id: int
+    user_id: int
+    is_enabled: bool
+    is_read: bool
+    college_id: int
+    created_by: int
+    created_at: datetime
+    updated_at: datetime
+    
+    # Additional fields for rich responses
+    creator_name: str
+    post_title: Optional[str] = None
+
+    # Every field is always in the response, time_ago included
+    model_config = ConfigDict(json_schema_serialization_defaults_required=True)
+
+    # Computed from created_at unless the router passes one from a page-wide time_ago_batch
+    time_ago: str = Field(default=None, validate_default=True)
+
+    @field_validator("time_ago", mode="before")
+    @classmethod
+    def _fill_time_ago(cls, value: Optional[str], info: ValidationInfo) -> Optional[str]:
+        created_at = info.data.get("created_at")
+        if value is None and created_at is not None:
+            return utils.time_ago(created_at)
+        return value
+
+    @computed_field
+    @property
+    def is_expired(self) -> bool:
+        return self.expires_at is not None and self.expires_at < datetime.utcnow()
+
+
+class AlertListResponse(_Schema):
+    alerts: List[AlertResponse]
+    total_count: int
+    unread_count: int
+    page: int
+    page_size: int
+
+
+class PostAlertCreate(_Schema):
+    user_id: int
+    title: str
+    message: str
+    alert_type: AlertType = AlertType.ANNOUNCEMENT
+    expires_at: Optional[datetime] = None
@@ -0,0 +1,27 @@
+"""
+Shared base classes for the API schemas
+"""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class _Schema(BaseModel):
+    """
+    Base for every schema in this package. Validators and serializers are not built at
+    import; build_schemas() builds them all during startup, off the request path.
+    """
+    model_config = ConfigDict(defer_build=True)
+
+
+class _ORMModel(_Schema):
+    """Base for response schemas read straight off ORM rows"""
+    model_config = ConfigDict(from_attributes=True)
+
+
+def build_schemas():
+    """Build the validator and serializer of every schema that hasn't been built yet"""
+    pending = [_Schema]
+    while pending:
+        schema = pending.pop()
+        pending.extend(schema.__subclasses__())
+        schema.model_rebuild()
@@ -0,0 +1,117 @@
+"""
+Post engagement schemas: comments, likes and ignites
+"""
+
+from pydantic import ConfigDict, Field, ValidationInfo, field_validator
+from typing import List, Optional
+from datetime import datetime
+
+from ...core import utils
+from .base import _Schema, _ORMModel
+from .post import PostResponse
+
+
+# Comment Schemas
+class CommentCreate(_Schema):
+    content: str
+
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "content": "Great post! Very helpful information."
+        }
+    })
+
+
+class CommentResponse(_ORMModel):
+    id: int
+    post_id: int
+    user_id: int
+    content: str
+    created_at: datetime
+    updated_at: datetime
+    
+    # User info
+    user_name: str
+    user_department: str
+
+    # Every field is always in the response, time_ago included
+    model_config = ConfigDict(json_schema_serialization_defaults_required=True)
+
+    # Computed from created_at unless the router passes one from a page-wide time_ago_batch
+    time_ago: str = Field(default=None, validate_default=True)
+
+    @field_validator("time_ago", mode="before")
+    @classmethod
+    def _fill_time_ago(cls, value: Optional[str], info: ValidationInfo) -> Optional[str]:
+        created_at = info.data.get("created_at")
+        if value is None and created_at is not None:
+            return utils.time_ago(created_at)
+        return value
+
+
+class CommentListResponse(_Schema):
+    comments: List[CommentResponse]
+    total_count: int
+    page: int
+    page_size: int
+
+
+# Like Schemas
+class LikeResponse(_ORMModel):
+    id: int
+    post_id: int
+    user_id: int
+    created_at: datetime
+    
+    # User info
+    user_name: str
+    user_department: str
+
+
+class LikeListResponse(_Schema):
+    likes: List[LikeResponse]
+    total_count: int
+    page: int
+    page_size: int
+
+
+class LikeToggleResponse(_Schema):
+    success: bool
+    action: str  # "liked" or "unliked"
+    like_count: int
+
+
+# Ignite Schemas
+class IgniteResponse(_ORMModel):
+    id: int
+    post_id: int
+    giver_id: int
+    receiver_id: int
+    created_at: datetime
+    
+    # User info
+    giver_name: str
+    receiver_name: str
+
+
+class IgniteToggleResponse(_Schema):
+    success: bool
+    action: str  # "ignited" or "removed"
+    ignite_count: int
+    points_transferred: int  # 1 or -1
+
+
+class IgniteListResponse(_Schema):
+    ignites: List[IgniteResponse]
+    total_count: int
+    page: int
+    page_size: int
+
+
+# Enhanced Post Response with Engagement Data
+class PostEngagementResponse(PostResponse):
+    like_count: int
+    comment_count: int
+    ignite_count: int
+    user_has_liked: bool = False
+    user_has_ignited: bool = False
@@ -0,0 +1,102 @@
+"""
+File and folder schemas
+"""
+
+from pydantic import ConfigDict
+from typing import Optional, List
+from datetime import datetime
+
+from ..models import FileType
+from .base import _Schema, _ORMModel
+
+
+# File schemas
+class FileMetadata(_Schema):
+    """Upload metadata with the view/download counters folded in"""
+    views: int = 0
+    downloads: int = 0
+
+    model_config = ConfigDict(extra="allow")
+
+
+class FileUploadResponse(_ORMModel):
+    id: int
+    filename: str
+    original_filename: str
+    file_size: int
+    file_type: FileType
+    mime_type: str
+    department: str
+    college_id: int
+    uploaded_by: int
+    upload_metadata: FileMetadata
+    created_at: datetime
+    
+    # Folder support
+    folder_path: str = "/"
+    is_folder: bool = False
+    
+    # Additional fields
+    uploader_name: str
+    college_name: str
+
+
+class FileResponse(FileUploadResponse):
+    description: Optional[str] = None
+    updated_at: datetime
+
+
+class FileUpdate(_Schema):
+    description: Optional[str] = None
+    folder_path: Optional[str] = None
+
+
+class FileListResponse(_Schema):
+    files: List[FileResponse]
+    total_count: int
+    page: int
+    page_size: int
+
+
+class FileSearchQuery(_Schema):
+    department: Optional[str] = None
+    file_type: Optional[FileType] = None
+    search_term: Optional[str] = None
+    folder_path: Optional[str] = None
+    page: int = 1
+    page_size: int = 20
+
+
+# Folder-specific schemas
+class FolderCreate(_Schema):
+    name: str
+    parent_path: str = "/"
+    description: Optional[str] = None
+
+
+class FolderItem(_ORMModel):
+    id: int
+    name: str
+    path: str
+    is_folder: bool
+    file_type: Optional[FileType] = None
+    file_size: int = 0
+    file_count: int = 0  # For folders, number of items inside
+    created_at: datetime
+    updated_at: datetime
+    uploader_name: str
+    description: Optional[str] = None
+
+
+class Breadcrumb(_Schema):
+    name: str
+    path: str
+
+
+class FolderContentsResponse(_Schema):
+    current_path: str
+    parent_path: Optional[str] = None
+    folders: List[FolderItem]
+    files: List[FolderItem]
+    total_items: int
+    breadcrumbs: List[Breadcrumb]  # Path navigation breadcrumbs
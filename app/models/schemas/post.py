@@ -0,0 +1,70 @@
+"""
+Post schemas
+"""
+
+from pydantic import ConfigDict, Field, ValidationInfo, field_validator
+from typing import Optional
+from datetime import datetime
+
+from ...core import utils
+from ..models import PostType
+from .base import _Schema, _ORMModel
+
+
+# Post schemas
+class PostBase(_Schema):
+    title: str
+    content: str
+    image_url: Optional[str] = None
+    post_type: PostType = PostType.GENERAL
+
+
+class PostCreate(PostBase):
+    pass
+
+
+class PostUpdate(_Schema):
+    title: Optional[str] = None
+    content: Optional[str] = None
+    image_url: Optional[str] = None
+    post_type: Optional[PostType] = None
+
+
+class PostMetadata(_Schema):
+    """Post counters; unknown keys from older rows are carried through"""
+    likes: int = 0
+    comments: int = 0
+    shares: int = 0
+
+    model_config = ConfigDict(extra="allow")
+
+
+class PostResponse(PostBase, _ORMModel):
+    id: int
+    author_id: int
+    college_id: int
+    post_metadata: PostMetadata
+    created_at: datetime
+    updated_at: datetime
+    author_name: str
+    author_department: str
+
+    # Every field is always in the response, time_ago included
+    model_config = ConfigDict(json_schema_serialization_defaults_required=True)
+
+    # Computed from created_at unless the router passes one from a page-wide time_ago_batch
+    time_ago: str = Field(default=None, validate_default=True)
+
+    @field_validator("time_ago", mode="before")
+    @classmethod
+    def _fill_time_ago(cls, value: Optional[str], info: ValidationInfo) -> Optional[str]:
+        created_at = info.data.get("created_at")
+        if value is None and created_at is not None:
+            return utils.time_ago(created_at)
+        return value
+
+
+class PostMetadataUpdate(_Schema):
+    likes: Optional[int] = None
+    comments: Optional[int] = None
+    shares: Optional[int] = None
@@ -0,0 +1,113 @@
+"""
+Reward and reward pool schemas
+"""
+
+from typing import Optional, Dict, Any, List, Literal
+from datetime import datetime
+
+from ..models import RewardType
+from .base import _Schema, _ORMModel
+
+
+# Reward schemas
+class RewardBase(_Schema):
+    receiver_id: int
+    points: int
+    reward_type: RewardType
+    title: str
+    description: Optional[str] = None
+    post_id: Optional[int] = None
+
+
+class RewardCreate(RewardBase):
+    pass
+
+
+class RewardResponse(RewardBase, _ORMModel):
+    id: int
+    giver_id: int
+    college_id: int
+    created_at: datetime
+    
+    # Additional fields for rich responses
+    giver_name: str
+    receiver_name: str
+    giver_department: str
+    receiver_department: str
+    post_title: Optional[str] = None
+
+
+class RewardPointsResponse(_ORMModel):
+    id: int
+    user_id: int
+    total_points: int
+    created_at: datetime
+    updated_at: datetime
+    
+    # User info
+    user_name: str
+    user_department: str
+
+
+class RewardLeaderboardResponse(_Schema):
+    user_id: int
+    user_name: str
+    department: str
+    total_points: int
+    rank: int
+
+
+class RewardSummaryResponse(_Schema):
+    total_points: int
+    rewards_given: int
+    rewards_received: int
+    recent_rewards: List[RewardResponse]
+
+
+# ==================== REWARD POOL SCHEMAS ====================
+
+PoolTransactionType = Literal["CREDIT", "DEBIT"]
+
+
+class PoolBalanceResponse(_ORMModel):
+    college_id: int
+    college_name: str
+    total_balance: int
+    reserved_balance: int
+    available_balance: int
+    initial_allocation: int
+    lifetime_credits: int
+    lifetime_debits: int
+    low_balance_threshold: int
+    is_low_balance: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+class PoolTransactionResponse(_ORMModel):
+    id: int
+    college_id: int
+    transaction_type: PoolTransactionType
+    amount: int
+    balance_before: int
+    balance_after: int
+    reason: str
+    description: Optional[str] = None
+    reference_type: Optional[str] = None
+    reference_id: Optional[int] = None
+    beneficiary_user_id: Optional[int] = None
+    beneficiary_name: Optional[str] = None
+    created_by: Optional[int] = None
+    creator_name: Optional[str] = None
+    created_at: datetime
+
+
+class PoolCreditRequest(_Schema):
+    amount: int
+    description: Optional[str] = "Manual pool credit"
+
+
+class PoolAnalyticsResponse(_Schema):
+    pool_balance: PoolBalanceResponse
+    recent_transactions: List[PoolTransactionResponse]
+    statistics: Dict[str, Any]
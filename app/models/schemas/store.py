@@ -0,0 +1,201 @@
+"""
+Rewards store schemas: products, cart, orders, balance and wishlist
+"""
+
+from typing import Optional, Dict, Any, List, Literal
+from datetime import datetime
+
+from ..models import ProductCategory, ProductStatus, OrderStatus
+from .base import _Schema, _ORMModel
+
+
+# Product Schemas
+class ProductBase(_Schema):
+    name: str
+    description: Optional[str] = None
+    category: ProductCategory
+    points_required: int
+    original_price: Optional[float] = None
+    stock_quantity: int = 0
+    max_quantity_per_user: int = 1
+    image_url: Optional[str] = None
+    brand: Optional[str] = None
+    specifications: Optional[Dict[str, Any]] = None
+
+
+class ProductCreate(ProductBase):
+    pass
+
+
+class ProductUpdate(_Schema):
+    name: Optional[str] = None
+    description: Optional[str] = None
+    category: Optional[ProductCategory] = None
+    points_required: Optional[int] = None
+    original_price: Optional[float] = None
+    stock_quantity: Optional[int] = None
+    max_quantity_per_user: Optional[int] = None
+    status: Optional[ProductStatus] = None
+    image_url: Optional[str] = None
+    brand: Optional[str] = None
+    specifications: Optional[Dict[str, Any]] = None
+
+
+class ProductResponse(ProductBase, _ORMModel):
+    id: int
+    status: ProductStatus
+    college_id: int
+    created_by: Optional[int] = None  # None once the creator's account is deleted
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    creator_name: str
+    in_stock: bool
+    can_purchase: bool
+
+
+class ProductListResponse(_Schema):
+    products: List[ProductResponse]
+    total_count: int
+    page: int
+    page_size: int
+
+
+# Cart Schemas
+class CartItemAdd(_Schema):
+    product_id: int
+    quantity: int = 1
+
+
+class CartItemUpdate(_Schema):
+    quantity: int
+
+
+class CartItemResponse(_ORMModel):
+    id: int
+    product_id: int
+    quantity: int
+    added_at: datetime
+    product_name: str
+    product_points: int
+    total_points: int
+    product_image: Optional[str] = None
+    product_stock: int
+    max_quantity_allowed: int
+
+
+class CartResponse(_ORMModel):
+    id: int
+    items: List[CartItemResponse]
+    total_items: int
+    total_points: int
+    created_at: datetime
+    updated_at: datetime
+
+
+# Order Schemas
+# status_display is the title-cased OrderStatus value, e.g. "Ready For Pickup"
+OrderStatusDisplay = Literal[tuple(status.value.replace("_", " ").title() for status in OrderStatus)]
+
+
+class CheckoutRequest(_Schema):
+    notes: Optional[str] = None
+
+
+class OrderItemResponse(_ORMModel):
+    id: int
+    product_id: int
+    product_name: str
+    quantity: int
+    points_per_item: int
+    total_points: int
+    created_at: datetime
+
+
+class OrderResponse(_ORMModel):
+    id: int
+    order_number: str
+    user_id: int
+    total_points: int
+    total_items: int
+    status: OrderStatus
+    notes: Optional[str] = None
+    pickup_location: Optional[str] = None
+    estimated_pickup_date: Optional[datetime] = None
+    items: List[OrderItemResponse]
+    created_at: datetime
+    updated_at: datetime
+    user_name: str
+    status_display: OrderStatusDisplay
+
+
+class OrderListResponse(_Schema):
+    orders: List[OrderResponse]
+    total_count: int
+    page: int
+    page_size: int
+
+
+class OrderStatusUpdate(_Schema):
+    status: OrderStatus
+    notes: Optional[str] = None
+    pickup_location: Optional[str] = None
+    estimated_pickup_date: Optional[datetime] = None
+
+
+# Balance & Transactions
+PointTransactionType = Literal["EARNED", "SPENT", "REFUNDED", "DEDUCTED"]
+
+
+class PointTransactionResponse(_ORMModel):
+    id: int
+    transaction_type: PointTransactionType
+    points: int
+    balance_after: int
+    description: str
+    reference_type: Optional[str] = None
+    reference_id: Optional[int] = None
+    created_at: datetime
+
+
+class BalanceResponse(_Schema):
+    current_balance: int
+    total_earned: int
+    total_spent: int
+    pending_orders_points: int
+    available_balance: int
+
+
+class BalanceHistoryResponse(_Schema):
+    transactions: List[PointTransactionResponse]
+    balance_summary: BalanceResponse
+    total_count: int
+    page: int
+    page_size: int
+
+
+# Wishlist Schemas
+class WishlistAdd(_Schema):
+    product_id: int
+
+
+class WishlistItemResponse(_ORMModel):
+    id: int
+    product_id: int
+    product_name: str
+    product_points: int
+    product_image: Optional[str] = None
+    product_status: ProductStatus
+    added_at: datetime
+    in_stock: bool
+
+
+class WishlistResponse(_Schema):
+    items: List[WishlistItemResponse]
+    total_count: int
+
+
+# Category Response
+class CategoryResponse(_Schema):
+    category: ProductCategory
+    display_name: str
+    product_count: int
@@ -0,0 +1,97 @@
+"""
+User, auth, college and permission schemas
+"""
+
+from pydantic import EmailStr
+from typing import Optional, List
+from datetime import datetime
+
+from ..models import UserRole
+from .base import _Schema, _ORMModel
+
+
+# User schemas
+class UserBase(_Schema):
+    username: str
+    # Only validated as an address on the way in (UserCreate); stored emails are served as-is
+    email: str
+    full_name: str
+    department: str
+    class_name: str
+    academic_year: str
+
+
+class UserCreate(UserBase):
+    email: EmailStr
+    password: str
+    college_id: int
+
+
+class UserResponse(UserBase, _ORMModel):
+    id: int
+    college_id: int
+    role: str  # 'admin', 'staff', 'student'
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+class UserListItem(_ORMModel):
+    id: int
+    username: str
+    full_name: str
+    email: str
+    role: UserRole
+    is_active: bool
+    department: str
+    created_at: datetime
+
+
+class UserProfile(UserResponse):
+    college_name: str
+    college_slug: str
+    permissions: List[str]  # List of user permissions
+
+
+# Auth schemas
+class Token(_Schema):
+    access_token: str
+    token_type: str
+
+
+class TokenData(_Schema):
+    username: Optional[str] = None
+    college_slug: Optional[str] = None
+
+
+class LoginRequest(_Schema):
+    username: str
+    password: str
+
+
+class PasswordUpdateRequest(_Schema):
+    current_password: str
+    new_password: str
+
+
+# College schemas
+class CollegeBase(_Schema):
+    name: str
+    slug: str
+
+
+class CollegeCreate(CollegeBase):
+    pass
+
+
+class CollegeResponse(CollegeBase, _ORMModel):
+    id: int
+    created_at: datetime
+
+
+# Permission schemas
+class PermissionItem(_ORMModel):
+    id: int
+    name: str
+    action: str
+    description: Optional[str] = None
@@ -3,19 +3,28 @@ Admin endpoints for managing users, roles, and permissions
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-from pydantic import BaseModel
-
-from ..core.database import get_db
-from ..core.security import get_current_user, get_password_hash
-from ..core.rbac import RoleChecker, get_user_permissions
-from ..models.models import User, Permission, UserCustomPermission, UserRole, College, RewardPoint, PointTransaction
-from ..models.schemas import UserCreate, UserResponse
+from sqlalchemy import exists, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List
+from pydantic import BaseModel, TypeAdapter
+
+from ..core.database import get_async_db
+from ..core.responses import json_response
+from ..core.security import Principal, get_current_principal_async, get_password_hash
+from ..core.rbac import PERMISSION_BITS, SORTED_ROLE_PERMISSIONS, AsyncRoleChecker, get_user_permissions, invalidate_user_permissions
+from ..models.models import User, Permission, UserCustomPermission, UserRole, College
+from ..models.schemas import PermissionItem, UserCreate, UserListItem, UserResponse
 from ..services.reward_pool import reward_pool_service
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
+USER_LIST = TypeAdapter(List[UserListItem])
+PERMISSIONS_BY_RESOURCE = TypeAdapter(Dict[str, List[PermissionItem]])
+
+# Each request holds its pooled connection until the response is built: keep awaits
+# on anything other than the database (HTTP calls, file I/O) out of these handlers
+
 
 # Schemas
 class RoleUpdateRequest(BaseModel):
@@ -41,36 +50,70 @@ class UserPermissionResponse(BaseModel):
     effective_permissions: List[str]
 
 
+# The role table is constant, so the /roles body is built once
+_ROLES_RESPONSE = {
+    "roles": [
+        {
+            "name": role.value,
+            "permissions": perms
+        }
+        for role, perms in SORTED_ROLE_PERMISSIONS.items()
+    ]
+}
+
+
+# Permission ids by name; rows are seeded once and never renumbered
+_permission_ids: Dict[str, int] = {}
+
+
+async def _get_permission_id(db: AsyncSession, permission_name: str) -> int:
+    """
+    Resolve a permission name to its id, or raise 404
+    Names outside rbac.ALL_PERMISSIONS are rejected without a query; known names
+    are looked up once per worker
+    """
+    permission_id = _permission_ids.get(permission_name)
+    if permission_id is None and permission_name in PERMISSION_BITS:
+        permission_id = await db.scalar(select(Permission.id).where(Permission.name == permission_name))
+        if permission_id is not None:
+            _permission_ids[permission_name] = permission_id
+    
+    if permission_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Permission '{permission_name}' not found"
+        )
+    return permission_id
+
+
 # Endpoints
 
-@router.post("/users", response_model=UserResponse, dependencies=[Depends(RoleChecker(UserRole.ADMIN, UserRole.STAFF))])
+@router.post("/users", response_model=UserResponse, dependencies=[Depends(AsyncRoleChecker(UserRole.ADMIN, UserRole.STAFF))])
 async def create_user(
     user: UserCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal_async)
 ):
     """
     Create a new user
     Requires: admin or staff role
     """
     # Check if username already exists
-    db_user = db.query(User).filter(User.username == user.username).first()
-    if db_user:
+    if await db.scalar(select(exists().where(User.username == user.username))):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already registered"
         )
     
     # Check if email already exists
-    db_user = db.query(User).filter(User.email == user.email).first()
-    if db_user:
+    if await db.scalar(select(exists().where(User.email == user.email))):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
     # Check if college exists and matches current user's college (unless admin creating for another college)
-    college = db.query(College).filter(College.id == user.college_id).first()
+    college = await db.get(College, user.college_id)
     if not college:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -98,13 +141,14 @@ async def create_user(
     )
     
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     
     # 🎉 WELCOME BONUS: Give new user 50 reward points (from college pool)
     try:
-        result = reward_pool_service.give_reward_from_pool(
-            db=db,
+        # The pool service is synchronous; run_sync hands it the session's underlying Session
+        result = await db.run_sync(lambda session: reward_pool_service.give_reward_from_pool(
+            db=session,
             college_id=db_user.college_id,
             user_id=db_user.id,
             amount=50,
@@ -113,7 +157,7 @@ async def create_user(
             created_by=current_user.id,
             reference_type="user_registration",
             reference_id=db_user.id
-        )
+        ))
         print(f"✅ Welcome bonus of 50 points credited to user {db_user.username} (from college pool)")
     except HTTPException as e:
         # Pool depleted - create user but no welcome bonus
@@ -125,10 +169,10 @@ async def create_user(
     return db_user
 
 
-@router.get("/users", dependencies=[Depends(RoleChecker(UserRole.ADMIN, UserRole.STAFF))])
+@router.get("/users", response_model=List[UserListItem], dependencies=[Depends(AsyncRoleChecker(UserRole.ADMIN, UserRole.STAFF))])
 async def list_users(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal_async),
     skip: int = 0,
     limit: int = 100
 ):
@@ -136,41 +180,29 @@ async def list_users(
     List all users in the same college
     Requires: admin or staff role
     """
-    users = db.query(User).filter(
-        User.college_id == current_user.college_id
-    ).offset(skip).limit(limit).all()
+    users = (await db.scalars(
+        select(User).where(User.college_id == current_user.college_id).offset(skip).limit(limit)
+    )).all()
     
-    return [
-        {
-            "id": user.id,
-            "username": user.username,
-            "full_name": user.full_name,
-            "email": user.email,
-            "role": user.role.value,
-            "is_active": user.is_active,
-            "department": user.department,
-            "created_at": user.created_at
-        }
-        for user in users
-    ]
+    return json_response(USER_LIST.validate_python(users), USER_LIST)
 
 
-@router.put("/users/{user_id}/role", dependencies=[Depends(RoleChecker(UserRole.ADMIN))])
+@router.put("/users/{user_id}/role", dependencies=[Depends(AsyncRoleChecker(UserRole.ADMIN))])
 async def update_user_role(
     user_id: int,
     role_data: RoleUpdateRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal_async)
 ):
     """
     Update a user's role
     Requires: admin role
     """
     # Find the user
-    user = db.query(User).filter(
+    user = (await db.scalars(select(User).where(
         User.id == user_id,
         User.college_id == current_user.college_id
-    ).first()
+    ))).first()
     
     if not user:
         raise HTTPException(
@@ -196,11 +228,11 @@ async def update_user_role(
     
     # 🔒 Enforce one admin per college
     if new_role == UserRole.ADMIN:
-        existing_admin = db.query(User).filter(
+        existing_admin = (await db.scalars(select(User).where(
             User.college_id == current_user.college_id,
             User.role == UserRole.ADMIN,
             User.id != user.id  # Exclude the user being updated
-        ).first()
+        ).limit(1))).first()
         
         if existing_admin:
             raise HTTPException(
@@ -209,8 +241,9 @@ async def update_user_role(
             )
     
     user.role = new_role
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
+    invalidate_user_permissions(db.sync_session, user.id)
     
     return {
         "message": "Role updated successfully",
@@ -220,21 +253,21 @@ async def update_user_role(
     }
 
 
-@router.put("/users/{user_id}/status", dependencies=[Depends(RoleChecker(UserRole.ADMIN))])
+@router.put("/users/{user_id}/status", dependencies=[Depends(AsyncRoleChecker(UserRole.ADMIN))])
 async def update_user_status(
     user_id: int,
     status_data: UserStatusRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal_async)
 ):
     """
     Activate or deactivate a user
     Requires: admin role
     """
-    user = db.query(User).filter(
+    user = (await db.scalars(select(User).where(
         User.id == user_id,
         User.college_id == current_user.college_id
-    ).first()
+    ))).first()
     
     if not user:
         raise HTTPException(
@@ -250,8 +283,8 @@ async def update_user_status(
         )
     
     user.is_active = status_data.is_active
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     
     return {
         "message": "User status updated successfully",
@@ -261,12 +294,12 @@ async def update_user_status(
     }
 
 
-@router.delete("/users/{user_id}", dependencies=[Depends(RoleChecker(UserRole.ADMIN))])
+@router.delete("/users/{user_id}", dependencies=[Depends(AsyncRoleChecker(UserRole.ADMIN))])
 async def delete_user(
     user_id: int,
     force: bool = False,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal_async)
 ):
     """
     Delete a user permanently
@@ -278,12 +311,12 @@ async def delete_user(
     Use ?force=true to delete a user with existing posts, rewards, or other data.
     Without force=true, users with existing content cannot be deleted.
     """
-    from ..models.models import Post, Reward, RewardPoint, File, Alert, Order, AIConversation, Cart, WishlistItem, PointTransaction
+    from ..models.models import Post, Reward, File, Alert, Order, AIConversation
     
-    user = db.query(User).filter(
+    user = (await db.scalars(select(User).where(
         User.id == user_id,
         User.college_id == current_user.college_id
-    ).first()
+    ))).first()
     
     if not user:
         raise HTTPException(
@@ -298,18 +331,31 @@ async def delete_user(
             detail="Cannot delete your own account"
         )
     
-    # Check for existing data
-    posts_count = db.query(Post).filter(Post.author_id == user_id).count()
-    rewards_given = db.query(Reward).filter(Reward.giver_id == user_id).count()
-    rewards_received = db.query(Reward).filter(Reward.receiver_id == user_id).count()
-    files_count = db.query(File).filter(File.uploaded_by == user_id).count()
-    alerts_created = db.query(Alert).filter(Alert.created_by == user_id).count()
-    orders_count = db.query(Order).filter(Order.user_id == user_id).count()
-    conversations_count = db.query(AIConversation).filter(AIConversation.user_id == user_id).count()
-    
-    total_data = posts_count + rewards_given + rewards_received + files_count + alerts_created + orders_count + conversations_count
-    
-    if total_data > 0 and not force:
+    # Check for existing data; EXISTS stops at the first row instead of counting them all
+    owned_data = [
+        (Post, Post.author_id == user_id),
+        (Reward, Reward.giver_id == user_id),
+        (Reward, Reward.receiver_id == user_id),
+        (File, File.uploaded_by == user_id),
+        (Alert, Alert.created_by == user_id),
+        (Order, Order.user_id == user_id),
+        (AIConversation, AIConversation.user_id == user_id),
+    ]
+    has_data = await db.scalar(select(
+        or_(*(exists().where(criterion) for _, criterion in owned_data))
+    ))
+    
+    # Counts explain a refusal or report what a forced delete removed: every count in one round trip
+    (posts_count, rewards_given, rewards_received, files_count,
+     alerts_created, orders_count, conversations_count) = (0,) * len(owned_data)
+    if has_data:
+        (posts_count, rewards_given, rewards_received, files_count,
+         alerts_created, orders_count, conversations_count) = (await db.execute(select(*(
+            select(func.count()).select_from(model).where(criterion).scalar_subquery()
+            for model, criterion in owned_data
+        )))).one()
+    
+    if has_data and not force:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={
@@ -331,41 +377,12 @@ async def delete_user(
     username = user.username
     full_name = user.full_name
     
-    # Always delete these relationships first (they exist for all users)
-    db.query(RewardPoint).filter(RewardPoint.user_id == user_id).delete(synchronize_session=False)
-    db.query(PointTransaction).filter(PointTransaction.user_id == user_id).delete(synchronize_session=False)
-    db.query(WishlistItem).filter(WishlistItem.user_id == user_id).delete(synchronize_session=False)
-    db.query(Cart).filter(Cart.user_id == user_id).delete(synchronize_session=False)
-    db.query(UserCustomPermission).filter(UserCustomPermission.user_id == user_id).delete(synchronize_session=False)
-    
-    # If force=true, delete all content-related data
-    if force and total_data > 0:
-        # Delete posts
-        db.query(Post).filter(Post.author_id == user_id).delete(synchronize_session=False)
-        
-        # Delete rewards (both given and received)
-        db.query(Reward).filter(
-            (Reward.giver_id == user_id) | (Reward.receiver_id == user_id)
-        ).delete(synchronize_session=False)
-        
-        # Delete files
-        db.query(File).filter(File.uploaded_by == user_id).delete(synchronize_session=False)
-        
-        # Delete alerts created by user
-        db.query(Alert).filter(Alert.created_by == user_id).delete(synchronize_session=False)
-        
-        # Delete alerts for user
-        db.query(Alert).filter(Alert.user_id == user_id).delete(synchronize_session=False)
-        
-        # Delete orders
-        db.query(Order).filter(Order.user_id == user_id).delete(synchronize_session=False)
-        
-        # Delete AI conversations
-        db.query(AIConversation).filter(AIConversation.user_id == user_id).delete(synchronize_session=False)
-    
-    # Delete the user
-    db.delete(user)
-    db.commit()
+    # Points, transactions, cart, wishlist, custom permissions and (with force=true) posts,
+    # rewards, files, alerts, orders and AI conversations go with the user row through
+    # their ON DELETE CASCADE foreign keys
+    await db.delete(user)
+    await db.commit()
+    invalidate_user_permissions(db.sync_session, user_id)
     
     return {
         "message": "User deleted successfully",
@@ -384,20 +401,20 @@ async def delete_user(
     }
 
 
-@router.get("/users/{user_id}/permissions", dependencies=[Depends(RoleChecker(UserRole.ADMIN, UserRole.STAFF))])
+@router.get("/users/{user_id}/permissions", dependencies=[Depends(AsyncRoleChecker(UserRole.ADMIN, UserRole.STAFF))])
 async def get_user_permissions_detail(
     user_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal_async)
 ):
     """
     Get detailed permission information for a user
     Requires: admin or staff role
     """
-    user = db.query(User).filter(
+    user = (await db.scalars(select(User).where(
         User.id == user_id,
         User.college_id == current_user.college_id
-    ).first()
+    ))).first()
     
     if not user:
         raise HTTPException(
@@ -406,54 +423,53 @@ async def get_user_permissions_detail(
         )
     
     # Get effective permissions
-    effective_permissions = get_user_permissions(user, db)
-    
-    # Get custom permissions
-    custom_perms = db.query(UserCustomPermission).filter(
+    effective_permissions = await db.run_sync(lambda session: get_user_permissions(user, session))
+    
+    # Get custom permissions, joined to their permission rows in one query
+    custom_perms = (await db.execute(select(
+        Permission.name, UserCustomPermission.granted, Permission.resource, Permission.action
+    ).join(
+        Permission, Permission.id == UserCustomPermission.permission_id
+    ).where(
         UserCustomPermission.user_id == user.id
-    ).all()
-    
-    custom_permissions_list = []
-    for cp in custom_perms:
-        perm = db.query(Permission).filter(Permission.id == cp.permission_id).first()
-        if perm:
-            custom_permissions_list.append({
-                "permission": perm.name,
-                "granted": cp.granted,
-                "resource": perm.resource,
-                "action": perm.action
-            })
-    
-    # Get default role permissions
-    from ..core.rbac import ROLE_PERMISSIONS
-    default_perms = list(ROLE_PERMISSIONS.get(user.role, set()))
+    ))).all()
+    
+    custom_permissions_list = [
+        {
+            "permission": cp.name,
+            "granted": cp.granted,
+            "resource": cp.resource,
+            "action": cp.action
+        }
+        for cp in custom_perms
+    ]
     
     return {
         "user_id": user.id,
         "username": user.username,
         "role": user.role.value,
         "is_active": user.is_active,
-        "default_permissions": sorted(default_perms),
+        "default_permissions": SORTED_ROLE_PERMISSIONS.get(user.role, []),
         "custom_permissions": custom_permissions_list,
-        "effective_permissions": sorted(list(effective_permissions))
+        "effective_permissions": sorted(effective_permissions)
     }
 
 
-@router.post("/users/{user_id}/permissions", dependencies=[Depends(RoleChecker(UserRole.ADMIN))])
+@router.post("/users/{user_id}/permissions", dependencies=[Depends(AsyncRoleChecker(UserRole.ADMIN))])
 async def grant_or_revoke_permission(
     user_id: int,
     permission_data: PermissionGrant,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal_async)
 ):
     """
     Grant or revoke a specific permission for a user
     Requires: admin role
     """
-    user = db.query(User).filter(
+    user = (await db.scalars(select(User).where(
         User.id == user_id,
         User.college_id == current_user.college_id
-    ).first()
+    ))).first()
     
     if not user:
         raise HTTPException(
@@ -462,33 +478,19 @@ async def grant_or_revoke_permission(
         )
     
     # Find the permission
-    permission = db.query(Permission).filter(
-        Permission.name == permission_data.permission_name
-    ).first()
-    
-    if not permission:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Permission '{permission_data.permission_name}' not found"
+    permission_id = await _get_permission_id(db, permission_data.permission_name)
+    
+    # Create the override or flip an existing one in a single upsert
+    await db.execute(
+        pg_insert(UserCustomPermission)
+        .values(user_id=user.id, permission_id=permission_id, granted=permission_data.granted)
+        .on_conflict_do_update(
+            index_elements=["user_id", "permission_id"],
+            set_={"granted": permission_data.granted}
         )
-    
-    # Check if custom permission already exists
-    custom_perm = db.query(UserCustomPermission).filter(
-        UserCustomPermission.user_id == user.id,
-        UserCustomPermission.permission_id == permission.id
-    ).first()
-    
-    if custom_perm:
-        custom_perm.granted = permission_data.granted
-    else:
-        custom_perm = UserCustomPermission(
-            user_id=user.id,
-            permission_id=permission.id,
-            granted=permission_data.granted
-        )
-        db.add(custom_perm)
-    
-    db.commit()
+    )
+    await db.commit()
+    invalidate_user_permissions(db.sync_session, user.id)
     
     action = "granted" if permission_data.granted else "revoked"
     return {
@@ -500,21 +502,21 @@ async def grant_or_revoke_permission(
     }
 
 
-@router.delete("/users/{user_id}/permissions/{permission_name}", dependencies=[Depends(RoleChecker(UserRole.ADMIN))])
+@router.delete("/users/{user_id}/permissions/{permission_name}", dependencies=[Depends(AsyncRoleChecker(UserRole.ADMIN))])
 async def remove_custom_permission(
     user_id: int,
     permission_name: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(get_current_principal_async)
 ):
     """
     Remove a custom permission override (user will fall back to role default)
     Requires: admin role
     """
-    user = db.query(User).filter(
+    user = (await db.scalars(select(User).where(
         User.id == user_id,
         User.college_id == current_user.college_id
-    ).first()
+    ))).first()
     
     if not user:
         raise HTTPException(
@@ -522,20 +524,12 @@ async def remove_custom_permission(
             detail="User not found"
         )
     
-    permission = db.query(Permission).filter(
-        Permission.name == permission_name
-    ).first()
+    permission_id = await _get_permission_id(db, permission_name)
     
-    if not permission:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Permission '{permission_name}' not found"
-        )
-    
-    custom_perm = db.query(UserCustomPermission).filter(
+    custom_perm = (await db.scalars(select(UserCustomPermission).where(
         UserCustomPermission.user_id == user.id,
-        UserCustomPermission.permission_id == permission.id
-    ).first()
+        UserCustomPermission.permission_id == permission_id
+    ))).first()
     
     if not custom_perm:
         raise HTTPException(
@@ -543,8 +537,9 @@ async def remove_custom_permission(
             detail="Custom permission not found"
         )
     
-    db.delete(custom_perm)
-    db.commit()
+    await db.delete(custom_perm)
+    await db.commit()
+    invalidate_user_permissions(db.sync_session, user.id)
     
     return {
         "message": "Custom permission removed successfully",
@@ -554,43 +549,26 @@ async def remove_custom_permission(
     }
 
 
-@router.get("/permissions", dependencies=[Depends(RoleChecker(UserRole.ADMIN, UserRole.STAFF))])
-async def list_all_permissions(db: Session = Depends(get_db)):
+@router.get("/permissions", response_model=Dict[str, List[PermissionItem]], dependencies=[Depends(AsyncRoleChecker(UserRole.ADMIN, UserRole.STAFF))])
+async def list_all_permissions(db: AsyncSession = Depends(get_async_db)):
     """
     List all available permissions in the system
     Requires: admin or staff role
     """
-    permissions = db.query(Permission).all()
+    permissions = (await db.scalars(select(Permission))).all()
     
     # Group by resource
     by_resource = {}
     for perm in permissions:
-        if perm.resource not in by_resource:
-            by_resource[perm.resource] = []
-        by_resource[perm.resource].append({
-            "id": perm.id,
-            "name": perm.name,
-            "action": perm.action,
-            "description": perm.description
-        })
+        by_resource.setdefault(perm.resource, []).append(perm)
     
-    return by_resource
+    return json_response(PERMISSIONS_BY_RESOURCE.validate_python(by_resource), PERMISSIONS_BY_RESOURCE)
 
 
-@router.get("/roles", dependencies=[Depends(RoleChecker(UserRole.ADMIN, UserRole.STAFF))])
-async def list_roles():
+@router.get("/roles", dependencies=[Depends(AsyncRoleChecker(UserRole.ADMIN, UserRole.STAFF))])
+def list_roles():
     """
     List all available roles and their default permissions
     Requires: admin or staff role
     """
-    from ..core.rbac import ROLE_PERMISSIONS
-    
-    return {
-        "roles": [
-            {
-                "name": role.value,
-                "permissions": sorted(list(perms))
-            }
-            for role, perms in ROLE_PERMISSIONS.items()
-        ]
-    }
+    return _ROLES_RESPONSE
@@ -1,16 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, or_
+from sqlalchemy import and_, func, or_, insert
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel
 import logging
 
+from pydantic import TypeAdapter
+
 from ..core.database import get_db
-from ..core.security import get_current_user
+from ..core.responses import json_response
+from ..core.security import Principal, get_current_principal
 from ..models.models import (
     User, College, File as FileModel, Post, AIConversation, 
     IndexingTask, RewardPoint, Reward
 )
+from ..models.schemas import (
+    AIQuery, AIResponse, IndexRequest, IndexResponse, SearchResult,
+    KnowledgeSearchQuery, ContentRewriteRequest, ContentRewriteResponse, AIStatsResponse
+)
 from ..services.ai_service import get_ai_service
 
 # Set up logging
@@ -19,62 +25,13 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/ai", tags=["ai"])
 
-
-# Pydantic models for request/response
-class AIQuery(BaseModel):
-    question: str
-    context_filter: Optional[str] = None  # "files", "posts", "all"
-
-
-class AIResponse(BaseModel):
-    answer: str
-    sources: List[Dict[str, Any]]
-    conversation_id: int
-
-
-class IndexRequest(BaseModel):
-    content_type: str  # "file", "post", "all"
-    content_ids: Optional[List[int]] = None  # If None, index all
-
-
-class IndexResponse(BaseModel):
-    message: str
-    tasks_created: int
-
-
-class SearchResult(BaseModel):
-    doc_id: str
-    similarity: float
-    metadata: Dict[str, Any]
-
-
-class KnowledgeSearchQuery(BaseModel):
-    query: str
-    content_type: Optional[str] = None  # "file", "post", "college_info"
-    limit: int = 5
-
-
-class ContentRewriteRequest(BaseModel):
-    content: str
-    style: Optional[str] = "professional"  # "professional", "casual", "formal", "engaging"
-    tone: Optional[str] = "friendly"      # "friendly", "neutral", "enthusiastic", "informative"
-    max_length: Optional[int] = None      # Optional character limit
-
-
-class ContentRewriteResponse(BaseModel):
-    original_content: str
-    rewritten_content: str
-    style: str
-    tone: str
-    improvements: List[str]
-    word_count_before: int
-    word_count_after: int
+SEARCH_RESULTS = TypeAdapter(List[SearchResult])
 
 
 @router.post("/ask", response_model=AIResponse)
-async def ask_ai(
+def ask_ai(
     query: AIQuery,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """
@@ -154,9 +111,9 @@ async def ask_ai(
 
 
 @router.post("/search", response_model=List[SearchResult])
-async def search_knowledge(
+def search_knowledge(
     search_query: KnowledgeSearchQuery,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """
@@ -180,16 +137,8 @@ async def search_knowledge(
             top_k=search_query.limit
         )
         
-        # Format results
-        formatted_results = []
-        for result in results:
-            formatted_results.append(SearchResult(
-                doc_id=result["doc_id"],
-                similarity=result["similarity"],
-                metadata=result["metadata"]
-            ))
-        
-        return formatted_results
+        # Vector hits are validated and serialized as one list, not model by model
+        return json_response(SEARCH_RESULTS.validate_python(results), SEARCH_RESULTS)
     
     except Exception as e:
         logger.error(f"Error in knowledge search: {e}")
@@ -197,10 +146,10 @@ async def search_knowledge(
 
 
 @router.post("/index", response_model=IndexResponse)
-async def create_indexing_tasks(
+def create_indexing_tasks(
     index_request: IndexRequest,
     background_tasks: BackgroundTasks,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """
@@ -209,6 +158,7 @@ async def create_indexing_tasks(
     """
     try:
         tasks_created = 0
+        task_rows = []
         
         if index_request.content_type in ["file", "all"]:
             # Get files to index
@@ -231,13 +181,12 @@ async def create_indexing_tasks(
             
             for file in files:
                 # Create indexing task
-                task = IndexingTask(
-                    content_type="file",
-                    content_id=file.id,
-                    college_id=current_user.college_id,
-                    status="pending"
-                )
-                db.add(task)
+                task_rows.append({
+                    "content_type": "file",
+                    "content_id": file.id,
+                    "college_id": current_user.college_id,
+                    "status": "pending"
+                })
                 tasks_created += 1
                 
                 # Add background task
@@ -258,24 +207,25 @@ async def create_indexing_tasks(
             
             posts = post_query.all()
             
-            for post in posts:
-                # Check if already has indexing task
-                existing_task = db.query(IndexingTask).filter(
+            # Posts that already have an indexing task, fetched in one query
+            already_tasked = {
+                content_id for (content_id,) in db.query(IndexingTask.content_id).filter(
                     and_(
                         IndexingTask.content_type == "post",
-                        IndexingTask.content_id == post.id,
+                        IndexingTask.content_id.in_([post.id for post in posts]),
                         IndexingTask.status.in_(["pending", "processing", "completed"])
                     )
-                ).first()
-                
-                if not existing_task:
-                    task = IndexingTask(
-                        content_type="post",
-                        content_id=post.id,
-                        college_id=current_user.college_id,
-                        status="pending"
-                    )
-                    db.add(task)
+                )
+            }
+            
+            for post in posts:
+                if post.id not in already_tasked:
+                    task_rows.append({
+                        "content_type": "post",
+                        "content_id": post.id,
+                        "college_id": current_user.college_id,
+                        "status": "pending"
+                    })
                     tasks_created += 1
                     
                     # Add background task
@@ -293,6 +243,9 @@ async def create_indexing_tasks(
             )
             tasks_created += 1
         
+        # One multi-row INSERT for every task instead of a flush per object
+        if task_rows:
+            db.execute(insert(IndexingTask), task_rows)
         db.commit()
         
         return IndexResponse(
@@ -306,9 +259,9 @@ async def create_indexing_tasks(
 
 
 @router.get("/conversations")
-async def get_conversations(
+def get_conversations(
     limit: int = Query(20, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get user's recent AI conversations"""
@@ -322,7 +275,7 @@ async def get_conversations(
                 "id": conv.id,
                 "query": conv.query,
                 "response": conv.response,
-                "sources_count": len(conv.context_docs) if conv.context_docs else 0,
+                "sources_count": conv.sources_count,
                 "created_at": conv.created_at
             }
             for conv in conversations
@@ -331,9 +284,9 @@ async def get_conversations(
 
 
 @router.post("/rewrite", response_model=ContentRewriteResponse)
-async def rewrite_content(
+def rewrite_content(
     rewrite_request: ContentRewriteRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """
@@ -447,9 +400,9 @@ IMPROVEMENTS:
         raise HTTPException(status_code=500, detail=f"Rewrite error: {str(e)}")
 
 
-@router.get("/stats")
-async def get_ai_stats(
-    current_user: User = Depends(get_current_user),
+@router.get("/stats", response_model=AIStatsResponse)
+def get_ai_stats(
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get AI system statistics for the college"""
@@ -4,9 +4,12 @@ from sqlalchemy import and_, or_, desc
 from typing import Optional, List
 from datetime import datetime
 
+from ..core import utils
 from ..core.database import get_db
-from ..core.security import get_current_user
-from ..models.models import Alert, User, Post
+from ..core.responses import json_response
+from ..core.security import Principal, get_current_user, get_current_principal
+from ..models.loading import eager
+from ..models.models import Alert, User, Post, utc_now
 from ..models.schemas import (
     AlertCreate, AlertResponse, AlertUpdate, AlertListResponse,
     UserResponse
@@ -20,39 +23,15 @@ router = APIRouter(
 )
 
 
-def calculate_time_ago(created_at: datetime) -> str:
-    """Calculate human-readable time difference"""
-    now = datetime.utcnow()
-    diff = now - created_at
-    
-    if diff.days > 0:
-        return f"{diff.days} day{'s' if diff.days != 1 else ''} ago"
-    elif diff.seconds >= 3600:
-        hours = diff.seconds // 3600
-        return f"{hours} hour{'s' if hours != 1 else ''} ago"
-    elif diff.seconds >= 60:
-        minutes = diff.seconds // 60
-        return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-    else:
-        return "Just now"
-
-
-def is_alert_expired(expires_at: Optional[datetime]) -> bool:
-    """Check if alert has expired"""
-    if expires_at is None:
-        return False
-    return datetime.utcnow() > expires_at
-
-
 @router.get("/", response_model=AlertListResponse)
-async def get_user_alerts(
+def get_user_alerts(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     show_read: bool = Query(True, description="Include read alerts"),
     show_disabled: bool = Query(False, description="Include disabled alerts"),
     show_expired: bool = Query(False, description="Include expired alerts"),
     alert_type: Optional[str] = Query(None, description="Filter by alert type"),
-    current_user: UserResponse = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get alerts for the current user with pagination and filtering"""
@@ -86,6 +65,7 @@ async def get_user_alerts(
         .outerjoin(Post, Alert.post_id == Post.id)
         .filter(and_(*filters))
         .order_by(desc(Alert.created_at))
+        .options(*eager(Alert))
         .offset((page - 1) * page_size)
         .limit(page_size)
     )
@@ -93,8 +73,9 @@ async def get_user_alerts(
     alert_results = alerts_query.all()
     
     # Transform results
+    ages = utils.time_ago_batch([alert.created_at for alert, _, _ in alert_results])
     alerts = []
-    for alert, creator_name, post_title in alert_results:
+    for (alert, creator_name, post_title), age in zip(alert_results, ages):
         alert_dict = {
             "id": alert.id,
             "user_id": alert.user_id,
@@ -111,8 +92,7 @@ async def get_user_alerts(
             "updated_at": alert.updated_at,
             "creator_name": creator_name,
             "post_title": post_title,
-            "time_ago": calculate_time_ago(alert.created_at),
-            "is_expired": is_alert_expired(alert.expires_at)
+            "time_ago": age
         }
         alerts.append(AlertResponse(**alert_dict))
     
@@ -128,17 +108,17 @@ async def get_user_alerts(
     
     unread_count = db.query(Alert).filter(and_(*unread_filters)).count()
     
-    return AlertListResponse(
+    return json_response(AlertListResponse(
         alerts=alerts,
         total_count=total_count,
         unread_count=unread_count,
         page=page,
         page_size=page_size
-    )
+    ))
 
 
 @router.post("/", response_model=AlertResponse)
-async def create_alert(
+def create_alert(
     alert_data: AlertCreate,
     current_user: UserResponse = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -202,19 +182,17 @@ async def create_alert(
         "created_at": alert.created_at,
         "updated_at": alert.updated_at,
         "creator_name": creator_name,
-        "post_title": post_title,
-        "time_ago": calculate_time_ago(alert.created_at),
-        "is_expired": is_alert_expired(alert.expires_at)
+        "post_title": post_title
     }
     
     return AlertResponse(**alert_dict)
 
 
 @router.put("/{alert_id}", response_model=AlertResponse)
-async def update_alert(
+def update_alert(
     alert_id: int,
     alert_update: AlertUpdate,
-    current_user: UserResponse = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Update an alert (enable/disable, mark as read, etc.)"""
@@ -234,7 +212,7 @@ async def update_alert(
     for field, value in update_data.items():
         setattr(alert, field, value)
     
-    alert.updated_at = datetime.utcnow()
+    alert.updated_at = utc_now
     
     db.commit()
     db.refresh(alert)
@@ -264,18 +242,16 @@ async def update_alert(
         "created_at": alert.created_at,
         "updated_at": alert.updated_at,
         "creator_name": creator_name,
-        "post_title": post_title,
-        "time_ago": calculate_time_ago(alert.created_at),
-        "is_expired": is_alert_expired(alert.expires_at)
+        "post_title": post_title
     }
     
     return AlertResponse(**alert_dict)
 
 
 @router.delete("/{alert_id}")
-async def delete_alert(
+def delete_alert(
     alert_id: int,
-    current_user: UserResponse = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Delete an alert"""
@@ -297,8 +273,8 @@ async def delete_alert(
 
 
 @router.post("/mark-all-read")
-async def mark_all_alerts_read(
-    current_user: UserResponse = Depends(get_current_user),
+def mark_all_alerts_read(
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Mark all alerts as read for the current user"""
@@ -311,7 +287,7 @@ async def mark_all_alerts_read(
     
     for alert in alerts:
         alert.is_read = True
-        alert.updated_at = datetime.utcnow()
+        alert.updated_at = utc_now
     
     db.commit()
     
@@ -319,8 +295,8 @@ async def mark_all_alerts_read(
 
 
 @router.get("/unread-count")
-async def get_unread_count(
-    current_user: UserResponse = Depends(get_current_user),
+def get_unread_count(
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get count of unread alerts for the current user"""
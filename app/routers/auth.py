@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 from datetime import timedelta
 
 from ..core.database import get_db
@@ -16,7 +16,7 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 
 def authenticate_user(db: Session, username: str, password: str):
-    user = db.query(User).filter(User.username == username).first()
+    user = db.query(User).options(undefer(User.hashed_password)).filter(User.username == username).first()
     if not user:
         return False
     if not verify_password(password, user.hashed_password):
@@ -28,7 +28,7 @@ def authenticate_user(db: Session, username: str, password: str):
 
 
 @router.post("/login", response_model=Token)
-async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
+def login(login_data: LoginRequest, db: Session = Depends(get_db)):
     user = authenticate_user(db, login_data.username, login_data.password)
     if not user:
         raise HTTPException(
@@ -64,14 +64,14 @@ async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/logout")
-async def logout(current_user: User = Depends(get_current_user)):
+def logout(current_user: User = Depends(get_current_user)):
     # In a real implementation, you might want to blacklist the token
     # For now, we'll just return a success message
     return {"message": "Successfully logged out"}
 
 
 @router.get("/me")
-async def get_current_user_info(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+def get_current_user_info(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
     college = db.query(College).filter(College.id == current_user.college_id).first()
     permissions = list(get_user_permissions(current_user, db))
     
@@ -91,7 +91,7 @@ async def get_current_user_info(current_user: User = Depends(get_current_user),
     }
 
 @router.put("/update-password")
-async def update_password(
+def update_password(
     password_data: PasswordUpdateRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
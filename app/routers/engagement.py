@@ -1,13 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, func, exists
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import List
 
+from ..core import utils
 from ..core.database import get_db
-from ..core.utils import time_ago
+from ..core.responses import json_response
 from ..core.rbac import PermissionChecker
 from ..models.models import (
-    Post, PostLike, PostComment, PostIgnite, User, RewardPoint, PointTransaction
+    Post, PostLike, PostComment, PostIgnite, User, PointTransaction
 )
 from ..models.schemas import (
     CommentCreate, CommentResponse, CommentListResponse,
@@ -15,6 +17,8 @@ from ..models.schemas import (
     IgniteResponse, IgniteToggleResponse, IgniteListResponse
 )
 from ..routers.auth import get_current_user
+from ..core.security import Principal, get_current_principal
+from ..services.reward_pool import reward_pool_service
 
 router = APIRouter(prefix="/posts", tags=["engagement"])
 
@@ -22,7 +26,7 @@ router = APIRouter(prefix="/posts", tags=["engagement"])
 # ==================== COMMENTS ====================
 
 @router.post("/{post_id}/comments", response_model=CommentResponse)
-async def add_comment(
+def add_comment(
     post_id: int,
     comment_data: CommentCreate,
     current_user: User = Depends(get_current_user),
@@ -75,13 +79,12 @@ async def add_comment(
         created_at=comment.created_at,
         updated_at=comment.updated_at,
         user_name=current_user.full_name,
-        user_department=current_user.department,
-        time_ago=time_ago(comment.created_at)
+        user_department=current_user.department
     )
 
 
 @router.get("/{post_id}/comments", response_model=CommentListResponse)
-async def get_comments(
+def get_comments(
     post_id: int,
     page: int = 1,
     page_size: int = 20,
@@ -122,8 +125,9 @@ async def get_comments(
         desc(PostComment.created_at)
     ).offset(skip).limit(page_size).all()
     
+    ages = utils.time_ago_batch([comment.created_at for comment, _, _ in comments_query])
     comments = []
-    for comment, user_name, user_dept in comments_query:
+    for (comment, user_name, user_dept), age in zip(comments_query, ages):
         comments.append(CommentResponse(
             id=comment.id,
             post_id=comment.post_id,
@@ -133,19 +137,19 @@ async def get_comments(
             updated_at=comment.updated_at,
             user_name=user_name,
             user_department=user_dept,
-            time_ago=time_ago(comment.created_at)
+            time_ago=age
         ))
     
-    return CommentListResponse(
+    return json_response(CommentListResponse(
         comments=comments,
         total_count=total_count,
         page=page,
         page_size=page_size
-    )
+    ))
 
 
 @router.delete("/{post_id}/comments/{comment_id}")
-async def delete_comment(
+def delete_comment(
     post_id: int,
     comment_id: int,
     current_user: User = Depends(get_current_user),
@@ -183,7 +187,7 @@ async def delete_comment(
 # ==================== LIKES ====================
 
 @router.post("/{post_id}/like", response_model=LikeToggleResponse)
-async def toggle_like(
+def toggle_like(
     post_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -203,42 +207,42 @@ async def toggle_like(
             detail="Post not found"
         )
     
-    # Check if user already liked
-    existing_like = db.query(PostLike).filter(
+    # like_count is recounted in the background (services/post_counters.py), so the
+    # response reports the stored count adjusted by this click
+    like_count = post.like_count
+    
+    # Unlike if a like exists (the DELETE doubles as the existence check)
+    unliked = db.query(PostLike).filter(
         PostLike.post_id == post_id,
         PostLike.user_id == current_user.id
-    ).first()
+    ).delete(synchronize_session=False)
     
-    if existing_like:
-        # Unlike
-        db.delete(existing_like)
+    if unliked:
         db.commit()
-        db.refresh(post)
         
         return LikeToggleResponse(
             success=True,
             action="unliked",
-            like_count=post.like_count
+            like_count=max(like_count - 1, 0)
         )
     else:
-        # Like
-        new_like = PostLike(
-            post_id=post_id,
-            user_id=current_user.id
+        # Like; unique_post_like turns a concurrent duplicate click into a no-op
+        result = db.execute(
+            pg_insert(PostLike)
+            .values(post_id=post_id, user_id=current_user.id)
+            .on_conflict_do_nothing(index_elements=["post_id", "user_id"])
         )
-        db.add(new_like)
         db.commit()
-        db.refresh(post)
         
         return LikeToggleResponse(
             success=True,
             action="liked",
-            like_count=post.like_count
+            like_count=like_count + result.rowcount
         )
 
 
 @router.get("/{post_id}/likes", response_model=LikeListResponse)
-async def get_likes(
+def get_likes(
     post_id: int,
     page: int = 1,
     page_size: int = 20,
@@ -290,18 +294,18 @@ async def get_likes(
             user_department=user_dept
         ))
     
-    return LikeListResponse(
+    return json_response(LikeListResponse(
         likes=likes,
         total_count=total_count,
         page=page,
         page_size=page_size
-    )
+    ))
 
 
 @router.get("/{post_id}/is-liked")
-async def check_if_liked(
+def check_if_liked(
     post_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Check if current user has liked a post"""
@@ -317,7 +321,7 @@ async def check_if_liked(
 # ==================== IGNITE ====================
 
 @router.post("/{post_id}/ignite", response_model=IgniteToggleResponse)
-async def toggle_ignite(
+def toggle_ignite(
     post_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -348,6 +352,9 @@ async def toggle_ignite(
             detail="You cannot ignite your own post"
         )
     
+    # ignite_count is recounted in the background, like like_count
+    ignite_count = post.ignite_count
+    
     # Check if user already ignited
     existing_ignite = db.query(PostIgnite).filter(
         PostIgnite.post_id == post_id,
@@ -357,34 +364,11 @@ async def toggle_ignite(
     if existing_ignite:
         # Un-ignite (refund)
         try:
-            # Get or create user's reward points
-            user_points = db.query(RewardPoint).filter(
-                RewardPoint.user_id == current_user.id
-            ).first()
-            
-            if not user_points:
-                user_points = RewardPoint(user_id=current_user.id, total_points=0)
-                db.add(user_points)
-            
-            # Get or create author's reward points
-            author_points = db.query(RewardPoint).filter(
-                RewardPoint.user_id == post.author_id
-            ).first()
-            
-            if not author_points:
-                author_points = RewardPoint(user_id=post.author_id, total_points=0)
-                db.add(author_points)
-            
-            # Refund points
-            user_points.total_points += 1
-            author_points.total_points = max(0, author_points.total_points - 1)
-            
-            # Create transaction records
+            # Refund points; the point_transactions trigger applies each record to reward_points
             user_transaction = PointTransaction(
                 user_id=current_user.id,
                 transaction_type="REFUNDED",
                 points=1,
-                balance_after=user_points.total_points,
                 description=f"Refund: Removed ignite from post '{post.title[:50]}'",
                 reference_type="ignite",
                 reference_id=post_id,
@@ -395,7 +379,6 @@ async def toggle_ignite(
                 user_id=post.author_id,
                 transaction_type="DEDUCTED",
                 points=-1,
-                balance_after=author_points.total_points,
                 description=f"Ignite removed from your post '{post.title[:50]}'",
                 reference_type="ignite",
                 reference_id=post_id,
@@ -408,12 +391,11 @@ async def toggle_ignite(
             # Delete ignite
             db.delete(existing_ignite)
             db.commit()
-            db.refresh(post)
             
             return IgniteToggleResponse(
                 success=True,
                 action="removed",
-                ignite_count=post.ignite_count,
+                ignite_count=max(ignite_count - 1, 0),
                 points_transferred=-1
             )
         except Exception as e:
@@ -425,59 +407,31 @@ async def toggle_ignite(
     else:
         # Ignite (deduct from user, add to author)
         try:
-            # Get or create user's reward points
-            user_points = db.query(RewardPoint).filter(
-                RewardPoint.user_id == current_user.id
-            ).first()
-            
-            if not user_points:
-                user_points = RewardPoint(user_id=current_user.id, total_points=0)
-                db.add(user_points)
-            
-            # Check if user has enough points
-            if user_points.total_points < 1:
+            # Transfer points; the spend is rejected unless the user has at least 1 point
+            if not reward_pool_service.spend_points(
+                db,
+                user_id=current_user.id,
+                college_id=current_user.college_id,
+                points=1,
+                description=f"Ignited post '{post.title[:50]}'",
+                reference_type="ignite",
+                reference_id=post_id
+            ):
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Insufficient points. You need at least 1 point to ignite a post."
                 )
             
-            # Get or create author's reward points
-            author_points = db.query(RewardPoint).filter(
-                RewardPoint.user_id == post.author_id
-            ).first()
-            
-            if not author_points:
-                author_points = RewardPoint(user_id=post.author_id, total_points=0)
-                db.add(author_points)
-            
-            # Transfer points
-            user_points.total_points -= 1
-            author_points.total_points += 1
-            
-            # Create transaction records
-            user_transaction = PointTransaction(
-                user_id=current_user.id,
-                transaction_type="SPENT",
-                points=-1,
-                balance_after=user_points.total_points,
-                description=f"Ignited post '{post.title[:50]}'",
-                reference_type="ignite",
-                reference_id=post_id,
-                college_id=current_user.college_id
-            )
-            
             author_transaction = PointTransaction(
                 user_id=post.author_id,
                 transaction_type="EARNED",
                 points=1,
-                balance_after=author_points.total_points,
                 description=f"Received ignite on your post '{post.title[:50]}'",
                 reference_type="ignite",
                 reference_id=post_id,
                 college_id=current_user.college_id
             )
             
-            db.add(user_transaction)
             db.add(author_transaction)
             
             # Create ignite
@@ -489,12 +443,11 @@ async def toggle_ignite(
             
             db.add(new_ignite)
             db.commit()
-            db.refresh(post)
             
             return IgniteToggleResponse(
                 success=True,
                 action="ignited",
-                ignite_count=post.ignite_count,
+                ignite_count=ignite_count + 1,
                 points_transferred=1
             )
         except HTTPException:
@@ -509,7 +462,7 @@ async def toggle_ignite(
 
 
 @router.get("/{post_id}/ignites", response_model=IgniteListResponse)
-async def get_ignites(
+def get_ignites(
     post_id: int,
     page: int = 1,
     page_size: int = 20,
@@ -561,18 +514,18 @@ async def get_ignites(
             receiver_name=receiver.full_name if receiver else "Unknown"
         ))
     
-    return IgniteListResponse(
+    return json_response(IgniteListResponse(
         ignites=ignites,
         total_count=total_count,
         page=page,
         page_size=page_size
-    )
+    ))
 
 
 @router.get("/{post_id}/is-ignited")
-async def check_if_ignited(
+def check_if_ignited(
     post_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Check if current user has ignited a post"""
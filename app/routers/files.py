@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query, BackgroundTasks
 from fastapi.responses import FileResponse as FastAPIFileResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, func, exists
 from typing import Optional, List, Dict
 import os
 import uuid
@@ -9,12 +9,15 @@ import mimetypes
 from pathlib import Path
 
 from ..core.database import get_db
-from ..core.security import get_current_user
+from ..core.responses import json_response
+from ..core.security import Principal, get_current_user, get_current_principal
 from ..core.rbac import PermissionChecker, has_permission
-from ..models.models import File as FileModel, User, College, FileType as FileTypeEnum, IndexingTask
+from ..models.loading import eager
+from ..models.models import File as FileModel, Folder, User, College, FileType as FileTypeEnum, IndexingTask
 from ..models.schemas import (
     FileUploadResponse, FileResponse, FileUpdate, FileListResponse, 
-    FileSearchQuery, FileType, FolderCreate, FolderItem, FolderContentsResponse
+    FileSearchQuery, FileType, FolderCreate, FolderItem, FolderContentsResponse,
+    Breadcrumb
 )
 
 router = APIRouter(prefix="/files", tags=["files"])
@@ -72,9 +75,9 @@ def get_parent_path(folder_path: str) -> Optional[str]:
     return parent if parent else "/"
 
 
-def create_breadcrumbs(folder_path: str) -> List[Dict[str, str]]:
+def create_breadcrumbs(folder_path: str) -> List[Breadcrumb]:
     """Create breadcrumb navigation from folder path"""
-    breadcrumbs = [{"name": "Home", "path": "/"}]
+    breadcrumbs = [Breadcrumb(name="Home", path="/")]
     
     if folder_path == "/":
         return breadcrumbs
@@ -85,11 +88,16 @@ def create_breadcrumbs(folder_path: str) -> List[Dict[str, str]]:
     
     for part in parts:
         current_path += "/" + part
-        breadcrumbs.append({"name": part, "path": normalize_folder_path(current_path)})
+        breadcrumbs.append(Breadcrumb(name=part, path=normalize_folder_path(current_path)))
     
     return breadcrumbs
 
 
+def file_metadata(file: FileModel) -> Dict:
+    """upload_metadata as returned by the API, with the counter columns folded in"""
+    return {**(file.upload_metadata or {}), "views": file.view_count, "downloads": file.download_count}
+
+
 def get_file_type(filename: str, mime_type: str) -> FileTypeEnum:
     """Determine file type based on extension and MIME type"""
     ext = Path(filename).suffix.lower()
@@ -185,22 +193,43 @@ async def upload_file(
         mime_type=mime_type,
         description=description,
         folder_path=folder_path,
-        is_folder=False,
         department=current_user.department,
         college_id=current_user.college_id,
-        uploaded_by=current_user.id,
-        upload_metadata={"downloads": 0, "views": 0}
+        uploaded_by=current_user.id
     )
     
     db.add(db_file)
+    # Build the response from the flushed row (the INSERT returns the server-side columns);
+    # after commit it would be expired and re-SELECTed
+    db.flush()
+    file_id = db_file.id
+    
+    # Get additional info for response
+    college = db.query(College).filter(College.id == current_user.college_id).first()
+    
+    response = FileUploadResponse(
+        id=db_file.id,
+        filename=db_file.filename,
+        original_filename=db_file.original_filename,
+        file_size=db_file.file_size,
+        file_type=db_file.file_type,
+        mime_type=db_file.mime_type,
+        department=db_file.department,
+        college_id=db_file.college_id,
+        uploaded_by=db_file.uploaded_by,
+        upload_metadata=file_metadata(db_file),
+        created_at=db_file.created_at,
+        folder_path=db_file.folder_path,
+        uploader_name=current_user.full_name,
+        college_name=college.name if college else "Unknown"
+    )
     db.commit()
-    db.refresh(db_file)
     
     # Create indexing task for AI
     try:
         indexing_task = IndexingTask(
             content_type="file",
-            content_id=db_file.id,
+            content_id=file_id,
             college_id=current_user.college_id,
             status="pending"
         )
@@ -211,39 +240,20 @@ async def upload_file(
         from .ai import process_file_indexing
         background_tasks.add_task(
             process_file_indexing,
-            db_file.id,
+            file_id,
             current_user.college_id
         )
     except Exception as e:
         # Log error but don't fail upload
-        print(f"Error creating indexing task for file {db_file.id}: {e}")
-    
-    # Get additional info for response
-    college = db.query(College).filter(College.id == current_user.college_id).first()
+        print(f"Error creating indexing task for file {file_id}: {e}")
     
-    return FileUploadResponse(
-        id=db_file.id,
-        filename=db_file.filename,
-        original_filename=db_file.original_filename,
-        file_size=db_file.file_size,
-        file_type=db_file.file_type,
-        mime_type=db_file.mime_type,
-        department=db_file.department,
-        college_id=db_file.college_id,
-        uploaded_by=db_file.uploaded_by,
-        upload_metadata=db_file.upload_metadata,
-        created_at=db_file.created_at,
-        folder_path=db_file.folder_path,
-        is_folder=db_file.is_folder,
-        uploader_name=current_user.full_name,
-        college_name=college.name if college else "Unknown"
-    )
+    return response
 
 
 # ==================== FOLDER MANAGEMENT ====================
 
 @router.post("/folders/create")
-async def create_folder(
+def create_folder(
     folder_data: FolderCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -262,33 +272,35 @@ async def create_folder(
     new_folder_path = normalize_folder_path(f"{parent_path}/{folder_name}")
     
     # Check if folder already exists
-    existing_folder = db.query(FileModel).filter(
+    folder_exists = db.query(exists().where(
         and_(
-            FileModel.folder_path == new_folder_path,
-            FileModel.is_folder == True,
-            FileModel.college_id == current_user.college_id,
-            FileModel.department == current_user.department
+            Folder.path == new_folder_path,
+            Folder.college_id == current_user.college_id,
+            Folder.department == current_user.department
         )
-    ).first()
+    )).scalar()
     
-    if existing_folder:
+    if folder_exists:
         raise HTTPException(status_code=400, detail="Folder already exists")
     
+    # Link to the parent folder when it has a row (files can be uploaded to any path)
+    parent = db.query(Folder.id).filter(
+        and_(
+            Folder.path == parent_path,
+            Folder.college_id == current_user.college_id,
+            Folder.department == current_user.department
+        )
+    ).first()
+    
     # Create folder entry in database
-    folder = FileModel(
-        filename=folder_name,
-        original_filename=folder_name,
-        file_path="",  # Folders don't have physical paths
-        file_size=0,
-        file_type=FileTypeEnum.OTHER,
-        mime_type="application/x-directory",
+    folder = Folder(
+        name=folder_name,
+        path=new_folder_path,
+        parent_id=parent.id if parent else None,
         description=folder_data.description,
-        folder_path=new_folder_path,
-        is_folder=True,
         department=current_user.department,
         college_id=current_user.college_id,
-        uploaded_by=current_user.id,
-        upload_metadata={"file_count": 0}
+        created_by=current_user.id
     )
     
     db.add(folder)
@@ -304,7 +316,7 @@ async def create_folder(
 
 
 @router.get("/folders/browse")
-async def browse_folder(
+def browse_folder(
     folder_path: str = Query("/", description="Folder path to browse"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -315,37 +327,21 @@ async def browse_folder(
     # Normalize the folder path
     folder_path = normalize_folder_path(folder_path)
     
-    # Get all folders at this level
-    folders = db.query(FileModel).filter(
+    # Direct children only: exactly one more path segment below folder_path
+    child_prefix = "/" if folder_path == "/" else folder_path + "/"
+    direct_folders = db.query(Folder).filter(
         and_(
-            FileModel.college_id == current_user.college_id,
-            FileModel.is_folder == True,
-            FileModel.folder_path.like(f"{folder_path}%") if folder_path != "/" else True
+            Folder.college_id == current_user.college_id,
+            Folder.path.like(f"{child_prefix}%"),
+            ~Folder.path.like(f"{child_prefix}%/%")
         )
     ).all()
     
-    # Filter to get only direct children folders
-    direct_folders = []
-    for folder in folders:
-        # For root, check if folder path has only one level
-        if folder_path == "/":
-            # Count slashes - should be exactly 1 for direct children of root
-            if folder.folder_path.count("/") == 1 and folder.folder_path != "/":
-                direct_folders.append(folder)
-        else:
-            # For non-root, check if it starts with current path and is one level deep
-            if folder.folder_path.startswith(folder_path + "/"):
-                # Remove the current path and check for only one level
-                relative_path = folder.folder_path[len(folder_path)+1:]
-                if "/" not in relative_path:
-                    direct_folders.append(folder)
-    
     # Get all files in this exact folder
     files_query = db.query(FileModel).filter(
         and_(
             FileModel.college_id == current_user.college_id,
-            FileModel.folder_path == folder_path,
-            FileModel.is_folder == False
+            FileModel.folder_path == folder_path
         )
     ).order_by(FileModel.created_at.desc())
     
@@ -358,17 +354,16 @@ async def browse_folder(
         file_count = db.query(FileModel).filter(
             and_(
                 FileModel.college_id == current_user.college_id,
-                FileModel.folder_path.like(f"{folder.folder_path}%"),
-                FileModel.is_folder == False
+                FileModel.folder_path.like(f"{folder.path}%")
             )
         ).count()
         
-        uploader = db.query(User).filter(User.id == folder.uploaded_by).first()
+        uploader = db.query(User).filter(User.id == folder.created_by).first()
         
         folder_items.append(FolderItem(
             id=folder.id,
-            name=folder.filename,
-            path=folder.folder_path,
+            name=folder.name,
+            path=folder.path,
             is_folder=True,
             file_type=None,
             file_size=0,
@@ -415,10 +410,10 @@ async def browse_folder(
 
 
 @router.delete("/folders/delete")
-async def delete_folder(
+def delete_folder(
     folder_path: str = Query(..., description="Folder path to delete"),
     recursive: bool = Query(False, description="Delete folder and all contents"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Delete a folder (optionally with all contents)"""
@@ -429,11 +424,10 @@ async def delete_folder(
         raise HTTPException(status_code=400, detail="Cannot delete root folder")
     
     # Find the folder
-    folder = db.query(FileModel).filter(
+    folder = db.query(Folder).filter(
         and_(
-            FileModel.folder_path == folder_path,
-            FileModel.is_folder == True,
-            FileModel.college_id == current_user.college_id
+            Folder.path == folder_path,
+            Folder.college_id == current_user.college_id
         )
     ).first()
     
@@ -441,24 +435,22 @@ async def delete_folder(
         raise HTTPException(status_code=404, detail="Folder not found")
     
     # Check if user is the creator
-    if folder.uploaded_by != current_user.id:
+    if folder.created_by != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to delete this folder")
     
     # Count files in folder
     files_in_folder = db.query(FileModel).filter(
         and_(
             FileModel.college_id == current_user.college_id,
-            FileModel.folder_path.like(f"{folder_path}%"),
-            FileModel.is_folder == False
+            FileModel.folder_path.like(f"{folder_path}%")
         )
     ).count()
     
     # Count subfolders
-    subfolders = db.query(FileModel).filter(
+    subfolders = db.query(Folder).filter(
         and_(
-            FileModel.college_id == current_user.college_id,
-            FileModel.folder_path.like(f"{folder_path}/%"),
-            FileModel.is_folder == True
+            Folder.college_id == current_user.college_id,
+            Folder.path.like(f"{folder_path}/%")
         )
     ).count()
     
@@ -473,8 +465,7 @@ async def delete_folder(
         files_to_delete = db.query(FileModel).filter(
             and_(
                 FileModel.college_id == current_user.college_id,
-                FileModel.folder_path.like(f"{folder_path}%"),
-                FileModel.is_folder == False
+                FileModel.folder_path.like(f"{folder_path}%")
             )
         ).all()
         
@@ -487,11 +478,10 @@ async def delete_folder(
                 print(f"Error deleting file {file.file_path}: {e}")
         
         # Delete all subfolders
-        db.query(FileModel).filter(
+        db.query(Folder).filter(
             and_(
-                FileModel.college_id == current_user.college_id,
-                FileModel.folder_path.like(f"{folder_path}/%"),
-                FileModel.is_folder == True
+                Folder.college_id == current_user.college_id,
+                Folder.path.like(f"{folder_path}/%")
             )
         ).delete(synchronize_session=False)
         
@@ -499,8 +489,7 @@ async def delete_folder(
         db.query(FileModel).filter(
             and_(
                 FileModel.college_id == current_user.college_id,
-                FileModel.folder_path.like(f"{folder_path}%"),
-                FileModel.is_folder == False
+                FileModel.folder_path.like(f"{folder_path}%")
             )
         ).delete(synchronize_session=False)
     
@@ -516,10 +505,10 @@ async def delete_folder(
 
 
 @router.put("/folders/move")
-async def move_folder(
+def move_folder(
     source_path: str = Query(..., description="Source folder path"),
     destination_path: str = Query(..., description="Destination parent folder path"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Move a folder to a different location"""
@@ -531,11 +520,10 @@ async def move_folder(
         raise HTTPException(status_code=400, detail="Cannot move root folder")
     
     # Find source folder
-    folder = db.query(FileModel).filter(
+    folder = db.query(Folder).filter(
         and_(
-            FileModel.folder_path == source_path,
-            FileModel.is_folder == True,
-            FileModel.college_id == current_user.college_id
+            Folder.path == source_path,
+            Folder.college_id == current_user.college_id
         )
     ).first()
     
@@ -543,7 +531,7 @@ async def move_folder(
         raise HTTPException(status_code=404, detail="Source folder not found")
     
     # Check permissions
-    if folder.uploaded_by != current_user.id:
+    if folder.created_by != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to move this folder")
     
     # Create new path
@@ -551,31 +539,50 @@ async def move_folder(
     new_path = normalize_folder_path(f"{destination_path}/{folder_name}")
     
     # Check if destination already exists
-    existing = db.query(FileModel).filter(
+    destination_exists = db.query(exists().where(
         and_(
-            FileModel.folder_path == new_path,
-            FileModel.is_folder == True,
-            FileModel.college_id == current_user.college_id
+            Folder.path == new_path,
+            Folder.college_id == current_user.college_id
         )
-    ).first()
+    )).scalar()
     
-    if existing:
+    if destination_exists:
         raise HTTPException(status_code=400, detail="Destination folder already exists")
     
+    # Re-parent under the destination folder's row, if it has one
+    new_parent = db.query(Folder.id).filter(
+        and_(
+            Folder.path == destination_path,
+            Folder.college_id == current_user.college_id,
+            Folder.department == folder.department
+        )
+    ).first()
+    
     # Update folder path
-    old_path = folder.folder_path
-    folder.folder_path = new_path
+    old_path = folder.path
+    folder.path = new_path
+    folder.parent_id = new_parent.id if new_parent else None
+    
+    # Update all subfolders and files in this folder
+    subfolders = db.query(Folder).filter(
+        and_(
+            Folder.college_id == current_user.college_id,
+            Folder.path.like(f"{old_path}/%")
+        )
+    ).all()
     
-    # Update all files and subfolders in this folder
-    files_and_folders = db.query(FileModel).filter(
+    for subfolder in subfolders:
+        subfolder.path = subfolder.path.replace(old_path, new_path, 1)
+    
+    files = db.query(FileModel).filter(
         and_(
             FileModel.college_id == current_user.college_id,
             FileModel.folder_path.like(f"{old_path}%")
         )
     ).all()
     
-    for item in files_and_folders:
-        item.folder_path = item.folder_path.replace(old_path, new_path, 1)
+    for file in files:
+        file.folder_path = file.folder_path.replace(old_path, new_path, 1)
     
     db.commit()
     
@@ -583,12 +590,12 @@ async def move_folder(
         "message": "Folder moved successfully",
         "old_path": old_path,
         "new_path": new_path,
-        "items_updated": len(files_and_folders)
+        "items_updated": 1 + len(subfolders) + len(files)
     }
 
 
 @router.get("/", response_model=FileListResponse)
-async def get_files(
+def get_files(
     department: Optional[str] = Query(None, description="Filter by department"),
     file_type: Optional[FileType] = Query(None, description="Filter by file type"),
     search_term: Optional[str] = Query(None, description="Search in filename and description"),
@@ -601,12 +608,9 @@ async def get_files(
 ):
     """Get files with filtering and pagination (college-specific)"""
     
-    # Base query - only files from user's college (exclude folders)
+    # Base query - only files from user's college
     query = db.query(FileModel).filter(
-        and_(
-            FileModel.college_id == current_user.college_id,
-            FileModel.is_folder == False
-        )
+        FileModel.college_id == current_user.college_id
     )
     
     # Apply filters
@@ -614,9 +618,7 @@ async def get_files(
         query = query.filter(FileModel.department == department)
     
     if file_type:
-        # Convert string enum to database enum
-        file_type_enum = FileTypeEnum(file_type.value)
-        query = query.filter(FileModel.file_type == file_type_enum)
+        query = query.filter(FileModel.file_type == file_type)
     
     if folder_path:
         # Normalize and filter by folder path
@@ -624,24 +626,23 @@ async def get_files(
         query = query.filter(FileModel.folder_path == folder_path)
     
     if search_term:
-        search_filter = or_(
-            FileModel.original_filename.ilike(f"%{search_term}%"),
-            FileModel.description.ilike(f"%{search_term}%")
+        # Word search over the stored tsvector (GIN-indexed) instead of '%term%' scans
+        query = query.filter(
+            FileModel.search_tsv.op("@@")(func.plainto_tsquery("english", search_term))
         )
-        query = query.filter(search_filter)
     
     # Get total count before pagination
     total_count = query.count()
     
     # Apply pagination
     offset = (page - 1) * page_size
-    files = query.order_by(FileModel.created_at.desc()).offset(offset).limit(page_size).all()
+    files = query.order_by(FileModel.created_at.desc()).options(*eager(FileModel)).offset(offset).limit(page_size).all()
     
     # Build response with additional info
     file_responses = []
     for file in files:
-        uploader = db.query(User).filter(User.id == file.uploaded_by).first()
-        college = db.query(College).filter(College.id == file.college_id).first()
+        uploader = file.uploader
+        college = file.college
         
         file_responses.append(FileResponse(
             id=file.id,
@@ -654,27 +655,26 @@ async def get_files(
             department=file.department,
             college_id=file.college_id,
             uploaded_by=file.uploaded_by,
-            upload_metadata=file.upload_metadata,
+            upload_metadata=file_metadata(file),
             created_at=file.created_at,
             updated_at=file.updated_at,
             folder_path=file.folder_path,
-            is_folder=file.is_folder,
             uploader_name=uploader.full_name if uploader else "Unknown",
             college_name=college.name if college else "Unknown"
         ))
     
-    return FileListResponse(
+    return json_response(FileListResponse(
         files=file_responses,
         total_count=total_count,
         page=page,
         page_size=page_size
-    )
+    ))
 
 
 @router.get("/{file_id}", response_model=FileResponse)
-async def get_file_details(
+def get_file_details(
     file_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get detailed information about a specific file"""
@@ -690,10 +690,8 @@ async def get_file_details(
     if not file:
         raise HTTPException(status_code=404, detail="File not found")
     
-    # Increment view count
-    metadata = file.upload_metadata.copy()
-    metadata["views"] = metadata.get("views", 0) + 1
-    file.upload_metadata = metadata
+    # Increment view count (atomic SET view_count = view_count + 1)
+    file.view_count = FileModel.view_count + 1
     db.commit()
     
     # Get additional info
@@ -711,7 +709,7 @@ async def get_file_details(
         department=file.department,
         college_id=file.college_id,
         uploaded_by=file.uploaded_by,
-        upload_metadata=file.upload_metadata,
+        upload_metadata=file_metadata(file),
         created_at=file.created_at,
         updated_at=file.updated_at,
         uploader_name=uploader.full_name if uploader else "Unknown",
@@ -720,9 +718,9 @@ async def get_file_details(
 
 
 @router.get("/{file_id}/download")
-async def download_file(
+def download_file(
     file_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Download a file"""
@@ -743,9 +741,7 @@ async def download_file(
         raise HTTPException(status_code=404, detail="File not found on disk")
     
     # Increment download count
-    metadata = file.upload_metadata.copy()
-    metadata["downloads"] = metadata.get("downloads", 0) + 1
-    file.upload_metadata = metadata
+    file.download_count = FileModel.download_count + 1
     db.commit()
     
     return FastAPIFileResponse(
@@ -756,9 +752,9 @@ async def download_file(
 
 
 @router.get("/{file_id}/view")
-async def view_file(
+def view_file(
     file_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """View/serve a file directly (for images, videos, etc.) - authenticated access"""
@@ -779,9 +775,7 @@ async def view_file(
         raise HTTPException(status_code=404, detail="File not found on disk")
     
     # Increment view count (separate from downloads)
-    metadata = file.upload_metadata.copy()
-    metadata["views"] = metadata.get("views", 0) + 1
-    file.upload_metadata = metadata
+    file.view_count = FileModel.view_count + 1
     db.commit()
     
     return FastAPIFileResponse(
@@ -794,7 +788,7 @@ async def view_file(
 
 
 @router.put("/{file_id}", response_model=FileResponse)
-async def update_file(
+def update_file(
     file_id: int,
     file_update: FileUpdate,
     current_user: User = Depends(get_current_user),
@@ -844,7 +838,7 @@ async def update_file(
         department=file.department,
         college_id=file.college_id,
         uploaded_by=file.uploaded_by,
-        upload_metadata=file.upload_metadata,
+        upload_metadata=file_metadata(file),
         created_at=file.created_at,
         updated_at=file.updated_at,
         uploader_name=uploader.full_name if uploader else "Unknown",
@@ -853,7 +847,7 @@ async def update_file(
 
 
 @router.delete("/{file_id}")
-async def delete_file(
+def delete_file(
     file_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -897,8 +891,8 @@ async def delete_file(
 
 
 @router.get("/departments/list")
-async def get_departments(
-    current_user: User = Depends(get_current_user),
+def get_departments(
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get list of departments that have uploaded files in the user's college"""
@@ -911,8 +905,8 @@ async def get_departments(
 
 
 @router.get("/stats/summary")
-async def get_file_stats(
-    current_user: User = Depends(get_current_user),
+def get_file_stats(
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get file statistics for the user's college"""
@@ -962,7 +956,7 @@ async def get_file_stats(
 async def upload_post_image(
     file: UploadFile = File(...),
     folder_path: Optional[str] = Form("/posts"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Upload an image for posts (authenticated upload, but public access to view)"""
@@ -1020,11 +1014,10 @@ async def upload_post_image(
         mime_type=mime_type,
         description="Post image",
         folder_path=folder_path,
-        is_folder=False,
         department="posts",  # Special department for post images
         college_id=current_user.college_id,
         uploaded_by=current_user.id,
-        upload_metadata={"type": "post_image", "public": True, "views": 0}
+        upload_metadata={"type": "post_image", "public": True}
     )
     
     db.add(db_file)
@@ -1048,7 +1041,7 @@ async def upload_post_image(
 
 
 @router.get("/posts/image/{filename}")
-async def serve_post_image(filename: str):
+def serve_post_image(filename: str):
     """Serve post images publicly (NO authentication required)"""
     
     # Construct file path
@@ -1068,9 +1061,9 @@ async def serve_post_image(filename: str):
 
 
 @router.delete("/posts/image/{filename}")
-async def delete_post_image(
+def delete_post_image(
     filename: str,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Delete a post image (authenticated - only by uploader)"""
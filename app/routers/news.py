@@ -5,7 +5,7 @@ import asyncio
 from datetime import datetime, timedelta
 import json
 from ..core.config import settings
-from ..core.security import get_current_user
+from ..core.security import Principal, get_current_principal
 from ..models.models import User
 
 router = APIRouter(
@@ -181,7 +181,7 @@ async def get_cached_news() -> List[Dict[str, Any]]:
 
 
 @router.get("/tech-headlines", response_model=Dict[str, Any])
-async def get_tech_news(current_user: User = Depends(get_current_user)):
+async def get_tech_news(current_user: Principal = Depends(get_current_principal)):
     """
     Get top technology news headlines with focus on AI, technology, and Indian colleges.
     
@@ -215,7 +215,7 @@ async def get_tech_news(current_user: User = Depends(get_current_user)):
 
 
 @router.get("/cache-status")
-async def get_cache_status(current_user: User = Depends(get_current_user)):
+def get_cache_status(current_user: Principal = Depends(get_current_principal)):
     """Get current cache status and information"""
     return {
         "cache_valid": is_cache_valid(),
@@ -228,7 +228,7 @@ async def get_cache_status(current_user: User = Depends(get_current_user)):
 
 
 @router.post("/refresh-cache")
-async def refresh_news_cache(current_user: User = Depends(get_current_user)):
+async def refresh_news_cache(current_user: Principal = Depends(get_current_principal)):
     """Manually refresh the news cache (admin function)"""
     try:
         fresh_data = await fetch_tech_news_from_api()
@@ -24,7 +24,7 @@ router = APIRouter(prefix="/pool", tags=["reward-pool"])
 
 
 @router.get("/balance", response_model=PoolBalanceResponse)
-async def get_pool_balance(
+def get_pool_balance(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     _: None = Depends(RoleChecker(UserRole.ADMIN, UserRole.STAFF))
@@ -51,7 +51,7 @@ async def get_pool_balance(
 
 
 @router.post("/credit", response_model=PoolTransactionResponse)
-async def credit_pool(
+def credit_pool(
     credit_request: PoolCreditRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -103,7 +103,7 @@ async def credit_pool(
 
 
 @router.get("/transactions", response_model=List[PoolTransactionResponse])
-async def get_pool_transactions(
+def get_pool_transactions(
     page: int = 1,
     page_size: int = 50,
     transaction_type: str = None,  # CREDIT or DEBIT
@@ -168,7 +168,7 @@ async def get_pool_transactions(
 
 
 @router.get("/analytics", response_model=PoolAnalyticsResponse)
-async def get_pool_analytics(
+def get_pool_analytics(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     _: None = Depends(RoleChecker(UserRole.ADMIN, UserRole.STAFF))
@@ -1,12 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, case, exists
+from sqlalchemy import desc, case, exists, update
 from typing import List
 from datetime import datetime
+from pydantic import TypeAdapter
 
+from ..core import utils
 from ..core.database import get_db
-from ..core.utils import time_ago
+from ..core.responses import json_response
 from ..core.rbac import PermissionChecker, has_permission
+from ..models.loading import eager
 from ..models.models import Post, User, PostType, IndexingTask, Alert, PostLike, PostIgnite, RewardPoint, PointTransaction
 from ..models.schemas import (
     PostCreate, PostResponse, PostUpdate, PostMetadataUpdate, 
@@ -18,6 +21,20 @@ from ..services.reward_pool import reward_pool_service
 
 router = APIRouter(prefix="/posts", tags=["posts"])
 
+# Serializers for the feed lists, built once
+POST_LIST = TypeAdapter(List[PostResponse])
+POST_ENGAGEMENT_LIST = TypeAdapter(List[PostEngagementResponse])
+
+
+def post_metadata(post: Post) -> dict:
+    """post_metadata as returned by the API, with the counter columns folded in"""
+    return {
+        **(post.post_metadata or {}),
+        "likes": post.like_count,
+        "comments": post.comment_count,
+        "shares": post.share_count
+    }
+
 
 @router.post("/", response_model=PostResponse)
 async def create_post(
@@ -46,13 +63,31 @@ async def create_post(
         image_url=post.image_url,
         post_type=post.post_type,
         author_id=current_user.id,
-        college_id=current_user.college_id,
-        post_metadata={"likes": 0, "comments": 0, "shares": 0}
+        college_id=current_user.college_id
     )
     
     db.add(db_post)
+    # The INSERT returns the server-generated columns (eager_defaults), so the response is
+    # built from the flushed row; after commit it would be expired and re-SELECTed
+    db.flush()
+    post_id, post_title = db_post.id, db_post.title
+    
+    # Return with author name and department
+    response = PostResponse(
+        id=db_post.id,
+        title=db_post.title,
+        content=db_post.content,
+        image_url=db_post.image_url,
+        post_type=db_post.post_type,
+        author_id=db_post.author_id,
+        college_id=db_post.college_id,
+        post_metadata=post_metadata(db_post),
+        created_at=db_post.created_at,
+        updated_at=db_post.updated_at,
+        author_name=current_user.full_name,
+        author_department=current_user.department
+    )
     db.commit()
-    db.refresh(db_post)
     
     # 🎁 REWARD: Give user 5 points for creating a post (from college pool)
     try:
@@ -62,10 +97,10 @@ async def create_post(
             user_id=current_user.id,
             amount=5,
             reason="post_reward",
-            description=f"Created post: {db_post.title[:50]}",
+            description=f"Created post: {post_title[:50]}",
             created_by=current_user.id,
             reference_type="post_creation",
-            reference_id=db_post.id
+            reference_id=post_id
         )
         print(f"✅ 5 points credited to {current_user.username} for creating post (from college pool)")
     except HTTPException as e:
@@ -78,7 +113,7 @@ async def create_post(
     try:
         indexing_task = IndexingTask(
             content_type="post",
-            content_id=db_post.id,
+            content_id=post_id,
             college_id=current_user.college_id,
             status="pending"
         )
@@ -89,33 +124,18 @@ async def create_post(
         from .ai import process_post_indexing
         background_tasks.add_task(
             process_post_indexing,
-            db_post.id,
+            post_id,
             current_user.college_id
         )
     except Exception as e:
         # Log error but don't fail post creation
-        print(f"Error creating indexing task for post {db_post.id}: {e}")
+        print(f"Error creating indexing task for post {post_id}: {e}")
     
-    # Return with author name and department
-    return PostResponse(
-        id=db_post.id,
-        title=db_post.title,
-        content=db_post.content,
-        image_url=db_post.image_url,
-        post_type=db_post.post_type,
-        author_id=db_post.author_id,
-        college_id=db_post.college_id,
-        post_metadata=db_post.post_metadata,
-        created_at=db_post.created_at,
-        updated_at=db_post.updated_at,
-        author_name=current_user.full_name,
-        author_department=current_user.department,
-        time_ago=time_ago(db_post.created_at)
-    )
+    return response
 
 
 @router.get("/", response_model=List[PostEngagementResponse])
-async def get_posts(
+def get_posts(
     skip: int = 0,
     limit: int = 50,
     current_user: User = Depends(get_current_user),
@@ -140,11 +160,13 @@ async def get_posts(
     ).order_by(
         priority_order,
         desc(Post.created_at)
-    ).offset(skip).limit(limit).all()
+    ).options(*eager(Post)).offset(skip).limit(limit).all()
     
     # Convert to response format with engagement data
+    # One clock read and one vectorized pass for the whole page's time_ago
+    ages = utils.time_ago_batch([post.created_at for post, _, _ in posts])
     post_responses = []
-    for post, author_name, author_department in posts:
+    for (post, author_name, author_department), age in zip(posts, ages):
         # Check if current user has liked/ignited this post
         user_has_liked = db.query(exists().where(
             PostLike.post_id == post.id,
@@ -164,25 +186,25 @@ async def get_posts(
             post_type=post.post_type,
             author_id=post.author_id,
             college_id=post.college_id,
-            post_metadata=post.post_metadata or {"likes": 0, "comments": 0, "shares": 0},
+            post_metadata=post_metadata(post),
             created_at=post.created_at,
             updated_at=post.updated_at,
             author_name=author_name,
             author_department=author_department,
-            time_ago=time_ago(post.created_at),
             like_count=post.like_count,
             comment_count=post.comment_count,
             ignite_count=post.ignite_count,
             user_has_liked=user_has_liked,
-            user_has_ignited=user_has_ignited
+            user_has_ignited=user_has_ignited,
+            time_ago=age
         ))
     
-    return post_responses
+    return json_response(post_responses, POST_ENGAGEMENT_LIST)
 
 
 
 @router.get("/{post_id}", response_model=PostEngagementResponse)
-async def get_post(
+def get_post(
     post_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -222,12 +244,11 @@ async def get_post(
         post_type=post.post_type,
         author_id=post.author_id,
         college_id=post.college_id,
-        post_metadata=post.post_metadata or {"likes": 0, "comments": 0, "shares": 0},
+        post_metadata=post_metadata(post),
         created_at=post.created_at,
         updated_at=post.updated_at,
         author_name=author_name,
         author_department=author_department,
-        time_ago=time_ago(post.created_at),
         like_count=post.like_count,
         comment_count=post.comment_count,
         ignite_count=post.ignite_count,
@@ -237,7 +258,7 @@ async def get_post(
 
 
 @router.get("/type/{post_type}", response_model=List[PostResponse])
-async def get_posts_by_type(
+def get_posts_by_type(
     post_type: PostType,
     skip: int = 0,
     limit: int = 50,
@@ -252,11 +273,12 @@ async def get_posts_by_type(
         Post.post_type == post_type
     ).order_by(
         desc(Post.created_at)
-    ).offset(skip).limit(limit).all()
+    ).options(*eager(Post)).offset(skip).limit(limit).all()
     
     # Convert to response format
+    ages = utils.time_ago_batch([post.created_at for post, _, _ in posts])
     post_responses = []
-    for post, author_name, author_department in posts:
+    for (post, author_name, author_department), age in zip(posts, ages):
         post_responses.append(PostResponse(
             id=post.id,
             title=post.title,
@@ -265,15 +287,15 @@ async def get_posts_by_type(
             post_type=post.post_type,
             author_id=post.author_id,
             college_id=post.college_id,
-            post_metadata=post.post_metadata or {"likes": 0, "comments": 0, "shares": 0},
+            post_metadata=post_metadata(post),
             created_at=post.created_at,
             updated_at=post.updated_at,
             author_name=author_name,
             author_department=author_department,
-            time_ago=time_ago(post.created_at)
+            time_ago=age
         ))
     
-    return post_responses
+    return json_response(post_responses, POST_LIST)
 
 
 @router.put("/{post_id}", response_model=PostResponse)
@@ -343,17 +365,16 @@ async def update_post(
         post_type=post.post_type,
         author_id=post.author_id,
         college_id=post.college_id,
-        post_metadata=post.post_metadata or {"likes": 0, "comments": 0, "shares": 0},
+        post_metadata=post_metadata(post),
         created_at=post.created_at,
         updated_at=post.updated_at,
         author_name=current_user.full_name,
-        author_department=current_user.department,
-        time_ago=time_ago(post.created_at)
+        author_department=current_user.department
     )
 
 
 @router.patch("/{post_id}/metadata", response_model=PostResponse)
-async def update_post_metadata(
+def update_post_metadata(
     post_id: int,
     metadata_update: PostMetadataUpdate,
     current_user: User = Depends(get_current_user),
@@ -376,17 +397,16 @@ async def update_post_metadata(
     
     post, author_name, author_department = post_query
     
-    # Update metadata
-    current_metadata = post.post_metadata or {"likes": 0, "comments": 0, "shares": 0}
-    
-    if metadata_update.likes is not None:
-        current_metadata["likes"] = metadata_update.likes
-    if metadata_update.comments is not None:
-        current_metadata["comments"] = metadata_update.comments
-    if metadata_update.shares is not None:
-        current_metadata["shares"] = metadata_update.shares
-    
-    post.post_metadata = current_metadata
+    # Counters live in integer columns: set them in one UPDATE, no JSON rewrite
+    counters = {
+        column: value for column, value in (
+            ("like_count", metadata_update.likes),
+            ("comment_count", metadata_update.comments),
+            ("share_count", metadata_update.shares),
+        ) if value is not None
+    }
+    if counters:
+        db.execute(update(Post).where(Post.id == post.id).values(**counters))
     db.commit()
     db.refresh(post)
     
@@ -398,12 +418,11 @@ async def update_post_metadata(
         post_type=post.post_type,
         author_id=post.author_id,
         college_id=post.college_id,
-        post_metadata=post.post_metadata,
+        post_metadata=post_metadata(post),
         created_at=post.created_at,
         updated_at=post.updated_at,
         author_name=author_name,
-        author_department=author_department,
-        time_ago=time_ago(post.created_at)
+        author_department=author_department
     )
 
 
@@ -412,7 +431,7 @@ async def update_post_metadata(
 
 
 @router.post("/{post_id}/alert", response_model=AlertResponse)
-async def create_post_alert(
+def create_post_alert(
     post_id: int,
     alert_data: PostAlertCreate,
     current_user: User = Depends(get_current_user),
@@ -461,28 +480,6 @@ async def create_post_alert(
     db.commit()
     db.refresh(alert)
     
-    # Calculate time ago
-    def calculate_time_ago(created_at: datetime) -> str:
-        now = datetime.utcnow()
-        diff = now - created_at
-        
-        if diff.days > 0:
-            return f"{diff.days} day{'s' if diff.days != 1 else ''} ago"
-        elif diff.seconds >= 3600:
-            hours = diff.seconds // 3600
-            return f"{hours} hour{'s' if hours != 1 else ''} ago"
-        elif diff.seconds >= 60:
-            minutes = diff.seconds // 60
-            return f"{minutes} minute{'s' if minutes != 1 else ''} ago"
-        else:
-            return "Just now"
-    
-    # Check if expired
-    def is_alert_expired(expires_at) -> bool:
-        if expires_at is None:
-            return False
-        return datetime.utcnow() > expires_at
-    
     # Build response
     alert_dict = {
         "id": alert.id,
@@ -499,9 +496,7 @@ async def create_post_alert(
         "created_at": alert.created_at,
         "updated_at": alert.updated_at,
         "creator_name": current_user.full_name,
-        "post_title": post.title,
-        "time_ago": calculate_time_ago(alert.created_at),
-        "is_expired": is_alert_expired(alert.expires_at)
+        "post_title": post.title
     }
     
     return AlertResponse(**alert_dict)
\ No newline at end of file
@@ -1,24 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, func
 from typing import List
 
+from pydantic import TypeAdapter
+
 from ..core.database import get_db
 from ..core.utils import time_ago
 from ..core.rbac import PermissionChecker
-from ..models.models import Reward, RewardPoint, User, Post, RewardType
+from ..models.models import Reward, RewardPoint, User, Post, RewardType, LeaderboardEntry
 from ..models.schemas import (
     RewardCreate, RewardResponse, RewardPointsResponse, 
     RewardLeaderboardResponse, RewardSummaryResponse
 )
 from ..routers.auth import get_current_user
+from ..core.security import Principal, get_current_principal
+from ..services.leaderboard import get_cached_leaderboard, cache_leaderboard
 from ..services.reward_pool import reward_pool_service
 
 router = APIRouter(prefix="/rewards", tags=["rewards"])
 
+LEADERBOARD = TypeAdapter(List[RewardLeaderboardResponse])
+
 
 @router.post("/", response_model=RewardResponse)
-async def give_reward(
+def give_reward(
     reward: RewardCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -126,7 +132,7 @@ async def give_reward(
 
 
 @router.get("/", response_model=List[RewardResponse])
-async def get_rewards(
+def get_rewards(
     skip: int = 0,
     limit: int = 50,
     current_user: User = Depends(get_current_user),
@@ -186,7 +192,7 @@ async def get_rewards(
 
 
 @router.get("/me", response_model=RewardSummaryResponse)
-async def get_my_rewards(
+def get_my_rewards(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     _: None = Depends(PermissionChecker("read:rewards"))  # ✅ RBAC Protection
@@ -247,42 +253,43 @@ async def get_my_rewards(
 
 
 @router.get("/leaderboard", response_model=List[RewardLeaderboardResponse])
-async def get_leaderboard(
+def get_leaderboard(
     limit: int = 20,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
-    """Get college leaderboard based on reward points"""
+    """Get college leaderboard based on reward points (refreshed every few minutes)"""
     
-    leaderboard = db.query(
-        RewardPoint.user_id,
-        RewardPoint.total_points,
-        User.full_name,
-        User.department
-    ).join(
-        User, RewardPoint.user_id == User.id
-    ).filter(
-        User.college_id == current_user.college_id
+    # The same bytes are served until the next view refresh
+    body = get_cached_leaderboard(current_user.college_id, limit)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+    
+    # Ranks are precomputed in mv_college_leaderboard: a range scan of its (college_id, rank) index
+    leaderboard = db.query(LeaderboardEntry).filter(
+        LeaderboardEntry.college_id == current_user.college_id
     ).order_by(
-        desc(RewardPoint.total_points)
+        LeaderboardEntry.rank
     ).limit(limit).all()
     
-    return [
+    body = LEADERBOARD.dump_json([
         RewardLeaderboardResponse(
             user_id=item.user_id,
             user_name=item.full_name,
             department=item.department,
             total_points=item.total_points,
-            rank=index + 1
+            rank=item.rank
         )
-        for index, item in enumerate(leaderboard)
-    ]
+        for item in leaderboard
+    ])
+    cache_leaderboard(current_user.college_id, limit, body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/points/{user_id}", response_model=RewardPointsResponse)
-async def get_user_points(
+def get_user_points(
     user_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get reward points for a specific user"""
@@ -322,6 +329,6 @@ async def get_user_points(
 
 
 @router.get("/types", response_model=List[str])
-async def get_reward_types():
+def get_reward_types():
     """Get available reward types"""
     return [reward_type.value for reward_type in RewardType]
\ No newline at end of file
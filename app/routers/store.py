@@ -1,18 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
 from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func, desc
+from sqlalchemy import and_, or_, func, desc, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
-import uuid
 import logging
 
+from pydantic import TypeAdapter
+
 from ..core.database import get_db
-from ..core.security import get_current_user
+from ..core.responses import json_response
+from ..core.security import Principal, get_current_user, get_current_principal
+from ..models.loading import eager
 from ..models.models import (
     User, College, Product, ProductCategory, ProductStatus, 
     Cart, CartItem, Order, OrderItem, OrderStatus, 
-    PointTransaction, RewardPoint, WishlistItem
+    PointTransaction, RewardPoint, WishlistItem, utc_now
 )
 from ..models.schemas import (
     ProductCreate, ProductUpdate, ProductResponse, ProductListResponse,
@@ -21,6 +24,7 @@ from ..models.schemas import (
     BalanceResponse, BalanceHistoryResponse, PointTransactionResponse,
     WishlistAdd, WishlistResponse, WishlistItemResponse, CategoryResponse
 )
+from ..services.reward_pool import reward_pool_service
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -28,12 +32,39 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/rewards/store", tags=["rewards-store"])
 
+CATEGORY_LIST = TypeAdapter(List[CategoryResponse])
+
+
+def product_response(product: Product, creator_name: Optional[str]) -> ProductResponse:
+    """ProductResponse for a product row and its creator's name"""
+    return ProductResponse(
+        id=product.id,
+        name=product.name,
+        description=product.description,
+        category=product.category,
+        points_required=product.points_required,
+        original_price=float(product.original_price) if product.original_price else None,
+        stock_quantity=product.stock_quantity,
+        max_quantity_per_user=product.max_quantity_per_user,
+        status=product.status,
+        image_url=product.image_url,
+        brand=product.brand,
+        specifications=product.specifications,
+        college_id=product.college_id,
+        created_by=product.created_by,
+        created_at=product.created_at,
+        updated_at=product.updated_at,
+        creator_name=creator_name or "Unknown",
+        in_stock=product.stock_quantity > 0,
+        can_purchase=product.stock_quantity > 0 and product.status == ProductStatus.ACTIVE
+    )
+
 
 # ==================== PRODUCT MANAGEMENT ====================
 
 @router.get("/categories", response_model=List[CategoryResponse])
-async def get_categories(
-    current_user: User = Depends(get_current_user),
+def get_categories(
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get all product categories with counts"""
@@ -54,11 +85,11 @@ async def get_categories(
             product_count=count
         ))
     
-    return categories
+    return json_response(categories, CATEGORY_LIST)
 
 
 @router.get("/products", response_model=ProductListResponse)
-async def get_products(
+def get_products(
     category: Optional[ProductCategory] = Query(None, description="Filter by category"),
     search: Optional[str] = Query(None, description="Search in product name and description"),
     min_points: Optional[int] = Query(None, description="Minimum points required"),
@@ -66,7 +97,7 @@ async def get_products(
     in_stock: Optional[bool] = Query(None, description="Filter by stock availability"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get products with filtering and pagination"""
@@ -107,47 +138,25 @@ async def get_products(
     
     # Apply pagination and ordering
     offset = (page - 1) * page_size
-    products = query.order_by(Product.created_at.desc()).offset(offset).limit(page_size).all()
-    
-    # Build response with additional info
-    product_responses = []
-    for product in products:
-        creator = db.query(User).filter(User.id == product.created_by).first()
-        
-        product_responses.append(ProductResponse(
-            id=product.id,
-            name=product.name,
-            description=product.description,
-            category=product.category,
-            points_required=product.points_required,
-            original_price=float(product.original_price) if product.original_price else None,
-            stock_quantity=product.stock_quantity,
-            max_quantity_per_user=product.max_quantity_per_user,
-            status=product.status,
-            image_url=product.image_url,
-            brand=product.brand,
-            specifications=product.specifications,
-            college_id=product.college_id,
-            created_by=product.created_by,
-            created_at=product.created_at,
-            updated_at=product.updated_at,
-            creator_name=creator.full_name if creator else "Unknown",
-            in_stock=product.stock_quantity > 0,
-            can_purchase=product.stock_quantity > 0 and product.status == ProductStatus.ACTIVE
-        ))
-    
-    return ProductListResponse(
-        products=product_responses,
+    # The creator's name is joined into each row rather than looked up per product
+    products = query.outerjoin(User, User.id == Product.created_by).add_columns(
+        User.full_name
+    ).options(*eager(Product)).order_by(
+        Product.created_at.desc()
+    ).offset(offset).limit(page_size).all()
+    
+    return json_response(ProductListResponse(
+        products=[product_response(product, creator_name) for product, creator_name in products],
         total_count=total_count,
         page=page,
         page_size=page_size
-    )
+    ))
 
 
 @router.get("/products/{product_id}", response_model=ProductResponse)
-async def get_product(
+def get_product(
     product_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get detailed information about a specific product"""
@@ -162,35 +171,15 @@ async def get_product(
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     
-    creator = db.query(User).filter(User.id == product.created_by).first()
+    creator_name = db.query(User.full_name).filter(User.id == product.created_by).scalar()
     
-    return ProductResponse(
-        id=product.id,
-        name=product.name,
-        description=product.description,
-        category=product.category,
-        points_required=product.points_required,
-        original_price=float(product.original_price) if product.original_price else None,
-        stock_quantity=product.stock_quantity,
-        max_quantity_per_user=product.max_quantity_per_user,
-        status=product.status,
-        image_url=product.image_url,
-        brand=product.brand,
-        specifications=product.specifications,
-        college_id=product.college_id,
-        created_by=product.created_by,
-        created_at=product.created_at,
-        updated_at=product.updated_at,
-        creator_name=creator.full_name if creator else "Unknown",
-        in_stock=product.stock_quantity > 0,
-        can_purchase=product.stock_quantity > 0 and product.status == ProductStatus.ACTIVE
-    )
+    return product_response(product, creator_name)
 
 
 # ==================== ADMIN PRODUCT MANAGEMENT ====================
 
 @router.post("/products", response_model=ProductResponse)
-async def create_product(
+def create_product(
     product_data: ProductCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -219,34 +208,14 @@ async def create_product(
     db.commit()
     db.refresh(product)
     
-    return ProductResponse(
-        id=product.id,
-        name=product.name,
-        description=product.description,
-        category=product.category,
-        points_required=product.points_required,
-        original_price=float(product.original_price) if product.original_price else None,
-        stock_quantity=product.stock_quantity,
-        max_quantity_per_user=product.max_quantity_per_user,
-        status=product.status,
-        image_url=product.image_url,
-        brand=product.brand,
-        specifications=product.specifications,
-        college_id=product.college_id,
-        created_by=product.created_by,
-        created_at=product.created_at,
-        updated_at=product.updated_at,
-        creator_name=current_user.full_name,
-        in_stock=product.stock_quantity > 0,
-        can_purchase=product.stock_quantity > 0 and product.status == ProductStatus.ACTIVE
-    )
+    return product_response(product, current_user.full_name)
 
 
 @router.put("/products/{product_id}", response_model=ProductResponse)
-async def update_product(
+def update_product(
     product_id: int,
     product_data: ProductUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Update a product (admin only)"""
@@ -269,34 +238,14 @@ async def update_product(
     db.commit()
     db.refresh(product)
     
-    creator = db.query(User).filter(User.id == product.created_by).first()
+    creator_name = db.query(User.full_name).filter(User.id == product.created_by).scalar()
     
-    return ProductResponse(
-        id=product.id,
-        name=product.name,
-        description=product.description,
-        category=product.category,
-        points_required=product.points_required,
-        original_price=float(product.original_price) if product.original_price else None,
-        stock_quantity=product.stock_quantity,
-        max_quantity_per_user=product.max_quantity_per_user,
-        status=product.status,
-        image_url=product.image_url,
-        brand=product.brand,
-        specifications=product.specifications,
-        college_id=product.college_id,
-        created_by=product.created_by,
-        created_at=product.created_at,
-        updated_at=product.updated_at,
-        creator_name=creator.full_name if creator else "Unknown",
-        in_stock=product.stock_quantity > 0,
-        can_purchase=product.stock_quantity > 0 and product.status == ProductStatus.ACTIVE
-    )
+    return product_response(product, creator_name)
 
 
 # ==================== CART MANAGEMENT ====================
 
-async def get_or_create_cart(user_id: int, college_id: int, db: Session) -> Cart:
+def get_or_create_cart(user_id: int, college_id: int, db: Session) -> Cart:
     """Get existing cart or create a new one for the user"""
     cart = db.query(Cart).filter(Cart.user_id == user_id).first()
     
@@ -313,22 +262,22 @@ async def get_or_create_cart(user_id: int, college_id: int, db: Session) -> Cart
 
 
 @router.get("/cart", response_model=CartResponse)
-async def get_cart(
-    current_user: User = Depends(get_current_user),
+def get_cart(
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get user's current cart"""
     
-    cart = await get_or_create_cart(current_user.id, current_user.college_id, db)
+    cart = get_or_create_cart(current_user.id, current_user.college_id, db)
     
     # Get cart items with product details
-    cart_items = db.query(CartItem).filter(CartItem.cart_id == cart.id).all()
+    cart_items = cart.items
     
     items_response = []
     total_points = 0
     
     for item in cart_items:
-        product = db.query(Product).filter(Product.id == item.product_id).first()
+        product = item.product
         if product:
             item_total = product.points_required * item.quantity
             total_points += item_total
@@ -357,9 +306,9 @@ async def get_cart(
 
 
 @router.post("/cart/add")
-async def add_to_cart(
+def add_to_cart(
     cart_item: CartItemAdd,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Add item to cart"""
@@ -386,7 +335,7 @@ async def add_to_cart(
         )
     
     # Get or create cart
-    cart = await get_or_create_cart(current_user.id, current_user.college_id, db)
+    cart = get_or_create_cart(current_user.id, current_user.college_id, db)
     
     # Check if item already exists in cart
     existing_item = db.query(CartItem).filter(
@@ -420,17 +369,17 @@ async def add_to_cart(
         db.add(new_item)
     
     # Update cart timestamp
-    cart.updated_at = datetime.utcnow()
+    cart.updated_at = utc_now
     db.commit()
     
     return {"message": "Item added to cart successfully"}
 
 
 @router.put("/cart/update/{item_id}")
-async def update_cart_item(
+def update_cart_item(
     item_id: int,
     update_data: CartItemUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Update cart item quantity"""
@@ -470,16 +419,16 @@ async def update_cart_item(
         cart_item.quantity = update_data.quantity
     
     # Update cart timestamp
-    cart.updated_at = datetime.utcnow()
+    cart.updated_at = utc_now
     db.commit()
     
     return {"message": "Cart updated successfully"}
 
 
 @router.delete("/cart/remove/{item_id}")
-async def remove_from_cart(
+def remove_from_cart(
     item_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Remove item from cart"""
@@ -499,15 +448,15 @@ async def remove_from_cart(
         raise HTTPException(status_code=404, detail="Cart item not found")
     
     db.delete(cart_item)
-    cart.updated_at = datetime.utcnow()
+    cart.updated_at = utc_now
     db.commit()
     
     return {"message": "Item removed from cart"}
 
 
 @router.delete("/cart/clear")
-async def clear_cart(
-    current_user: User = Depends(get_current_user),
+def clear_cart(
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Clear entire cart"""
@@ -518,7 +467,7 @@ async def clear_cart(
     
     # Delete all cart items
     db.query(CartItem).filter(CartItem.cart_id == cart.id).delete()
-    cart.updated_at = datetime.utcnow()
+    cart.updated_at = utc_now
     db.commit()
     
     return {"message": "Cart cleared successfully"}
@@ -526,15 +475,8 @@ async def clear_cart(
 
 # ==================== CHECKOUT & ORDERS ====================
 
-def generate_order_number() -> str:
-    """Generate unique order number"""
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    random_part = str(uuid.uuid4())[:8].upper()
-    return f"ORD{timestamp}{random_part}"
-
-
 @router.post("/checkout", response_model=OrderResponse)
-async def checkout(
+def checkout(
     checkout_data: CheckoutRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -547,7 +489,7 @@ async def checkout(
         raise HTTPException(status_code=404, detail="Cart not found")
     
     # Get cart items
-    cart_items = db.query(CartItem).filter(CartItem.cart_id == cart.id).all()
+    cart_items = cart.items
     if not cart_items:
         raise HTTPException(status_code=400, detail="Cart is empty")
     
@@ -556,7 +498,7 @@ async def checkout(
     order_items_data = []
     
     for item in cart_items:
-        product = db.query(Product).filter(Product.id == item.product_id).first()
+        product = item.product
         if not product:
             raise HTTPException(status_code=400, detail=f"Product not found: {item.product_id}")
         
@@ -579,18 +521,8 @@ async def checkout(
             "total_points": item_total
         })
     
-    # Check user's balance
-    user_points = db.query(RewardPoint).filter(RewardPoint.user_id == current_user.id).first()
-    if not user_points or user_points.total_points < total_points:
-        available_points = user_points.total_points if user_points else 0
-        raise HTTPException(
-            status_code=400,
-            detail=f"Insufficient points. Required: {total_points}, Available: {available_points}"
-        )
-    
     # Create order
     order = Order(
-        order_number=generate_order_number(),
         user_id=current_user.id,
         total_points=total_points,
         total_items=len(cart_items),
@@ -599,43 +531,45 @@ async def checkout(
     )
     
     db.add(order)
-    db.flush()  # Get order ID
+    db.flush()  # Get order ID and number
+    
+    # Create all order items in one multi-row INSERT ... RETURNING and update stock
+    order_items = db.scalars(
+        insert(OrderItem).returning(OrderItem),
+        [
+            {
+                "order_id": order.id,
+                "product_id": item_data["product"].id,
+                "quantity": item_data["quantity"],
+                "points_per_item": item_data["points_per_item"],
+                "total_points": item_data["total_points"],
+                "product_name": item_data["product"].name
+            }
+            for item_data in order_items_data
+        ]
+    ).all()
     
-    # Create order items and update stock
-    order_items = []
     for item_data in order_items_data:
-        product = item_data["product"]
-        
-        # Create order item
-        order_item = OrderItem(
-            order_id=order.id,
-            product_id=product.id,
-            quantity=item_data["quantity"],
-            points_per_item=item_data["points_per_item"],
-            total_points=item_data["total_points"],
-            product_name=product.name
-        )
-        db.add(order_item)
-        order_items.append(order_item)
-        
-        # Update product stock
-        product.stock_quantity -= item_data["quantity"]
-    
-    # Deduct points from user
-    user_points.total_points -= total_points
+        item_data["product"].stock_quantity -= item_data["quantity"]
     
-    # Create point transaction
-    transaction = PointTransaction(
+    # Deduct points from user. The point_transactions trigger rejects the spend if the
+    # balance doesn't cover the whole order, which rolls back the order and stock changes too
+    transaction = reward_pool_service.spend_points(
+        db,
         user_id=current_user.id,
-        transaction_type="SPENT",
-        points=-total_points,
-        balance_after=user_points.total_points,
+        college_id=current_user.college_id,
+        points=total_points,
         description=f"Order #{order.order_number} - {len(cart_items)} items",
         reference_type="order",
-        reference_id=order.id,
-        college_id=current_user.college_id
+        reference_id=order.id
     )
-    db.add(transaction)
+    if not transaction:
+        user_points = db.query(RewardPoint).filter(RewardPoint.user_id == current_user.id).first()
+        available_points = user_points.total_points if user_points else 0
+        raise HTTPException(
+            status_code=400,
+            detail=f"Insufficient points. Required: {total_points}, Available: {available_points}"
+        )
     
     # Clear cart
     db.query(CartItem).filter(CartItem.cart_id == cart.id).delete()
@@ -675,7 +609,7 @@ async def checkout(
 
 
 @router.get("/orders", response_model=OrderListResponse)
-async def get_orders(
+def get_orders(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     current_user: User = Depends(get_current_user),
@@ -690,16 +624,15 @@ async def get_orders(
     offset = (page - 1) * page_size
     orders = db.query(Order).filter(
         Order.user_id == current_user.id
-    ).order_by(desc(Order.created_at)).offset(offset).limit(page_size).all()
+    ).order_by(desc(Order.created_at)).options(*eager(Order)).offset(offset).limit(page_size).all()
     
     # Build response
     order_responses = []
     for order in orders:
-        # Get order items
-        items = db.query(OrderItem).filter(OrderItem.order_id == order.id).all()
+        # Order items are selectin-loaded with the page of orders
         items_response = []
         
-        for item in items:
+        for item in order.items:
             items_response.append(OrderItemResponse(
                 id=item.id,
                 product_id=item.product_id,
@@ -727,16 +660,16 @@ async def get_orders(
             status_display=order.status.value.replace("_", " ").title()
         ))
     
-    return OrderListResponse(
+    return json_response(OrderListResponse(
         orders=order_responses,
         total_count=total_count,
         page=page,
         page_size=page_size
-    )
+    ))
 
 
 @router.get("/orders/{order_id}", response_model=OrderResponse)
-async def get_order(
+def get_order(
     order_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -753,11 +686,9 @@ async def get_order(
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
     
-    # Get order items
-    items = db.query(OrderItem).filter(OrderItem.order_id == order.id).all()
     items_response = []
     
-    for item in items:
+    for item in order.items:
         items_response.append(OrderItemResponse(
             id=item.id,
             product_id=item.product_id,
@@ -789,8 +720,8 @@ async def get_order(
 # ==================== BALANCE & TRANSACTIONS ====================
 
 @router.get("/balance", response_model=BalanceResponse)
-async def get_balance(
-    current_user: User = Depends(get_current_user),
+def get_balance(
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get user's current point balance and summary"""
@@ -824,17 +755,17 @@ async def get_balance(
     
     available_balance = current_balance  # In this simple system, all balance is available
     
-    return BalanceResponse(
+    return json_response(BalanceResponse(
         current_balance=current_balance,
         total_earned=total_earned,
         total_spent=total_spent,
         pending_orders_points=pending_orders_points,
         available_balance=available_balance
-    )
+    ))
 
 
 @router.get("/balance/history", response_model=BalanceHistoryResponse)
-async def get_balance_history(
+def get_balance_history(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     current_user: User = Depends(get_current_user),
@@ -868,22 +799,22 @@ async def get_balance_history(
         ))
     
     # Get balance summary
-    balance_summary = await get_balance(current_user, db)
+    balance_summary = get_balance(current_user, db)
     
-    return BalanceHistoryResponse(
+    return json_response(BalanceHistoryResponse(
         transactions=transaction_responses,
         balance_summary=balance_summary,
         total_count=total_count,
         page=page,
         page_size=page_size
-    )
+    ))
 
 
 # ==================== WISHLIST ====================
 
 @router.get("/wishlist", response_model=WishlistResponse)
-async def get_wishlist(
-    current_user: User = Depends(get_current_user),
+def get_wishlist(
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get user's wishlist"""
@@ -894,7 +825,7 @@ async def get_wishlist(
     
     items_response = []
     for item in wishlist_items:
-        product = db.query(Product).filter(Product.id == item.product_id).first()
+        product = item.product
         if product:  # Product still exists
             items_response.append(WishlistItemResponse(
                 id=item.id,
@@ -914,9 +845,9 @@ async def get_wishlist(
 
 
 @router.post("/wishlist/add")
-async def add_to_wishlist(
+def add_to_wishlist(
     wishlist_data: WishlistAdd,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Add product to wishlist"""
@@ -932,34 +863,28 @@ async def add_to_wishlist(
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
     
-    # Check if already in wishlist
-    existing_item = db.query(WishlistItem).filter(
-        and_(
-            WishlistItem.user_id == current_user.id,
-            WishlistItem.product_id == wishlist_data.product_id
+    # Add to wishlist unless already there (uq_wishlist_user_product), in one statement
+    result = db.execute(
+        pg_insert(WishlistItem)
+        .values(
+            user_id=current_user.id,
+            product_id=wishlist_data.product_id,
+            college_id=current_user.college_id
         )
-    ).first()
-    
-    if existing_item:
-        return {"message": "Product already in wishlist"}
-    
-    # Add to wishlist
-    wishlist_item = WishlistItem(
-        user_id=current_user.id,
-        product_id=wishlist_data.product_id,
-        college_id=current_user.college_id
+        .on_conflict_do_nothing(index_elements=["user_id", "product_id"])
     )
-    
-    db.add(wishlist_item)
     db.commit()
     
+    if result.rowcount == 0:
+        return {"message": "Product already in wishlist"}
+    
     return {"message": "Product added to wishlist"}
 
 
 @router.delete("/wishlist/remove/{product_id}")
-async def remove_from_wishlist(
+def remove_from_wishlist(
     product_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Remove product from wishlist"""
@@ -983,10 +908,10 @@ async def remove_from_wishlist(
 # ==================== ADMIN ENDPOINTS ====================
 
 @router.put("/orders/{order_id}/status", response_model=OrderResponse)
-async def update_order_status(
+def update_order_status(
     order_id: int,
     status_data: OrderStatusUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Update order status (admin only)"""
@@ -1013,11 +938,9 @@ async def update_order_status(
     db.commit()
     db.refresh(order)
     
-    # Get order items for response
-    items = db.query(OrderItem).filter(OrderItem.order_id == order.id).all()
     items_response = []
     
-    for item in items:
+    for item in order.items:
         items_response.append(OrderItemResponse(
             id=item.id,
             product_id=item.product_id,
@@ -7,12 +7,13 @@ from ..core.rbac import get_user_permissions
 from ..models.models import User, College
 from ..models.schemas import UserResponse, UserProfile
 from ..routers.auth import get_current_user
+from ..core.security import Principal, get_current_principal
 
 router = APIRouter(prefix="/users", tags=["users"])
 
 
 @router.get("/me", response_model=UserProfile)
-async def get_my_profile(
+def get_my_profile(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -39,10 +40,10 @@ async def get_my_profile(
 
 
 @router.get("/", response_model=List[UserResponse])
-async def get_users(
+def get_users(
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     # Only return users from the same college (multi-tenant)
@@ -54,9 +55,9 @@ async def get_users(
 
 
 @router.get("/{user_id}", response_model=UserProfile)
-async def get_user(
+def get_user(
     user_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     user = db.query(User).filter(
@@ -0,0 +1,31 @@
+"""
+Background Jobs
+Periodic maintenance that runs inside each API worker, started from the app lifespan
+"""
+
+import asyncio
+import logging
+from typing import Callable
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+async def run_periodically(job: Callable[[], object], interval_seconds: float):
+    """Run the blocking `job` in a worker thread every `interval_seconds`, logging failures"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await asyncio.to_thread(job)
+        except Exception:
+            logger.exception("Background job %s failed", job.__name__)
+
+
+def try_job_lock(db: Session, key: int) -> bool:
+    """
+    Take the advisory lock `key` for the rest of db's transaction. Every worker runs the same
+    jobs on the same interval; False means another worker is already running this one.
+    """
+    return db.execute(text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": key}).scalar()
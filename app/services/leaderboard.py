@@ -0,0 +1,46 @@
+"""
+College Leaderboard
+Rankings are read from the mv_college_leaderboard materialized view, refreshed here
+"""
+
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import text
+
+from ..core.database import SessionLocal
+from .background import try_job_lock
+
+# CONCURRENTLY keeps the view readable during the refresh; it needs the unique
+# (college_id, rank) index, which the view always has
+REFRESH_LEADERBOARD = text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_college_leaderboard")
+
+# Advisory lock key held while one worker refreshes the view
+LEADERBOARD_LOCK_KEY = 7_201_002
+
+# Serialized leaderboard responses keyed by (college_id, limit). The view only changes when
+# refresh_leaderboard runs, so entries stay valid until then and every worker drops its own there
+MAX_CACHED_LEADERBOARDS = 1024
+leaderboard_cache: Dict[Tuple[int, int], bytes] = {}
+
+
+def get_cached_leaderboard(college_id: int, limit: int) -> Optional[bytes]:
+    return leaderboard_cache.get((college_id, limit))
+
+
+def cache_leaderboard(college_id: int, limit: int, body: bytes):
+    if len(leaderboard_cache) >= MAX_CACHED_LEADERBOARDS:
+        leaderboard_cache.clear()
+    leaderboard_cache[(college_id, limit)] = body
+
+
+def refresh_leaderboard():
+    """Recompute every college's ranking from reward_points"""
+    db = SessionLocal()
+    try:
+        # Only one worker refreshes per interval; the rest just drop their cached rankings
+        if try_job_lock(db, LEADERBOARD_LOCK_KEY):
+            db.execute(REFRESH_LEADERBOARD)
+        db.commit()
+        leaderboard_cache.clear()
+    finally:
+        db.close()
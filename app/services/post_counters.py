@@ -0,0 +1,38 @@
+"""
+Post Counter Reconciliation
+Likes and ignites only queue their post; like_count/ignite_count are recounted here in batches
+"""
+
+from sqlalchemy import text
+
+from ..core.database import SessionLocal
+from .background import try_job_lock
+
+# Advisory lock key held while one worker recounts the queue
+POST_COUNTERS_LOCK_KEY = 7_201_001
+
+# Claims every queued post and recounts it in one statement. Rows are deleted as they are
+# claimed, so anything queued during a run is picked up by the next one.
+REFRESH_QUEUED_COUNTERS = text("""
+WITH claimed AS (
+    DELETE FROM post_counter_queue RETURNING post_id
+)
+UPDATE posts
+SET like_count = (SELECT count(*) FROM post_likes WHERE post_likes.post_id = posts.id),
+    ignite_count = (SELECT count(*) FROM post_ignites WHERE post_ignites.post_id = posts.id)
+FROM claimed
+WHERE posts.id = claimed.post_id
+""")
+
+
+def refresh_post_counters() -> int:
+    """Recount likes and ignites for every queued post. Returns the number of posts updated."""
+    db = SessionLocal()
+    try:
+        if not try_job_lock(db, POST_COUNTERS_LOCK_KEY):
+            return 0
+        updated = db.execute(REFRESH_QUEUED_COUNTERS).rowcount
+        db.commit()
+        return updated
+    finally:
+        db.close()
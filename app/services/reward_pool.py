@@ -4,6 +4,8 @@ Handles all reward pool operations with proper validation and logging
 """
 
 from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from psycopg2.errorcodes import CHECK_VIOLATION
 from fastapi import HTTPException, status
 from typing import Optional
 
@@ -144,6 +146,42 @@ class RewardPoolService:
         
         return transaction
     
+    @staticmethod
+    def spend_points(
+        db: Session,
+        user_id: int,
+        college_id: int,
+        points: int,
+        description: str,
+        reference_type: Optional[str] = None,
+        reference_id: Optional[int] = None
+    ) -> Optional[PointTransaction]:
+        """
+        Record a SPENT transaction. The trg_point_transactions_balance trigger deducts it
+        from reward_points and fills in balance_after as part of the INSERT, and rejects it
+        if the user can't cover it - in which case the session is rolled back and None returned.
+        """
+        transaction = PointTransaction(
+            user_id=user_id,
+            transaction_type="SPENT",
+            points=-points,
+            description=description,
+            reference_type=reference_type,
+            reference_id=reference_id,
+            college_id=college_id
+        )
+        db.add(transaction)
+        
+        try:
+            db.flush()
+        except IntegrityError as e:
+            if getattr(e.orig, "pgcode", None) != CHECK_VIOLATION:
+                raise
+            db.rollback()
+            return None
+        
+        return transaction
+    
     @staticmethod
     def give_reward_from_pool(
         db: Session,
@@ -174,35 +212,25 @@ class RewardPoolService:
                 reference_id=reference_id
             )
             
-            # 2. Credit to user
-            user_points = db.query(RewardPoint).filter(
-                RewardPoint.user_id == user_id
-            ).first()
-            
-            if not user_points:
-                user_points = RewardPoint(user_id=user_id, total_points=0)
-                db.add(user_points)
-            
-            user_points.total_points += amount
-            
-            # 3. Log user transaction
+            # 2. Credit to user (the point_transactions trigger applies it to reward_points)
             user_transaction = PointTransaction(
                 user_id=user_id,
                 transaction_type="EARNED",
                 points=amount,
-                balance_after=user_points.total_points,
                 description=description,
                 reference_type=reference_type,
                 reference_id=reference_id,
                 college_id=college_id
             )
             db.add(user_transaction)
+            db.flush()
+            user_balance = user_transaction.balance_after
             
             db.commit()
             
             return {
                 "pool_transaction": pool_txn,
-                "user_balance": user_points.total_points
+                "user_balance": user_balance
             }
             
         except HTTPException:
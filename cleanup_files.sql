@@ -8,10 +8,10 @@
 -- ========================================
 
 -- 1. Count all files
-SELECT 'Total Files' as metric, COUNT(*) as count FROM files WHERE is_folder = FALSE;
+SELECT 'Total Files' as metric, COUNT(*) as count FROM files;
 
 -- 2. Count folders
-SELECT 'Total Folders' as metric, COUNT(*) as count FROM files WHERE is_folder = TRUE;
+SELECT 'Total Folders' as metric, COUNT(*) as count FROM folders;
 
 -- 3. Storage by department
 SELECT 
@@ -19,17 +19,15 @@ SELECT
     COUNT(*) as file_count,
     ROUND(SUM(file_size)::numeric / 1024 / 1024, 2) as size_mb
 FROM files
-WHERE is_folder = FALSE
 GROUP BY department
 ORDER BY size_mb DESC;
 
--- 4. Files by type
+-- 4. Files by type (file_type is a SMALLINT code; see FileType in app/models/models.py)
 SELECT 
-    file_type,
+    (ARRAY['DOCUMENT', 'PRESENTATION', 'SPREADSHEET', 'IMAGE', 'VIDEO', 'AUDIO', 'ARCHIVE', 'TEXT', 'OTHER'])[file_type + 1] AS file_type,
     COUNT(*) as count,
     ROUND(SUM(file_size)::numeric / 1024 / 1024, 2) as size_mb
 FROM files
-WHERE is_folder = FALSE
 GROUP BY file_type
 ORDER BY count DESC;
 
@@ -41,7 +39,6 @@ SELECT
     created_at,
     ROUND(file_size::numeric / 1024 / 1024, 2) as size_mb
 FROM files
-WHERE is_folder = FALSE
 ORDER BY created_at ASC
 LIMIT 10;
 
@@ -69,8 +66,7 @@ LIMIT 10;
 -- UNCOMMENT TO RUN:
 -- BEGIN;
 -- DELETE FROM files 
--- WHERE is_folder = FALSE 
---   AND created_at < NOW() - INTERVAL '90 days';
+-- WHERE created_at < NOW() - INTERVAL '90 days';
 -- COMMIT;
 
 
@@ -88,8 +84,7 @@ LIMIT 10;
 -- UNCOMMENT TO RUN:
 -- BEGIN;
 -- DELETE FROM files 
--- WHERE is_folder = FALSE 
---   AND (file_path IS NULL OR file_path = '');
+-- WHERE (file_path IS NULL OR file_path = '');
 -- COMMIT;
 
 
@@ -118,12 +113,11 @@ LIMIT 10;
 -- Folders with no files inside
 -- UNCOMMENT TO RUN:
 -- BEGIN;
--- DELETE FROM files f1
--- WHERE is_folder = TRUE
---   AND NOT EXISTS (
---     SELECT 1 FROM files f2 
---     WHERE f2.folder_path LIKE f1.folder_path || '%'
---       AND f2.is_folder = FALSE
+-- DELETE FROM folders f
+-- WHERE NOT EXISTS (
+--     SELECT 1 FROM files 
+--     WHERE files.college_id = f.college_id
+--       AND files.folder_path LIKE f.path || '%'
 --   );
 -- COMMIT;
 
@@ -141,16 +135,15 @@ LIMIT 10;
 -- UNCOMMENT TO RUN:
 -- BEGIN;
 -- UPDATE files 
--- SET folder_path = '/' 
--- WHERE is_folder = FALSE;
+-- SET folder_path = '/';
 -- COMMIT;
 
 
 -- ** OPTION 11: Delete ALL folders (keeps files in root) **
 -- UNCOMMENT TO RUN:
 -- BEGIN;
--- UPDATE files SET folder_path = '/' WHERE is_folder = FALSE;
--- DELETE FROM files WHERE is_folder = TRUE;
+-- UPDATE files SET folder_path = '/';
+-- DELETE FROM folders;
 -- COMMIT;
 
 
@@ -168,9 +161,9 @@ LIMIT 10;
 -- ========================================
 
 -- After cleanup, run these to verify:
--- SELECT COUNT(*) as remaining_files FROM files WHERE is_folder = FALSE;
--- SELECT COUNT(*) as remaining_folders FROM files WHERE is_folder = TRUE;
--- SELECT SUM(file_size) / 1024 / 1024 / 1024 as total_gb FROM files WHERE is_folder = FALSE;
+-- SELECT COUNT(*) as remaining_files FROM files;
+-- SELECT COUNT(*) as remaining_folders FROM folders;
+-- SELECT SUM(file_size) / 1024 / 1024 / 1024 as total_gb FROM files;
 
 
 -- ========================================
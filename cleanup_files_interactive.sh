@@ -21,13 +21,13 @@ SELECT
     'Total Files' as metric, 
     COUNT(*) as count,
     ROUND(SUM(file_size)::numeric / 1024 / 1024, 2) as total_mb
-FROM files WHERE is_folder = FALSE
+FROM files
 UNION ALL
 SELECT 
     'Total Folders' as metric, 
     COUNT(*) as count,
     0 as total_mb
-FROM files WHERE is_folder = TRUE;
+FROM folders;
 "
 
 echo ""
@@ -39,7 +39,6 @@ SELECT
     COUNT(*) as files,
     ROUND(SUM(file_size)::numeric / 1024 / 1024, 2) as mb
 FROM files
-WHERE is_folder = FALSE
 GROUP BY department
 ORDER BY mb DESC;
 "
@@ -73,8 +72,7 @@ case $option in
         SELECT COUNT(*) as files_to_delete, 
                ROUND(SUM(file_size)::numeric / 1024 / 1024, 2) as mb_to_free
         FROM files 
-        WHERE is_folder = FALSE 
-          AND created_at < NOW() - INTERVAL '$days days';
+        WHERE created_at < NOW() - INTERVAL '$days days';
         "
         echo ""
         read -p "Confirm deletion? (type 'yes' to confirm): " confirm
@@ -82,8 +80,7 @@ case $option in
             run_query "
             BEGIN;
             DELETE FROM files 
-            WHERE is_folder = FALSE 
-              AND created_at < NOW() - INTERVAL '$days days';
+            WHERE created_at < NOW() - INTERVAL '$days days';
             COMMIT;
             SELECT 'Deleted ' || COUNT(*) || ' files' as result FROM files WHERE FALSE;
             "
@@ -140,7 +137,6 @@ case $option in
         run_query "
         SELECT original_filename, department, COUNT(*) as duplicates
         FROM files
-        WHERE is_folder = FALSE
         GROUP BY original_filename, department
         HAVING COUNT(*) > 1
         ORDER BY duplicates DESC
@@ -167,24 +163,22 @@ case $option in
         echo "Finding empty folders..."
         run_query "
         SELECT COUNT(*) as empty_folders
-        FROM files f1
-        WHERE is_folder = TRUE
-          AND NOT EXISTS (
-            SELECT 1 FROM files f2 
-            WHERE f2.folder_path LIKE f1.folder_path || '%'
-              AND f2.is_folder = FALSE
+        FROM folders f
+        WHERE NOT EXISTS (
+            SELECT 1 FROM files
+            WHERE files.college_id = f.college_id
+              AND files.folder_path LIKE f.path || '%'
           );
         "
         echo ""
         read -p "Delete empty folders? (type 'yes'): " confirm
         if [ "$confirm" = "yes" ]; then
             run_query "
-            DELETE FROM files f1
-            WHERE is_folder = TRUE
-              AND NOT EXISTS (
-                SELECT 1 FROM files f2 
-                WHERE f2.folder_path LIKE f1.folder_path || '%'
-                  AND f2.is_folder = FALSE
+            DELETE FROM folders f
+            WHERE NOT EXISTS (
+                SELECT 1 FROM files
+                WHERE files.college_id = f.college_id
+                  AND files.folder_path LIKE f.path || '%'
               );
             "
             echo "✅ Empty folders deleted"
@@ -198,13 +192,12 @@ case $option in
         run_query "
         SELECT COUNT(*) as orphaned_records
         FROM files 
-        WHERE is_folder = FALSE 
-          AND (file_path IS NULL OR file_path = '');
+        WHERE file_path IS NULL OR file_path = '';
         "
         echo ""
         read -p "Delete orphaned records? (type 'yes'): " confirm
         if [ "$confirm" = "yes" ]; then
-            run_query "DELETE FROM files WHERE is_folder = FALSE AND (file_path IS NULL OR file_path = '');"
+            run_query "DELETE FROM files WHERE file_path IS NULL OR file_path = '';"
             echo "✅ Orphaned records deleted"
         else
             echo "❌ Cancelled"
@@ -254,7 +247,6 @@ case $option in
             ROUND(file_size::numeric / 1024 / 1024, 2) as mb,
             created_at
         FROM files
-        WHERE is_folder = FALSE
         ORDER BY created_at DESC
         LIMIT 20;
         "
@@ -280,7 +272,7 @@ SELECT
     'Remaining Files' as metric, 
     COUNT(*) as count,
     ROUND(SUM(file_size)::numeric / 1024 / 1024, 2) as total_mb
-FROM files WHERE is_folder = FALSE;
+FROM files;
 "
 
 echo ""
@@ -155,11 +155,9 @@ def create_bulk_users():
                 post_type=random.choice(list(PostType)),
                 author_id=user.id,
                 college_id=user.college_id,
-                post_metadata={
-                    "likes": random.randint(0, 25),
-                    "comments": random.randint(0, 10),
-                    "shares": random.randint(0, 5)
-                }
+                like_count=random.randint(0, 25),
+                comment_count=random.randint(0, 10),
+                share_count=random.randint(0, 5)
             )
             db.add(post)
     
@@ -10,6 +10,7 @@ Usage:
     python db_setup.py --reset            # Reset and reinitialize
     python db_setup.py --status           # Show migration status
     python db_setup.py --create-migration # Create new migration template
+    python db_setup.py --maintain-partitions # Create upcoming monthly partitions (run monthly)
 
 Features:
 - Version-based migration system
@@ -145,6 +146,7 @@ class MigrationManager:
         
         if not pending:
             print("✅ No pending migrations")
+            self.maintain_partitions()
             return
         
         print(f"🔄 Found {len(pending)} pending migrations")
@@ -153,6 +155,31 @@ class MigrationManager:
             self.apply_migration(migration)
         
         print("🎉 All migrations applied successfully!")
+        
+        self.maintain_partitions()
+    
+    def maintain_partitions(self, months_ahead=3):
+        """Create the upcoming monthly partitions for every range-partitioned table"""
+        with self.engine.connect() as conn:
+            has_function = conn.execute(text(
+                "SELECT EXISTS (SELECT 1 FROM pg_proc WHERE proname = 'create_monthly_partitions')"
+            )).scalar()
+            if not has_function:
+                return
+            
+            parents = conn.execute(text("""
+                SELECT c.relname FROM pg_partitioned_table p
+                JOIN pg_class c ON c.oid = p.partrelid
+                ORDER BY c.relname
+            """)).scalars().all()
+            
+            for parent in parents:
+                conn.execute(text("SELECT create_monthly_partitions(:parent, :months_ahead)"),
+                             {"parent": parent, "months_ahead": months_ahead})
+            conn.commit()
+        
+        if parents:
+            print(f"🗓️ Monthly partitions ensured for: {', '.join(parents)}")
     
     def status(self):
         """Show migration status"""
@@ -345,6 +372,10 @@ def main():
     elif args[0] == "--fresh":
         fresh_install()
     
+    elif args[0] == "--maintain-partitions":
+        manager = MigrationManager()
+        manager.maintain_partitions()
+    
     else:
         print("Database Setup and Migration System")
         print("=" * 40)
@@ -355,6 +386,7 @@ def main():
         print("  python db_setup.py --reset            # Reset database")
         print("  python db_setup.py --status           # Show migration status")
         print("  python db_setup.py --create-migration # Create new migration")
+        print("  python db_setup.py --maintain-partitions # Create upcoming monthly partitions")
         print("\nExamples:")
         print("  python db_setup.py --create-migration 'Add user preferences'")
         print("  python db_setup.py --create-migration 'Update post schema'")
@@ -245,11 +245,9 @@ def generate_posts(db: Session):
                 post_type=getattr(PostType, post_type),
                 author_id=user.id,
                 college_id=user.college_id,
-                post_metadata={
-                    "likes": likes,
-                    "comments": comments,
-                    "shares": shares
-                },
+                like_count=likes,
+                comment_count=comments,
+                share_count=shares,
                 created_at=created_at,
                 updated_at=created_at
             )
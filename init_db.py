@@ -369,11 +369,9 @@ def init_db():
                 post_type=post_data["type"],
                 author_id=author.id,
                 college_id=author.college_id,
-                post_metadata={
-                    "likes": random.randint(5, 50),
-                    "comments": random.randint(0, 15),
-                    "shares": random.randint(0, 8)
-                }
+                like_count=random.randint(5, 50),
+                comment_count=random.randint(0, 15),
+                share_count=random.randint(0, 8)
             )
             db.add(post)
     
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
-Migration script to add folder support to the files table
-Run this script to add folder_path, is_folder, and parent_folder_id columns
+Create the default folders (/Documents, /Images, /Videos, /Archives) for every college
+The folder schema itself comes from migrations/ (folders table: 20241120_140000_split_folders_table.sql)
 """
 
 import psycopg2
@@ -19,7 +19,7 @@ DB_USER = os.getenv("DB_USER", "postgres")
 DB_PASSWORD = os.getenv("DB_PASSWORD", "")
 
 def run_migration():
-    """Run the folder support migration"""
+    """Create the default folders for every college"""
     try:
         # Connect to database
         conn = psycopg2.connect(
@@ -34,93 +34,10 @@ def run_migration():
         
         print("Connected to database successfully!")
         
-        # Check if columns already exist
-        cursor.execute("""
-            SELECT column_name 
-            FROM information_schema.columns 
-            WHERE table_name = 'files' AND column_name IN ('folder_path', 'is_folder', 'parent_folder_id')
-        """)
-        existing_columns = [row[0] for row in cursor.fetchall()]
-        
-        if 'folder_path' in existing_columns:
-            print("⚠️  Migration already applied (folder_path column exists)")
-            response = input("Do you want to continue anyway? (y/n): ")
-            if response.lower() != 'y':
-                print("Migration cancelled")
-                return
-        
-        print("\n📦 Starting migration to add folder support...")
-        
-        # Add folder_path column
-        if 'folder_path' not in existing_columns:
-            print("  ➜ Adding folder_path column...")
-            cursor.execute("""
-                ALTER TABLE files 
-                ADD COLUMN folder_path VARCHAR(1000) DEFAULT '/' NOT NULL
-            """)
-            print("  ✓ folder_path column added")
-        else:
-            print("  ⊙ folder_path column already exists")
-        
-        # Add is_folder column
-        if 'is_folder' not in existing_columns:
-            print("  ➜ Adding is_folder column...")
-            cursor.execute("""
-                ALTER TABLE files 
-                ADD COLUMN is_folder BOOLEAN DEFAULT FALSE NOT NULL
-            """)
-            print("  ✓ is_folder column added")
-        else:
-            print("  ⊙ is_folder column already exists")
-        
-        # Add parent_folder_id column
-        if 'parent_folder_id' not in existing_columns:
-            print("  ➜ Adding parent_folder_id column...")
-            cursor.execute("""
-                ALTER TABLE files 
-                ADD COLUMN parent_folder_id INTEGER NULL
-            """)
-            print("  ✓ parent_folder_id column added")
-        else:
-            print("  ⊙ parent_folder_id column already exists")
-        
-        # Create indexes
-        print("  ➜ Creating indexes...")
-        
-        # Check if indexes exist
-        cursor.execute("""
-            SELECT indexname FROM pg_indexes 
-            WHERE tablename = 'files' AND indexname = 'idx_files_folder_path'
-        """)
-        if not cursor.fetchone():
-            cursor.execute("""
-                CREATE INDEX idx_files_folder_path ON files(folder_path, college_id)
-            """)
-            print("  ✓ Index idx_files_folder_path created")
-        else:
-            print("  ⊙ Index idx_files_folder_path already exists")
-        
-        cursor.execute("""
-            SELECT indexname FROM pg_indexes 
-            WHERE tablename = 'files' AND indexname = 'idx_files_parent_folder'
-        """)
-        if not cursor.fetchone():
-            cursor.execute("""
-                CREATE INDEX idx_files_parent_folder ON files(parent_folder_id)
-            """)
-            print("  ✓ Index idx_files_parent_folder created")
-        else:
-            print("  ⊙ Index idx_files_parent_folder already exists")
-        
-        # Update existing files to set folder_path to root if NULL
-        print("  ➜ Updating existing files...")
-        cursor.execute("""
-            UPDATE files 
-            SET folder_path = '/' 
-            WHERE folder_path IS NULL OR folder_path = ''
-        """)
-        updated_count = cursor.rowcount
-        print(f"  ✓ Updated {updated_count} existing file(s) to root folder")
+        cursor.execute("SELECT to_regclass('folders') IS NOT NULL")
+        if not cursor.fetchone()[0]:
+            print("❌ folders table not found - run the SQL migrations in migrations/ first")
+            return
         
         # Create default folders for common categories
         print("\n📁 Creating default folders...")
@@ -152,35 +69,26 @@ def run_migration():
             for folder_path, description in default_folders:
                 # Check if folder already exists
                 cursor.execute("""
-                    SELECT id FROM files 
-                    WHERE folder_path = %s AND is_folder = TRUE AND college_id = %s
+                    SELECT id FROM folders 
+                    WHERE path = %s AND college_id = %s
                 """, (folder_path, college_id))
                 
                 if not cursor.fetchone():
                     folder_name = folder_path.split('/')[-1]
+                    # Top-level folders: no parent
                     cursor.execute("""
-                        INSERT INTO files (
-                            filename, original_filename, file_path, file_size,
-                            file_type, mime_type, description, folder_path,
-                            is_folder, department, college_id, uploaded_by,
-                            upload_metadata, is_indexed
+                        INSERT INTO folders (
+                            name, path, department, description, college_id, created_by
                         ) VALUES (
-                            %s, %s, '', 0, 'OTHER', 'application/x-directory',
-                            %s, %s, TRUE, 'System', %s, %s,
-                            '{"file_count": 0}', 'indexed'
+                            %s, %s, 'System', %s, %s, %s
                         )
-                    """, (folder_name, folder_name, description, folder_path, 
-                          college_id, user_id))
+                    """, (folder_name, folder_path, description, college_id, user_id))
                     print(f"    ✓ Created folder: {folder_path}")
                 else:
                     print(f"    ⊙ Folder already exists: {folder_path}")
         
-        print("\n✅ Migration completed successfully!")
-        print("\n📋 Summary:")
-        print("  • Added folder_path, is_folder, and parent_folder_id columns")
-        print("  • Created indexes for faster folder queries")
-        print(f"  • Updated {updated_count} existing files")
-        print(f"  • Created default folders for {len(colleges)} college(s)")
+        print("\n✅ Default folders created successfully!")
+        print(f"\n📋 Processed {len(colleges)} college(s)")
         
         cursor.close()
         conn.close()
@@ -193,16 +101,11 @@ def run_migration():
 
 if __name__ == "__main__":
     print("=" * 60)
-    print("FOLDER SUPPORT MIGRATION")
+    print("DEFAULT FOLDERS")
     print("=" * 60)
-    print("\nThis will add folder support to the files table.")
-    print("\nChanges to be made:")
-    print("  1. Add folder_path column (VARCHAR 1000)")
-    print("  2. Add is_folder column (BOOLEAN)")
-    print("  3. Add parent_folder_id column (INTEGER)")
-    print("  4. Create indexes for better performance")
-    print("  5. Update existing files to root folder")
-    print("  6. Create default folders")
+    print("\nThis will create the default folders for every college.")
+    print("\nFolders to be created (skipped where they already exist):")
+    print("  /Documents, /Images, /Videos, /Archives")
     print("\n" + "=" * 60)
     
     response = input("\nProceed with migration? (yes/no): ")
@@ -0,0 +1,16 @@
+-- Name: Add RBAC Lookup Indexes
+-- Description: Index the columns used by permission checks and per-user lookups
+-- Version: 20241118_120000
+-- Created: 2024-11-18
+-- Idempotent: Can be run multiple times safely
+
+-- Covering index for the custom permission JOIN run on every permission check
+-- (user_id, permission_id, granted) lets the lookup be answered from the index alone
+CREATE INDEX IF NOT EXISTS idx_user_custom_permissions_lookup
+    ON user_custom_permissions(user_id, permission_id, granted);
+
+-- Per-user lookups that currently fall back to sequential scans
+CREATE INDEX IF NOT EXISTS ix_reward_points_user_id ON reward_points(user_id);
+CREATE INDEX IF NOT EXISTS ix_rewards_giver_id ON rewards(giver_id);
+CREATE INDEX IF NOT EXISTS ix_rewards_receiver_id ON rewards(receiver_id);
+CREATE INDEX IF NOT EXISTS ix_files_uploaded_by ON files(uploaded_by);
@@ -0,0 +1,66 @@
+-- Name: Server-Side Timestamp Defaults
+-- Description: Let PostgreSQL fill created_at/updated_at instead of the application
+-- Version: 20241118_130000
+-- Created: 2024-11-18
+-- Idempotent: Can be run multiple times safely
+
+-- Timestamps are stored as naive UTC (timestamp without time zone), so the default
+-- converts now() to UTC explicitly instead of relying on the session TimeZone
+
+ALTER TABLE IF EXISTS colleges ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS users ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+ALTER TABLE IF EXISTS users ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS posts ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+ALTER TABLE IF EXISTS posts ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS reward_points ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+ALTER TABLE IF EXISTS reward_points ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS rewards ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS files ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+ALTER TABLE IF EXISTS files ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS ai_conversations ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS indexing_tasks ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS alerts ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+ALTER TABLE IF EXISTS alerts ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS products ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+ALTER TABLE IF EXISTS products ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS orders ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+ALTER TABLE IF EXISTS orders ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS order_items ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS carts ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+ALTER TABLE IF EXISTS carts ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS cart_items ALTER COLUMN added_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS point_transactions ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS wishlist_items ALTER COLUMN added_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS permissions ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS role_permissions ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS user_custom_permissions ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS post_likes ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS post_comments ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+ALTER TABLE IF EXISTS post_comments ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS post_ignites ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS college_reward_pools ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+ALTER TABLE IF EXISTS college_reward_pools ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE IF EXISTS pool_transactions ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
@@ -0,0 +1,38 @@
+-- Name: JSONB Metadata Defaults
+-- Description: Store post/file metadata as JSONB and let PostgreSQL supply the initial value
+-- Version: 20241118_140000
+-- Created: 2024-11-18
+-- Idempotent: Can be run multiple times safely
+
+-- ============================================
+-- 1. CONVERT METADATA COLUMNS TO JSONB
+-- ============================================
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'posts' AND column_name = 'post_metadata' AND data_type = 'json'
+    ) THEN
+        ALTER TABLE posts ALTER COLUMN post_metadata DROP DEFAULT;
+        ALTER TABLE posts ALTER COLUMN post_metadata TYPE JSONB USING post_metadata::jsonb;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'files' AND column_name = 'upload_metadata' AND data_type = 'json'
+    ) THEN
+        ALTER TABLE files ALTER COLUMN upload_metadata DROP DEFAULT;
+        ALTER TABLE files ALTER COLUMN upload_metadata TYPE JSONB USING upload_metadata::jsonb;
+    END IF;
+END $$;
+
+-- ============================================
+-- 2. SERVER-SIDE DEFAULTS
+-- ============================================
+
+ALTER TABLE IF EXISTS posts
+    ALTER COLUMN post_metadata SET DEFAULT '{"likes": 0, "comments": 0, "shares": 0}'::jsonb;
+
+ALTER TABLE IF EXISTS files
+    ALTER COLUMN upload_metadata SET DEFAULT '{"downloads": 0, "views": 0}'::jsonb;
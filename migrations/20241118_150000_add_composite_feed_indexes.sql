@@ -0,0 +1,30 @@
+-- Name: Composite Feed Indexes
+-- Description: Composite (equality, created_at DESC) indexes for per-user and per-college listings
+-- Version: 20241118_150000
+-- Created: 2024-11-18
+-- Idempotent: Can be run multiple times safely
+
+-- posts(college_id, created_at DESC), orders(user_id, created_at DESC) and
+-- point_transactions(user_id, created_at DESC) already exist from earlier migrations
+
+-- ============================================
+-- 1. NEW COMPOSITE INDEXES
+-- ============================================
+
+CREATE INDEX IF NOT EXISTS ix_alerts_user_isread_created ON alerts(user_id, is_read, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS ix_rewards_giver_created ON rewards(giver_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS ix_rewards_receiver_created ON rewards(receiver_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS ix_rewards_college_created ON rewards(college_id, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS ix_ai_conversations_user_created ON ai_conversations(user_id, created_at DESC);
+
+-- ============================================
+-- 2. DROP SINGLE-COLUMN INDEXES NOW COVERED BY A COMPOSITE PREFIX
+-- ============================================
+
+DROP INDEX IF EXISTS ix_alerts_user_id;
+DROP INDEX IF EXISTS ix_rewards_giver_id;
+DROP INDEX IF EXISTS ix_rewards_receiver_id;
+DROP INDEX IF EXISTS ix_orders_user_id;
+DROP INDEX IF EXISTS ix_point_transactions_user_id;
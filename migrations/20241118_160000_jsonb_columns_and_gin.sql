@@ -0,0 +1,41 @@
+-- Name: JSONB Columns and GIN Index
+-- Description: Convert remaining JSON columns to JSONB and index product specifications
+-- Version: 20241118_160000
+-- Created: 2024-11-18
+-- Idempotent: Can be run multiple times safely
+
+-- ============================================
+-- 1. CONVERT JSON COLUMNS TO JSONB
+-- ============================================
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'products' AND column_name = 'specifications' AND data_type = 'json'
+    ) THEN
+        ALTER TABLE products ALTER COLUMN specifications TYPE JSONB USING specifications::jsonb;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'ai_conversations' AND column_name = 'context_docs' AND data_type = 'json'
+    ) THEN
+        ALTER TABLE ai_conversations ALTER COLUMN context_docs TYPE JSONB USING context_docs::jsonb;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'pool_transactions' AND column_name = 'meta_data' AND data_type = 'json'
+    ) THEN
+        ALTER TABLE pool_transactions ALTER COLUMN meta_data TYPE JSONB USING meta_data::jsonb;
+    END IF;
+END $$;
+
+-- ============================================
+-- 2. GIN INDEX
+-- ============================================
+
+-- files.upload_metadata is rewritten on every view/download counter bump, so it
+-- is deliberately left without a GIN index
+CREATE INDEX IF NOT EXISTS ix_products_specs_gin ON products USING gin (specifications jsonb_path_ops);
@@ -0,0 +1,54 @@
+-- Name: Enum Columns to VARCHAR + CHECK
+-- Description: Store enum-valued columns as VARCHAR(50) with CHECK constraints instead of PostgreSQL ENUM types
+-- Version: 20241118_170000
+-- Created: 2024-11-18
+-- Idempotent: Can be run multiple times safely
+
+-- users.role / role_permissions.role keep their ENUM type (get_default_role_permissions returns it).
+-- The old ENUM types are left in place; nothing references them after this migration.
+
+DO $$
+DECLARE
+    col RECORD;
+BEGIN
+    FOR col IN
+        SELECT * FROM (VALUES
+            ('posts',    'post_type',   'ck_posts_post_type',     'GENERAL',
+             ARRAY['ANNOUNCEMENT', 'INFO', 'IMPORTANT', 'EVENTS', 'GENERAL']),
+            ('rewards',  'reward_type', 'ck_rewards_reward_type', NULL,
+             ARRAY['HELPFUL_POST', 'ACADEMIC_EXCELLENCE', 'COMMUNITY_PARTICIPATION', 'PEER_RECOGNITION',
+                   'EVENT_PARTICIPATION', 'MENTORSHIP', 'LEADERSHIP', 'OTHER']),
+            ('files',    'file_type',   'ck_files_file_type',     NULL,
+             ARRAY['DOCUMENT', 'PRESENTATION', 'SPREADSHEET', 'IMAGE', 'VIDEO', 'AUDIO', 'ARCHIVE', 'TEXT', 'OTHER']),
+            ('alerts',   'alert_type',  'ck_alerts_alert_type',   'GENERAL',
+             ARRAY['EVENT_NOTIFICATION', 'FEE_REMINDER', 'ANNOUNCEMENT', 'DEADLINE_REMINDER',
+                   'ACADEMIC_UPDATE', 'SYSTEM_NOTIFICATION', 'GENERAL']),
+            ('products', 'category',    'ck_products_category',   NULL,
+             ARRAY['ELECTRONICS', 'BOOKS', 'STATIONERY', 'APPAREL', 'FOOD_VOUCHERS', 'GIFT_CARDS',
+                   'EXPERIENCES', 'SOFTWARE', 'OTHER']),
+            ('products', 'status',      'ck_products_status',     'ACTIVE',
+             ARRAY['ACTIVE', 'INACTIVE', 'OUT_OF_STOCK']),
+            ('orders',   'status',      'ck_orders_status',       'PENDING',
+             ARRAY['PENDING', 'CONFIRMED', 'PROCESSING', 'READY_FOR_PICKUP', 'COMPLETED', 'CANCELLED', 'REFUNDED'])
+        ) AS t(table_name, column_name, constraint_name, default_value, allowed)
+    LOOP
+        CONTINUE WHEN NOT EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = col.table_name AND column_name = col.column_name
+        );
+
+        -- Enum-typed defaults can't be cast along with the column; drop and restore
+        EXECUTE format('ALTER TABLE %I ALTER COLUMN %I DROP DEFAULT', col.table_name, col.column_name);
+        EXECUTE format('ALTER TABLE %I ALTER COLUMN %I TYPE VARCHAR(50) USING %I::text',
+                       col.table_name, col.column_name, col.column_name);
+        IF col.default_value IS NOT NULL THEN
+            EXECUTE format('ALTER TABLE %I ALTER COLUMN %I SET DEFAULT %L',
+                           col.table_name, col.column_name, col.default_value);
+        END IF;
+
+        IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = col.constraint_name) THEN
+            EXECUTE format('ALTER TABLE %I ADD CONSTRAINT %I CHECK (%I = ANY (%L::text[]))',
+                           col.table_name, col.constraint_name, col.column_name, col.allowed);
+        END IF;
+    END LOOP;
+END $$;
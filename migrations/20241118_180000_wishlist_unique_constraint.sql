@@ -0,0 +1,31 @@
+-- Name: Wishlist Unique Constraint
+-- Description: Enforce one wishlist entry per user and product
+-- Version: 20241118_180000
+-- Created: 2024-11-18
+-- Idempotent: Can be run multiple times safely
+
+-- ============================================
+-- 1. REMOVE DUPLICATES (keep the earliest entry)
+-- ============================================
+
+DELETE FROM wishlist_items w
+USING wishlist_items older
+WHERE w.user_id = older.user_id
+  AND w.product_id = older.product_id
+  AND w.id > older.id;
+
+-- ============================================
+-- 2. UNIQUE CONSTRAINT
+-- ============================================
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'uq_wishlist_user_product') THEN
+        ALTER TABLE wishlist_items
+            ADD CONSTRAINT uq_wishlist_user_product UNIQUE (user_id, product_id);
+    END IF;
+END $$;
+
+-- The unique index covers both of these
+DROP INDEX IF EXISTS idx_wishlist_user_product;
+DROP INDEX IF EXISTS ix_wishlist_items_user_id;
@@ -0,0 +1,14 @@
+-- Name: Partial Indexes
+-- Description: Index only the unread alerts, pending indexing tasks and in-flight orders the hot queries target
+-- Version: 20241118_190000
+-- Created: 2024-11-18
+-- Idempotent: Can be run multiple times safely
+
+CREATE INDEX IF NOT EXISTS ix_alerts_unread ON alerts(user_id, created_at)
+    WHERE is_read = false AND is_enabled = true;
+
+CREATE INDEX IF NOT EXISTS ix_indexing_tasks_pending ON indexing_tasks(content_type, content_id)
+    WHERE status = 'pending';
+
+CREATE INDEX IF NOT EXISTS ix_orders_active ON orders(user_id)
+    WHERE status IN ('PENDING', 'CONFIRMED', 'PROCESSING');
@@ -0,0 +1,20 @@
+-- Name: BRIN created_at Indexes
+-- Description: Replace created_at B-trees on append-only tables with BRIN indexes
+-- Version: 20241118_200000
+-- Created: 2024-11-18
+-- Idempotent: Can be run multiple times safely
+
+-- Only tables whose rows are never updated keep physical order correlated with
+-- created_at. posts, alerts, orders, files and indexing_tasks are updated in place
+-- and pool_transactions is read newest-first with LIMIT, so those keep their B-trees.
+
+CREATE INDEX IF NOT EXISTS brin_point_transactions_created ON point_transactions
+    USING brin (created_at) WITH (pages_per_range = 32);
+CREATE INDEX IF NOT EXISTS brin_rewards_created ON rewards
+    USING brin (created_at) WITH (pages_per_range = 32);
+CREATE INDEX IF NOT EXISTS brin_ai_conversations_created ON ai_conversations
+    USING brin (created_at) WITH (pages_per_range = 32);
+
+DROP INDEX IF EXISTS ix_point_transactions_created_at;
+DROP INDEX IF EXISTS ix_rewards_created_at;
+DROP INDEX IF EXISTS ix_ai_conversations_created_at;
@@ -0,0 +1,14 @@
+-- Name: Folder Path Prefix Index
+-- Description: Let folder subtree LIKE 'prefix%' scans use an index
+-- Version: 20241118_210000
+-- Created: 2024-11-18
+-- Idempotent: Can be run multiple times safely
+
+-- B-trees in a non-C collation can't serve LIKE prefix matches; varchar_pattern_ops can,
+-- and it still serves the equality lookups the old folder_path and college_id indexes were used for
+CREATE INDEX IF NOT EXISTS ix_files_college_folder_path
+    ON files(college_id, folder_path varchar_pattern_ops);
+
+DROP INDEX IF EXISTS idx_files_folder_path;
+DROP INDEX IF EXISTS ix_files_folder_path;
+DROP INDEX IF EXISTS ix_files_college_id;
@@ -0,0 +1,44 @@
+-- Name: Cart and Order Item Keys
+-- Description: Unique (cart_id, product_id) on cart_items and an order_id index on order_items
+-- Version: 20241118_220000
+-- Created: 2024-11-18
+-- Idempotent: Can be run multiple times safely
+
+-- ============================================
+-- 1. MERGE DUPLICATE CART ROWS
+-- ============================================
+
+-- Fold quantities of duplicate rows into the earliest row, then remove the rest
+UPDATE cart_items keep
+SET quantity = dup.total_quantity
+FROM (
+    SELECT MIN(id) AS keep_id, SUM(quantity) AS total_quantity
+    FROM cart_items
+    GROUP BY cart_id, product_id
+    HAVING COUNT(*) > 1
+) dup
+WHERE keep.id = dup.keep_id;
+
+DELETE FROM cart_items c
+USING cart_items older
+WHERE c.cart_id = older.cart_id
+  AND c.product_id = older.product_id
+  AND c.id > older.id;
+
+-- ============================================
+-- 2. KEYS AND INDEXES
+-- ============================================
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'uq_cart_items_cart_product') THEN
+        ALTER TABLE cart_items
+            ADD CONSTRAINT uq_cart_items_cart_product UNIQUE (cart_id, product_id);
+    END IF;
+END $$;
+
+-- Covered by the unique constraint's index
+DROP INDEX IF EXISTS idx_cart_items_cart;
+
+-- Order items are loaded by order_id (order history / detail)
+CREATE INDEX IF NOT EXISTS ix_order_items_order_id ON order_items(order_id);
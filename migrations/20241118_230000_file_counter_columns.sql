@@ -0,0 +1,18 @@
+-- Name: File Counter Columns
+-- Description: Move file view/download counters out of upload_metadata into integer columns
+-- Version: 20241118_230000
+-- Created: 2024-11-18
+-- Idempotent: Can be run multiple times safely
+
+-- Neither column is indexed, so counter bumps qualify for HOT updates
+ALTER TABLE files ADD COLUMN IF NOT EXISTS view_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE files ADD COLUMN IF NOT EXISTS download_count INTEGER NOT NULL DEFAULT 0;
+
+-- Carry existing counts over and strip them from the JSON (only rows that still have them)
+UPDATE files
+SET view_count = view_count + COALESCE((upload_metadata->>'views')::INTEGER, 0),
+    download_count = download_count + COALESCE((upload_metadata->>'downloads')::INTEGER, 0),
+    upload_metadata = upload_metadata - 'views' - 'downloads'
+WHERE upload_metadata ? 'views' OR upload_metadata ? 'downloads';
+
+ALTER TABLE files ALTER COLUMN upload_metadata SET DEFAULT '{}'::jsonb;
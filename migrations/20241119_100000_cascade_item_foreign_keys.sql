@@ -0,0 +1,47 @@
+-- Name: Cascade Item Foreign Keys
+-- Description: Delete cart/order items in the database when their parent is deleted
+-- Version: 20241119_100000
+-- Created: 2024-11-19
+-- Idempotent: Can be run multiple times safely
+
+DO $$
+DECLARE
+    fk RECORD;
+    old_fk RECORD;
+BEGIN
+    FOR fk IN
+        SELECT * FROM (VALUES
+            ('order_items', 'order_id', 'orders'),
+            ('cart_items',  'cart_id',  'carts')
+        ) AS t(table_name, column_name, parent_table)
+    LOOP
+        -- Replace any existing FK on the column that isn't already ON DELETE CASCADE
+        IF EXISTS (
+            SELECT 1
+            FROM pg_constraint c
+            JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = ANY (c.conkey)
+            WHERE c.contype = 'f'
+              AND c.conrelid = fk.table_name::regclass
+              AND a.attname = fk.column_name
+              AND c.confdeltype = 'c'
+        ) THEN
+            CONTINUE;
+        END IF;
+
+        FOR old_fk IN
+            SELECT c.conname
+            FROM pg_constraint c
+            JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = ANY (c.conkey)
+            WHERE c.contype = 'f'
+              AND c.conrelid = fk.table_name::regclass
+              AND a.attname = fk.column_name
+        LOOP
+            EXECUTE format('ALTER TABLE %I DROP CONSTRAINT %I', fk.table_name, old_fk.conname);
+        END LOOP;
+
+        EXECUTE format(
+            'ALTER TABLE %I ADD CONSTRAINT %I FOREIGN KEY (%I) REFERENCES %I(id) ON DELETE CASCADE',
+            fk.table_name, fk.table_name || '_' || fk.column_name || '_fkey', fk.column_name, fk.parent_table
+        );
+    END LOOP;
+END $$;
@@ -0,0 +1,65 @@
+-- Name: Narrow File and Indexing Task Columns
+-- Description: Store indexing states as SMALLINT codes and drop arbitrary VARCHAR limits on file paths
+-- Version: 20241119_110000
+-- Created: 2024-11-19
+-- Idempotent: Can be run multiple times safely
+
+-- Codes are positions in INDEXING_STATES / TASK_STATES (app/models/models.py):
+--   files.is_indexed:      0 = pending, 1 = indexed, 2 = failed
+--   indexing_tasks.status: 0 = pending, 1 = processing, 2 = completed, 3 = failed
+
+-- ============================================
+-- 1. FILE PATHS: VARCHAR(n) -> TEXT
+-- ============================================
+
+-- Same on-disk representation; TEXT just drops the length check. The prefix index is
+-- rebuilt with text_pattern_ops to match the new column type.
+DROP INDEX IF EXISTS ix_files_college_folder_path;
+
+ALTER TABLE files ALTER COLUMN file_path TYPE TEXT;
+ALTER TABLE files ALTER COLUMN folder_path TYPE TEXT;
+
+CREATE INDEX IF NOT EXISTS ix_files_college_folder_path
+    ON files(college_id, folder_path text_pattern_ops);
+
+-- ============================================
+-- 2. FILES.IS_INDEXED -> SMALLINT
+-- ============================================
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'files' AND column_name = 'is_indexed' AND data_type <> 'smallint'
+    ) THEN
+        ALTER TABLE files ALTER COLUMN is_indexed DROP DEFAULT;
+        ALTER TABLE files ALTER COLUMN is_indexed TYPE SMALLINT USING (
+            CASE is_indexed WHEN 'indexed' THEN 1 WHEN 'failed' THEN 2 ELSE 0 END
+        );
+        ALTER TABLE files ALTER COLUMN is_indexed SET DEFAULT 0;
+    END IF;
+END $$;
+
+-- ============================================
+-- 3. INDEXING_TASKS.STATUS -> SMALLINT
+-- ============================================
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'indexing_tasks' AND column_name = 'status' AND data_type <> 'smallint'
+    ) THEN
+        -- The partial index predicate compares against the old text value
+        DROP INDEX IF EXISTS ix_indexing_tasks_pending;
+
+        ALTER TABLE indexing_tasks ALTER COLUMN status DROP DEFAULT;
+        ALTER TABLE indexing_tasks ALTER COLUMN status TYPE SMALLINT USING (
+            CASE status WHEN 'processing' THEN 1 WHEN 'completed' THEN 2 WHEN 'failed' THEN 3 ELSE 0 END
+        );
+        ALTER TABLE indexing_tasks ALTER COLUMN status SET DEFAULT 0;
+    END IF;
+END $$;
+
+CREATE INDEX IF NOT EXISTS ix_indexing_tasks_pending ON indexing_tasks(content_type, content_id)
+    WHERE status = 0;
@@ -0,0 +1,22 @@
+-- Name: Reward Points Unique User
+-- Description: One reward_points row per user so balance changes can be single-statement upserts
+-- Version: 20241119_120000
+-- Created: 2024-11-19
+-- Idempotent: Can be run multiple times safely
+
+-- Racing get-or-create calls could leave a user with more than one row; keep the oldest,
+-- which is the one the application has been reading
+DELETE FROM reward_points rp
+USING reward_points older
+WHERE older.user_id = rp.user_id
+  AND older.id < rp.id;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'uq_reward_points_user') THEN
+        ALTER TABLE reward_points ADD CONSTRAINT uq_reward_points_user UNIQUE (user_id);
+    END IF;
+END $$;
+
+-- The unique constraint's index serves every user_id lookup
+DROP INDEX IF EXISTS ix_reward_points_user_id;
@@ -0,0 +1,14 @@
+-- Name: Fillfactor for Update-Heavy Tables
+-- Description: Reserve page headroom on tables whose rows are updated in place so updates can stay HOT
+-- Version: 20241119_130000
+-- Created: 2024-11-19
+-- Idempotent: Can be run multiple times safely
+
+-- Only pages written from now on keep the 20% headroom; existing pages pick it up the
+-- next time the table is rewritten (VACUUM FULL / pg_repack).
+-- updated_at is deliberately left unindexed on these tables: an indexed column changing
+-- would rule out a HOT update regardless of free space.
+ALTER TABLE IF EXISTS reward_points SET (fillfactor = 80);
+ALTER TABLE IF EXISTS carts SET (fillfactor = 80);
+ALTER TABLE IF EXISTS cart_items SET (fillfactor = 80);
+ALTER TABLE IF EXISTS orders SET (fillfactor = 80);
@@ -0,0 +1,26 @@
+-- Name: Full-Text Search Columns
+-- Description: Generated tsvector columns with GIN indexes for post and file search
+-- Version: 20241119_140000
+-- Created: 2024-11-19
+-- Idempotent: Can be run multiple times safely
+
+-- Adding a stored generated column rewrites the table once; after that PostgreSQL keeps
+-- the tsvector in step with title/content (posts) and original_filename/description (files)
+
+-- ============================================
+-- 1. POSTS
+-- ============================================
+
+ALTER TABLE posts ADD COLUMN IF NOT EXISTS search_tsv TSVECTOR
+    GENERATED ALWAYS AS (to_tsvector('english', coalesce(title, '') || ' ' || coalesce(content, ''))) STORED;
+
+CREATE INDEX IF NOT EXISTS ix_posts_search ON posts USING gin (search_tsv);
+
+-- ============================================
+-- 2. FILES
+-- ============================================
+
+ALTER TABLE files ADD COLUMN IF NOT EXISTS search_tsv TSVECTOR
+    GENERATED ALWAYS AS (to_tsvector('english', coalesce(original_filename, '') || ' ' || coalesce(description, ''))) STORED;
+
+CREATE INDEX IF NOT EXISTS ix_files_search ON files USING gin (search_tsv);
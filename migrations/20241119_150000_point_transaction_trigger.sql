@@ -0,0 +1,40 @@
+-- Name: Point Transaction Balance Trigger
+-- Description: Apply each point_transactions INSERT to reward_points and fill in balance_after in the same statement
+-- Version: 20241119_150000
+-- Created: 2024-11-19
+-- Idempotent: Can be run multiple times safely
+
+-- The application now only inserts point_transactions rows; it no longer updates
+-- reward_points itself. SPENT rows must be covered by the current balance (otherwise the
+-- INSERT fails with check_violation); other debits stop at 0, as the app code did.
+
+CREATE OR REPLACE FUNCTION apply_point_transaction() RETURNS trigger AS $$
+BEGIN
+    IF NEW.transaction_type = 'SPENT' THEN
+        UPDATE reward_points
+        SET total_points = total_points + NEW.points,
+            updated_at = timezone('utc', now())
+        WHERE user_id = NEW.user_id AND total_points + NEW.points >= 0
+        RETURNING total_points INTO NEW.balance_after;
+
+        IF NOT FOUND THEN
+            RAISE EXCEPTION 'Insufficient points' USING ERRCODE = 'check_violation';
+        END IF;
+    ELSE
+        INSERT INTO reward_points (user_id, total_points)
+        VALUES (NEW.user_id, GREATEST(NEW.points, 0))
+        ON CONFLICT ON CONSTRAINT uq_reward_points_user DO UPDATE
+        SET total_points = GREATEST(reward_points.total_points + NEW.points, 0),
+            updated_at = timezone('utc', now())
+        RETURNING total_points INTO NEW.balance_after;
+    END IF;
+
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_point_transactions_balance ON point_transactions;
+
+CREATE TRIGGER trg_point_transactions_balance
+    BEFORE INSERT ON point_transactions
+    FOR EACH ROW EXECUTE FUNCTION apply_point_transaction();
@@ -0,0 +1,65 @@
+-- Name: Drop Redundant Indexes
+-- Description: Remove single-column indexes already covered by a primary key, unique constraint or composite index
+-- Version: 20241119_160000
+-- Created: 2024-11-19
+-- Idempotent: Can be run multiple times safely
+
+-- Each of these is maintained on every INSERT and write of the key for no read benefit
+
+-- ============================================
+-- 1. ix_<table>_id DUPLICATES OF THE PRIMARY KEY
+-- ============================================
+
+-- Left behind by create_all (Column(primary_key=True, index=True)); <table>_pkey is the same B-tree
+DROP INDEX IF EXISTS ix_colleges_id;
+DROP INDEX IF EXISTS ix_users_id;
+DROP INDEX IF EXISTS ix_posts_id;
+DROP INDEX IF EXISTS ix_reward_points_id;
+DROP INDEX IF EXISTS ix_rewards_id;
+DROP INDEX IF EXISTS ix_files_id;
+DROP INDEX IF EXISTS ix_ai_conversations_id;
+DROP INDEX IF EXISTS ix_indexing_tasks_id;
+DROP INDEX IF EXISTS ix_alerts_id;
+DROP INDEX IF EXISTS ix_products_id;
+DROP INDEX IF EXISTS ix_orders_id;
+DROP INDEX IF EXISTS ix_order_items_id;
+DROP INDEX IF EXISTS ix_carts_id;
+DROP INDEX IF EXISTS ix_cart_items_id;
+DROP INDEX IF EXISTS ix_point_transactions_id;
+DROP INDEX IF EXISTS ix_wishlist_items_id;
+DROP INDEX IF EXISTS ix_permissions_id;
+DROP INDEX IF EXISTS ix_role_permissions_id;
+DROP INDEX IF EXISTS ix_user_custom_permissions_id;
+DROP INDEX IF EXISTS ix_post_likes_id;
+DROP INDEX IF EXISTS ix_post_comments_id;
+DROP INDEX IF EXISTS ix_post_ignites_id;
+DROP INDEX IF EXISTS ix_college_reward_pools_id;
+DROP INDEX IF EXISTS ix_pool_transactions_id;
+
+-- ============================================
+-- 2. COVERED BY A UNIQUE CONSTRAINT
+-- ============================================
+
+-- unique_post_like (post_id, user_id) serves post_id lookups and is the same key as the composite
+DROP INDEX IF EXISTS idx_post_likes_post_id;
+DROP INDEX IF EXISTS idx_post_likes_composite;
+DROP INDEX IF EXISTS ix_post_likes_post_id;
+
+-- unique_post_ignite (post_id, giver_id), likewise
+DROP INDEX IF EXISTS idx_post_ignites_post_id;
+DROP INDEX IF EXISTS idx_post_ignites_composite;
+DROP INDEX IF EXISTS ix_post_ignites_post_id;
+
+-- college_reward_pools.college_id is UNIQUE
+DROP INDEX IF EXISTS idx_reward_pools_college_id;
+
+-- ============================================
+-- 3. COVERED BY A COMPOSITE INDEX
+-- ============================================
+
+-- idx_post_comments_created_at (post_id, created_at DESC)
+DROP INDEX IF EXISTS idx_post_comments_post_id;
+DROP INDEX IF EXISTS ix_post_comments_post_id;
+
+-- idx_user_custom_permissions_lookup (user_id, permission_id, granted)
+DROP INDEX IF EXISTS ix_user_custom_permissions_user_id;
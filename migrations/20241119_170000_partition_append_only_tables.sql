@@ -0,0 +1,101 @@
+-- Name: Partition Append-Only Tables
+-- Description: Range-partition point_transactions and ai_conversations by month on created_at
+-- Version: 20241119_170000
+-- Created: 2024-11-19
+-- Idempotent: Can be run multiple times safely
+
+-- Both tables are insert-only and read newest-first; monthly partitions keep the recent
+-- months' heap and index pages small and hot, and old months can be detached/dropped
+-- without a bulk DELETE. alerts stays unpartitioned: rows are updated in place
+-- (is_read) and the alert list reads a user's alerts regardless of age.
+--
+-- Each table is rebuilt as a partitioned table with (id, created_at) as its primary key,
+-- its rows copied over, and its indexes, foreign keys and triggers recreated on the parent.
+-- Rows older than the current month land in the DEFAULT partition.
+
+-- ============================================
+-- 1. PARTITION MAINTENANCE FUNCTION
+-- ============================================
+
+-- Also run by `python db_setup.py --maintain-partitions` to keep upcoming months created
+CREATE OR REPLACE FUNCTION create_monthly_partitions(parent TEXT, months_ahead INTEGER DEFAULT 3)
+RETURNS void AS $$
+DECLARE
+    first_month DATE := date_trunc('month', timezone('utc', now()))::date;
+    month_start DATE;
+BEGIN
+    EXECUTE format('CREATE TABLE IF NOT EXISTS %I PARTITION OF %I DEFAULT', parent || '_default', parent);
+
+    FOR i IN 0..months_ahead LOOP
+        month_start := first_month + make_interval(months => i);
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            parent || '_' || to_char(month_start, 'YYYYMM'),
+            parent,
+            month_start,
+            month_start + make_interval(months => 1)
+        );
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================
+-- 2. REBUILD AS PARTITIONED TABLES
+-- ============================================
+
+DO $$
+DECLARE
+    t TEXT;
+    old_table TEXT;
+    seq TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['point_transactions', 'ai_conversations'] LOOP
+        CONTINUE WHEN (SELECT relkind FROM pg_class WHERE oid = t::regclass) = 'p';
+
+        old_table := t || '_unpartitioned';
+        EXECUTE format('ALTER TABLE %I RENAME TO %I', t, old_table);
+
+        EXECUTE format(
+            'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS) PARTITION BY RANGE (created_at)',
+            t, old_table
+        );
+        EXECUTE format('ALTER TABLE %I ALTER COLUMN created_at SET NOT NULL', t);
+        PERFORM create_monthly_partitions(t);
+
+        -- created_at is the partition key; rows from before it had a default get one now
+        EXECUTE format('UPDATE %I SET created_at = timezone(''utc'', now()) WHERE created_at IS NULL', old_table);
+        EXECUTE format('INSERT INTO %I SELECT * FROM %I', t, old_table);
+
+        -- Keep the id sequence alive when the old table (its owner) is dropped
+        seq := pg_get_serial_sequence(old_table, 'id');
+        IF seq IS NOT NULL THEN
+            EXECUTE format('ALTER SEQUENCE %s OWNED BY %I.id', seq, t);
+        END IF;
+
+        EXECUTE format('DROP TABLE %I', old_table);
+
+        EXECUTE format('ALTER TABLE %I ADD PRIMARY KEY (id, created_at)', t);
+        EXECUTE format('ALTER TABLE %I ADD FOREIGN KEY (user_id) REFERENCES users(id)', t);
+        EXECUTE format('ALTER TABLE %I ADD FOREIGN KEY (college_id) REFERENCES colleges(id)', t);
+    END LOOP;
+END $$;
+
+-- ============================================
+-- 3. INDEXES AND TRIGGERS ON THE PARENTS
+-- ============================================
+
+-- Created on the parent, these cascade to every existing and future partition
+CREATE INDEX IF NOT EXISTS idx_point_transactions_user_created ON point_transactions(user_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS brin_point_transactions_created ON point_transactions
+    USING brin (created_at) WITH (pages_per_range = 32);
+
+CREATE INDEX IF NOT EXISTS ix_ai_conversations_user_created ON ai_conversations(user_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS brin_ai_conversations_created ON ai_conversations
+    USING brin (created_at) WITH (pages_per_range = 32);
+
+-- The balance trigger (20241119_150000) was dropped along with the old table
+DROP TRIGGER IF EXISTS trg_point_transactions_balance ON point_transactions;
+
+CREATE TRIGGER trg_point_transactions_balance
+    BEFORE INSERT ON point_transactions
+    FOR EACH ROW EXECUTE FUNCTION apply_point_transaction();
@@ -0,0 +1,34 @@
+-- Name: Deferrable Import Foreign Keys
+-- Description: Make the college/user foreign keys on users, posts and rewards DEFERRABLE INITIALLY DEFERRED
+-- Version: 20241119_180000
+-- Created: 2024-11-19
+-- Idempotent: Can be run multiple times safely
+
+-- With the checks deferred to COMMIT, a bulk import can COPY colleges, users, posts and
+-- rewards in one transaction without ordering the loads by dependency. ALTER CONSTRAINT
+-- only changes the constraint's timing; no table is rewritten or rescanned.
+
+DO $$
+DECLARE
+    fk RECORD;
+BEGIN
+    FOR fk IN
+        SELECT c.conrelid::regclass AS table_name, c.conname
+        FROM pg_constraint c
+        JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = ANY (c.conkey)
+        JOIN (VALUES
+            ('users',   'college_id'),
+            ('posts',   'author_id'),
+            ('posts',   'college_id'),
+            ('rewards', 'giver_id'),
+            ('rewards', 'receiver_id'),
+            ('rewards', 'college_id')
+        ) AS t(table_name, column_name)
+            ON c.conrelid = t.table_name::regclass AND a.attname = t.column_name
+        WHERE c.contype = 'f'
+          AND NOT (c.condeferrable AND c.condeferred)
+    LOOP
+        EXECUTE format('ALTER TABLE %s ALTER CONSTRAINT %I DEFERRABLE INITIALLY DEFERRED',
+                       fk.table_name, fk.conname);
+    END LOOP;
+END $$;
@@ -0,0 +1,17 @@
+-- Name: Post Counter Columns
+-- Description: Move the remaining post counters out of post_metadata into integer columns
+-- Version: 20241119_190000
+-- Created: 2024-11-19
+-- Idempotent: Can be run multiple times safely
+
+-- like_count/comment_count were backfilled from post_metadata when they were added and have
+-- been trigger-maintained since, so the JSON copies are stale. Only shares still lives in the JSON.
+ALTER TABLE posts ADD COLUMN IF NOT EXISTS share_count INTEGER NOT NULL DEFAULT 0;
+
+-- Carry shares over and strip every counter key from the JSON (only rows that still have them)
+UPDATE posts
+SET share_count = share_count + COALESCE((post_metadata->>'shares')::INTEGER, 0),
+    post_metadata = post_metadata - 'likes' - 'comments' - 'shares'
+WHERE post_metadata ? 'likes' OR post_metadata ? 'comments' OR post_metadata ? 'shares';
+
+ALTER TABLE posts ALTER COLUMN post_metadata SET DEFAULT '{}'::jsonb;
@@ -0,0 +1,39 @@
+-- Name: Query Shape Indexes
+-- Description: Composite indexes for the pool history and department file listings; drop single-column indexes they cover
+-- Version: 20241119_200000
+-- Created: 2024-11-19
+-- Idempotent: Can be run multiple times safely
+
+-- posts, alerts, orders, point_transactions, rewards and ai_conversations already have
+-- their (scope, created_at DESC) composites; this fills in the remaining query shapes.
+
+-- ============================================
+-- 1. NEW COMPOSITE INDEXES
+-- ============================================
+
+-- Pool history: WHERE college_id = ? ORDER BY created_at DESC
+CREATE INDEX IF NOT EXISTS ix_pool_transactions_college_created
+    ON pool_transactions (college_id, created_at DESC);
+
+-- Department browsing: WHERE college_id = ? AND department = ? [AND folder_path = ?]
+CREATE INDEX IF NOT EXISTS ix_files_college_department_folder
+    ON files (college_id, department, folder_path);
+
+-- ============================================
+-- 2. SINGLE-COLUMN INDEXES NOW COVERED
+-- ============================================
+
+-- Every created_at ordering on these tables is scoped by the leading column of a composite
+DROP INDEX IF EXISTS ix_posts_created_at;
+DROP INDEX IF EXISTS ix_alerts_created_at;
+DROP INDEX IF EXISTS ix_orders_created_at;
+DROP INDEX IF EXISTS ix_post_comments_created_at;
+DROP INDEX IF EXISTS ix_pool_transactions_created_at;
+DROP INDEX IF EXISTS idx_pool_transactions_created_at;
+
+-- Leading column of ix_pool_transactions_college_created
+DROP INDEX IF EXISTS ix_pool_transactions_college_id;
+DROP INDEX IF EXISTS idx_pool_transactions_college_id;
+
+-- Department filters always come with college_id
+DROP INDEX IF EXISTS ix_files_department;
@@ -0,0 +1,42 @@
+-- Name: Permission Unique Constraints
+-- Description: Ensure role_permissions and user_custom_permissions carry their UNIQUE constraints
+-- Version: 20241119_210000
+-- Created: 2024-11-19
+-- Idempotent: Can be run multiple times safely
+
+-- Databases built by the rbac migration already have both (inline UNIQUE, default names).
+-- Databases built from the models before the constraints were declared don't.
+
+-- ============================================
+-- 1. REMOVE DUPLICATES (keep the earliest entry)
+-- ============================================
+
+DELETE FROM role_permissions r
+USING role_permissions older
+WHERE r.role = older.role
+  AND r.permission_id = older.permission_id
+  AND r.college_id = older.college_id
+  AND r.id > older.id;
+
+DELETE FROM user_custom_permissions u
+USING user_custom_permissions older
+WHERE u.user_id = older.user_id
+  AND u.permission_id = older.permission_id
+  AND u.id > older.id;
+
+-- ============================================
+-- 2. UNIQUE CONSTRAINTS
+-- ============================================
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'role_permissions_role_permission_id_college_id_key') THEN
+        ALTER TABLE role_permissions
+            ADD CONSTRAINT role_permissions_role_permission_id_college_id_key UNIQUE (role, permission_id, college_id);
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'user_custom_permissions_user_id_permission_id_key') THEN
+        ALTER TABLE user_custom_permissions
+            ADD CONSTRAINT user_custom_permissions_user_id_permission_id_key UNIQUE (user_id, permission_id);
+    END IF;
+END $$;
@@ -0,0 +1,66 @@
+-- Name: BIGINT Identity Log Tables
+-- Description: Widen the ids of the high-volume log tables to BIGINT and move them from serial sequences to identity columns
+-- Version: 20241119_220000
+-- Created: 2024-11-19
+-- Idempotent: Can be run multiple times safely
+
+-- ALTER COLUMN ... TYPE BIGINT rewrites each table once; run it in a maintenance window.
+
+-- ============================================
+-- 1. PLAIN TABLES: BIGINT + GENERATED BY DEFAULT AS IDENTITY
+-- ============================================
+
+DO $$
+DECLARE
+    t TEXT;
+    seq TEXT;
+    next_id BIGINT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['alerts', 'order_items', 'post_likes', 'post_comments', 'post_ignites', 'pool_transactions'] LOOP
+        CONTINUE WHEN to_regclass(t) IS NULL;
+
+        IF (SELECT data_type FROM information_schema.columns
+            WHERE table_name = t AND column_name = 'id') <> 'bigint' THEN
+            EXECUTE format('ALTER TABLE %I ALTER COLUMN id TYPE BIGINT', t);
+        END IF;
+
+        CONTINUE WHEN (SELECT attidentity FROM pg_attribute
+                       WHERE attrelid = t::regclass AND attname = 'id') <> '';
+
+        -- Swap the serial default for an identity that carries on from the current max id
+        seq := pg_get_serial_sequence(t, 'id');
+        EXECUTE format('ALTER TABLE %I ALTER COLUMN id DROP DEFAULT', t);
+        IF seq IS NOT NULL THEN
+            EXECUTE format('DROP SEQUENCE %s', seq);
+        END IF;
+
+        EXECUTE format('SELECT COALESCE(MAX(id), 0) + 1 FROM %I', t) INTO next_id;
+        EXECUTE format('ALTER TABLE %I ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY (START WITH %s)', t, next_id);
+    END LOOP;
+END $$;
+
+-- ============================================
+-- 2. PARTITIONED TABLES: BIGINT, KEEP THE SEQUENCE
+-- ============================================
+
+-- Identity columns aren't allowed on partitioned tables before PostgreSQL 17, so
+-- point_transactions and ai_conversations keep their sequence, widened to BIGINT
+DO $$
+DECLARE
+    t TEXT;
+    seq TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['point_transactions', 'ai_conversations'] LOOP
+        CONTINUE WHEN to_regclass(t) IS NULL;
+
+        IF (SELECT data_type FROM information_schema.columns
+            WHERE table_name = t AND column_name = 'id') <> 'bigint' THEN
+            EXECUTE format('ALTER TABLE %I ALTER COLUMN id TYPE BIGINT', t);
+        END IF;
+
+        seq := pg_get_serial_sequence(t, 'id');
+        IF seq IS NOT NULL THEN
+            EXECUTE format('ALTER SEQUENCE %s AS BIGINT', seq);
+        END IF;
+    END LOOP;
+END $$;
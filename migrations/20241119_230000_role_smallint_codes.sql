@@ -0,0 +1,37 @@
+-- Name: Role SMALLINT Codes
+-- Description: Store users.role and role_permissions.role as SMALLINT codes instead of the user_role ENUM
+-- Version: 20241119_230000
+-- Created: 2024-11-19
+-- Idempotent: Can be run multiple times safely
+
+-- Codes are positions in UserRole (app/models/models.py): 0 = admin, 1 = staff, 2 = student.
+-- The user_role type is left in place for get_default_role_permissions(); no column uses it after this.
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'users' AND column_name = 'role' AND data_type <> 'smallint'
+    ) THEN
+        -- The one-admin-per-college predicate compares against the old text value
+        DROP INDEX IF EXISTS idx_one_admin_per_college;
+
+        ALTER TABLE users ALTER COLUMN role DROP DEFAULT;
+        ALTER TABLE users ALTER COLUMN role TYPE SMALLINT USING (
+            CASE role::text WHEN 'admin' THEN 0 WHEN 'staff' THEN 1 ELSE 2 END
+        );
+        ALTER TABLE users ALTER COLUMN role SET DEFAULT 2;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'role_permissions' AND column_name = 'role' AND data_type <> 'smallint'
+    ) THEN
+        ALTER TABLE role_permissions ALTER COLUMN role TYPE SMALLINT USING (
+            CASE role::text WHEN 'admin' THEN 0 WHEN 'staff' THEN 1 ELSE 2 END
+        );
+    END IF;
+END $$;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_one_admin_per_college ON users(college_id)
+    WHERE role = 0;
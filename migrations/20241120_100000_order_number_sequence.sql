@@ -0,0 +1,12 @@
+-- Name: Order Number Sequence
+-- Description: Generate orders.order_number in PostgreSQL from a sequence instead of in the application
+-- Version: 20241120_100000
+-- Created: 2024-11-20
+-- Idempotent: Can be run multiple times safely
+
+-- New numbers look like ORD-0000000001. Existing ORD<timestamp><hex> numbers are longer
+-- and have no dash, so the two formats can't collide under the unique index.
+CREATE SEQUENCE IF NOT EXISTS order_number_seq;
+
+ALTER TABLE orders ALTER COLUMN order_number
+    SET DEFAULT 'ORD-' || to_char(nextval('order_number_seq'), 'FM0000000000');
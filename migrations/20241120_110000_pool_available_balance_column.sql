@@ -0,0 +1,11 @@
+-- Name: Pool Available Balance Column
+-- Description: Ensure college_reward_pools.available_balance exists as a stored generated column
+-- Version: 20241120_110000
+-- Created: 2024-11-20
+-- Idempotent: Can be run multiple times safely
+
+-- The reward pool migration creates it; databases built from the models before the
+-- column was mapped don't have it
+ALTER TABLE college_reward_pools
+    ADD COLUMN IF NOT EXISTS available_balance INTEGER
+    GENERATED ALWAYS AS (total_balance - reserved_balance) STORED;
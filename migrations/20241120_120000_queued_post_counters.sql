@@ -0,0 +1,54 @@
+-- Name: Queued Post Counters
+-- Description: Queue posts for like/ignite recounts instead of updating posts on every click
+-- Version: 20241120_120000
+-- Created: 2024-11-20
+-- Idempotent: Can be run multiple times safely
+
+-- The per-row counter triggers UPDATE the posts row on every like/ignite, so clicks on a
+-- busy post serialize on that row's lock. Now each click only queues the post id and the
+-- API recounts queued posts every few seconds (app/services/post_counters.py).
+-- comment_count keeps its synchronous trigger; comments are far less frequent.
+
+-- ============================================
+-- 1. QUEUE TABLE
+-- ============================================
+
+-- No FK: a deleted post's queue entry just matches nothing when drained
+CREATE TABLE IF NOT EXISTS post_counter_queue (
+    post_id INTEGER PRIMARY KEY
+);
+
+-- ============================================
+-- 2. TRIGGERS
+-- ============================================
+
+CREATE OR REPLACE FUNCTION queue_post_counter_refresh() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO post_counter_queue (post_id)
+    VALUES (CASE WHEN TG_OP = 'DELETE' THEN OLD.post_id ELSE NEW.post_id END)
+    ON CONFLICT DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_update_like_count ON post_likes;
+DROP TRIGGER IF EXISTS trigger_update_ignite_count ON post_ignites;
+
+DROP TRIGGER IF EXISTS trg_post_likes_queue_counters ON post_likes;
+CREATE TRIGGER trg_post_likes_queue_counters
+    AFTER INSERT OR DELETE ON post_likes
+    FOR EACH ROW EXECUTE FUNCTION queue_post_counter_refresh();
+
+DROP TRIGGER IF EXISTS trg_post_ignites_queue_counters ON post_ignites;
+CREATE TRIGGER trg_post_ignites_queue_counters
+    AFTER INSERT OR DELETE ON post_ignites
+    FOR EACH ROW EXECUTE FUNCTION queue_post_counter_refresh();
+
+-- ============================================
+-- 3. ONE-TIME RECONCILE
+-- ============================================
+
+-- Start from exact counts so the queue only has to track changes from here on
+UPDATE posts
+SET like_count = (SELECT count(*) FROM post_likes WHERE post_likes.post_id = posts.id),
+    ignite_count = (SELECT count(*) FROM post_ignites WHERE post_ignites.post_id = posts.id);
@@ -0,0 +1,105 @@
+-- Name: Partition Pool Transactions
+-- Description: Range-partition pool_transactions by month on created_at
+-- Version: 20241120_130000
+-- Created: 2024-11-20
+-- Idempotent: Can be run multiple times safely
+
+-- pool_transactions is the college pool's insert-only ledger, read newest-first per college,
+-- so it gets the same monthly layout as point_transactions and ai_conversations
+-- (20241119_170000). alerts and indexing_tasks stay unpartitioned: both are updated in place
+-- (is_read, status) and looked up by id alone, which a partitioned table can't make unique.
+--
+-- The table is rebuilt as a partitioned table with (id, created_at) as its primary key.
+-- Partitioned tables can't have identity columns before PostgreSQL 17, so id goes back to
+-- a sequence default that carries on from the current max id.
+
+-- ============================================
+-- 1. REBUILD AS A PARTITIONED TABLE
+-- ============================================
+
+DO $$
+DECLARE
+    next_id BIGINT;
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = 'pool_transactions'::regclass) <> 'p' THEN
+        -- The view would follow the renamed table and block its DROP; recreated in section 3
+        DROP VIEW IF EXISTS pool_analytics;
+
+        ALTER TABLE pool_transactions RENAME TO pool_transactions_unpartitioned;
+
+        CREATE TABLE pool_transactions (
+            LIKE pool_transactions_unpartitioned INCLUDING DEFAULTS INCLUDING CONSTRAINTS
+        ) PARTITION BY RANGE (created_at);
+        ALTER TABLE pool_transactions ALTER COLUMN created_at SET NOT NULL;
+        PERFORM create_monthly_partitions('pool_transactions');
+
+        UPDATE pool_transactions_unpartitioned
+        SET created_at = timezone('utc', now())
+        WHERE created_at IS NULL;
+        INSERT INTO pool_transactions SELECT * FROM pool_transactions_unpartitioned;
+
+        SELECT COALESCE(MAX(id), 0) + 1 INTO next_id FROM pool_transactions;
+
+        -- Drops the identity sequence along with the old table
+        DROP TABLE pool_transactions_unpartitioned;
+
+        CREATE SEQUENCE pool_transactions_id_seq OWNED BY pool_transactions.id;
+        PERFORM setval('pool_transactions_id_seq', next_id, false);
+        ALTER TABLE pool_transactions ALTER COLUMN id SET DEFAULT nextval('pool_transactions_id_seq');
+
+        ALTER TABLE pool_transactions ADD PRIMARY KEY (id, created_at);
+        ALTER TABLE pool_transactions
+            ADD FOREIGN KEY (college_id) REFERENCES colleges(id) ON DELETE CASCADE;
+        ALTER TABLE pool_transactions
+            ADD FOREIGN KEY (beneficiary_user_id) REFERENCES users(id) ON DELETE SET NULL;
+        ALTER TABLE pool_transactions
+            ADD FOREIGN KEY (created_by) REFERENCES users(id) ON DELETE SET NULL;
+    END IF;
+END $$;
+
+-- ============================================
+-- 2. INDEXES AND TRIGGERS ON THE PARENT
+-- ============================================
+
+-- Created on the parent, these cascade to every existing and future partition
+CREATE INDEX IF NOT EXISTS ix_pool_transactions_college_created
+    ON pool_transactions (college_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS ix_pool_transactions_transaction_type ON pool_transactions (transaction_type);
+CREATE INDEX IF NOT EXISTS ix_pool_transactions_reason ON pool_transactions (reason);
+
+-- The lifetime stats trigger (20241117_130000) was dropped along with the old table
+DROP TRIGGER IF EXISTS trigger_update_pool_lifetime_stats ON pool_transactions;
+
+CREATE TRIGGER trigger_update_pool_lifetime_stats
+    AFTER INSERT ON pool_transactions
+    FOR EACH ROW EXECUTE FUNCTION update_pool_lifetime_stats();
+
+-- ============================================
+-- 3. POOL ANALYTICS VIEW
+-- ============================================
+
+-- Same definition as 20241117_130000, now reading the partitioned table
+CREATE OR REPLACE VIEW pool_analytics AS
+SELECT 
+    crp.college_id,
+    c.name as college_name,
+    crp.total_balance,
+    crp.reserved_balance,
+    (crp.total_balance - crp.reserved_balance) as available_balance,
+    crp.initial_allocation,
+    crp.lifetime_credits,
+    crp.lifetime_debits,
+    crp.low_balance_threshold,
+    CASE 
+        WHEN (crp.total_balance - crp.reserved_balance) < crp.low_balance_threshold THEN true
+        ELSE false
+    END as is_low_balance,
+    (SELECT COUNT(*) FROM pool_transactions WHERE college_id = crp.college_id AND transaction_type = 'CREDIT') as total_credit_transactions,
+    (SELECT COUNT(*) FROM pool_transactions WHERE college_id = crp.college_id AND transaction_type = 'DEBIT') as total_debit_transactions,
+    (SELECT COUNT(*) FROM pool_transactions WHERE college_id = crp.college_id AND reason = 'welcome_bonus') as welcome_bonuses_given,
+    (SELECT COUNT(*) FROM pool_transactions WHERE college_id = crp.college_id AND reason = 'post_reward') as post_rewards_given,
+    (SELECT COUNT(*) FROM pool_transactions WHERE college_id = crp.college_id AND reason = 'admin_reward') as admin_rewards_given,
+    crp.created_at,
+    crp.updated_at
+FROM college_reward_pools crp
+JOIN colleges c ON c.id = crp.college_id;
@@ -0,0 +1,62 @@
+-- Name: Split Folders Table
+-- Description: Move folder rows out of files into their own folders table
+-- Version: 20241120_140000
+-- Created: 2024-11-20
+-- Idempotent: Can be run multiple times safely
+
+-- Folders were stored as files rows with is_folder = TRUE, so every file listing, count
+-- and search had to filter them out and carried their placeholder file columns. Folders
+-- now live in `folders` (linked to their parent folder by parent_id), files keep addressing
+-- their folder through folder_path, and files.is_folder/parent_folder_id are dropped.
+
+-- ============================================
+-- 1. FOLDERS TABLE
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS folders (
+    id SERIAL PRIMARY KEY,
+    created_at TIMESTAMP DEFAULT timezone('utc', now()),
+    updated_at TIMESTAMP DEFAULT timezone('utc', now()),
+    parent_id INTEGER REFERENCES folders(id) ON DELETE CASCADE,
+    college_id INTEGER NOT NULL REFERENCES colleges(id),
+    created_by INTEGER NOT NULL REFERENCES users(id),
+    name VARCHAR(255) NOT NULL,
+    path TEXT NOT NULL,
+    department VARCHAR(100) NOT NULL,
+    description TEXT
+);
+
+CREATE INDEX IF NOT EXISTS ix_folders_parent ON folders (parent_id);
+CREATE INDEX IF NOT EXISTS ix_folders_college_path ON folders (college_id, path text_pattern_ops);
+
+-- ============================================
+-- 2. MOVE FOLDER ROWS OUT OF FILES
+-- ============================================
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'files' AND column_name = 'is_folder'
+    ) THEN
+        INSERT INTO folders (created_at, updated_at, college_id, created_by, name, path, department, description)
+        SELECT created_at, updated_at, college_id, uploaded_by, filename, folder_path, department, description
+        FROM files
+        WHERE is_folder = TRUE;
+
+        -- Parent = the folder one path segment up in the same college and department
+        UPDATE folders child
+        SET parent_id = parent.id
+        FROM folders parent
+        WHERE parent.college_id = child.college_id
+          AND parent.department = child.department
+          AND parent.path = regexp_replace(child.path, '/[^/]+$', '')
+          AND child.parent_id IS NULL;
+
+        DELETE FROM files WHERE is_folder = TRUE;
+
+        -- Drops idx_files_parent_folder with it
+        ALTER TABLE files DROP COLUMN IF EXISTS parent_folder_id;
+        ALTER TABLE files DROP COLUMN is_folder;
+    END IF;
+END $$;
@@ -0,0 +1,17 @@
+-- Name: Active Row Partial Indexes
+-- Description: Partial index for the active-product catalog; college index for users
+-- Version: 20241120_150000
+-- Created: 2024-11-20
+-- Idempotent: Can be run multiple times safely
+
+-- Unread alerts already have their partial index (ix_alerts_unread, 20241118_190000).
+
+-- Catalog listings filter status = 'ACTIVE' on every request, so only those rows are indexed
+CREATE INDEX IF NOT EXISTS ix_products_active ON products(college_id, category)
+    WHERE status = 'ACTIVE';
+
+-- No query filters on is_active alone; a two-value B-tree the planner never picks
+DROP INDEX IF EXISTS ix_users_is_active;
+
+-- User lists scope by college and show deactivated accounts too, so this index is not partial
+CREATE INDEX IF NOT EXISTS ix_users_college ON users(college_id);
@@ -0,0 +1,32 @@
+-- Name: College Leaderboard View
+-- Description: Precompute per-college reward point rankings in a materialized view
+-- Version: 20241120_160000
+-- Created: 2024-11-20
+-- Idempotent: Can be run multiple times safely
+
+-- GET /rewards/leaderboard joined reward_points to users and sorted a whole college on every
+-- call. It now reads ranks from this view, which each API worker refreshes every
+-- LEADERBOARD_REFRESH_SECONDS (app/services/leaderboard.py).
+-- row_number keeps the old ranking semantics: ties are ordered by user id, ranks are unique.
+
+-- ============================================
+-- 1. MATERIALIZED VIEW
+-- ============================================
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_college_leaderboard AS
+SELECT rp.user_id,
+       u.college_id,
+       row_number() OVER (PARTITION BY u.college_id ORDER BY rp.total_points DESC, rp.user_id) AS rank,
+       rp.total_points,
+       u.full_name,
+       u.department
+FROM reward_points rp
+JOIN users u ON u.id = rp.user_id;
+
+-- ============================================
+-- 2. INDEX
+-- ============================================
+
+-- Serves WHERE college_id = ? ORDER BY rank LIMIT n, and is the unique index
+-- REFRESH MATERIALIZED VIEW CONCURRENTLY needs
+CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_college_leaderboard_rank ON mv_college_leaderboard (college_id, rank);
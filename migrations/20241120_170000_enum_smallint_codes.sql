@@ -0,0 +1,46 @@
+-- Name: Enum SMALLINT Codes
+-- Description: Store post_type, reward_type, file_type, alert_type and product category as SMALLINT codes instead of VARCHAR + CHECK
+-- Version: 20241120_170000
+-- Created: 2024-11-20
+-- Idempotent: Can be run multiple times safely
+
+-- Codes are positions in the enum classes (app/models/models.py), which is also the order
+-- of the arrays below: code = array_position(allowed, old_value) - 1.
+-- products.status and orders.status stay VARCHAR; partial indexes filter on their text values.
+
+DO $$
+DECLARE
+    col RECORD;
+BEGIN
+    FOR col IN
+        SELECT * FROM (VALUES
+            ('posts',    'post_type',   'ck_posts_post_type',     4,
+             ARRAY['ANNOUNCEMENT', 'INFO', 'IMPORTANT', 'EVENTS', 'GENERAL']),
+            ('rewards',  'reward_type', 'ck_rewards_reward_type', NULL,
+             ARRAY['HELPFUL_POST', 'ACADEMIC_EXCELLENCE', 'COMMUNITY_PARTICIPATION', 'PEER_RECOGNITION',
+                   'EVENT_PARTICIPATION', 'MENTORSHIP', 'LEADERSHIP', 'OTHER']),
+            ('files',    'file_type',   'ck_files_file_type',     NULL,
+             ARRAY['DOCUMENT', 'PRESENTATION', 'SPREADSHEET', 'IMAGE', 'VIDEO', 'AUDIO', 'ARCHIVE', 'TEXT', 'OTHER']),
+            ('alerts',   'alert_type',  'ck_alerts_alert_type',   6,
+             ARRAY['EVENT_NOTIFICATION', 'FEE_REMINDER', 'ANNOUNCEMENT', 'DEADLINE_REMINDER',
+                   'ACADEMIC_UPDATE', 'SYSTEM_NOTIFICATION', 'GENERAL']),
+            ('products', 'category',    'ck_products_category',   NULL,
+             ARRAY['ELECTRONICS', 'BOOKS', 'STATIONERY', 'APPAREL', 'FOOD_VOUCHERS', 'GIFT_CARDS',
+                   'EXPERIENCES', 'SOFTWARE', 'OTHER'])
+        ) AS t(table_name, column_name, constraint_name, default_code, allowed)
+    LOOP
+        CONTINUE WHEN NOT EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_name = col.table_name AND column_name = col.column_name AND data_type <> 'smallint'
+        );
+
+        EXECUTE format('ALTER TABLE %I DROP CONSTRAINT IF EXISTS %I', col.table_name, col.constraint_name);
+        EXECUTE format('ALTER TABLE %I ALTER COLUMN %I DROP DEFAULT', col.table_name, col.column_name);
+        EXECUTE format('ALTER TABLE %I ALTER COLUMN %I TYPE SMALLINT USING (array_position(%L::text[], %I::text) - 1)',
+                       col.table_name, col.column_name, col.allowed, col.column_name);
+        IF col.default_code IS NOT NULL THEN
+            EXECUTE format('ALTER TABLE %I ALTER COLUMN %I SET DEFAULT %s',
+                           col.table_name, col.column_name, col.default_code);
+        END IF;
+    END LOOP;
+END $$;
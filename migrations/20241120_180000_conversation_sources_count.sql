@@ -0,0 +1,10 @@
+-- Name: Conversation Sources Count
+-- Description: Add ai_conversations.sources_count as a stored generated column so listings don't read context_docs
+-- Version: 20241120_180000
+-- Created: 2024-11-20
+-- Idempotent: Can be run multiple times safely
+
+-- Added on the partitioned parent, so every monthly partition gets the column too
+ALTER TABLE ai_conversations
+    ADD COLUMN IF NOT EXISTS sources_count INTEGER
+    GENERATED ALWAYS AS (coalesce(jsonb_array_length(context_docs), 0)) STORED;
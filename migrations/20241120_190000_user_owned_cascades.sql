@@ -0,0 +1,77 @@
+-- Name: User-Owned Row Cascades
+-- Description: Delete a user's rows in the database when the user is deleted; unlink optional post references, shared folders/products and pool ledger entries
+-- Version: 20241120_190000
+-- Created: 2024-11-20
+-- Idempotent: Can be run multiple times safely
+
+-- delete_user removes the users row and lets these foreign keys take the owned rows with it.
+-- posts.author_id and rewards.giver_id/receiver_id keep DEFERRABLE INITIALLY DEFERRED
+-- (see 20241119_180000); the referential action itself is never deferred.
+-- Folders and products are shared with the college, and pool_transactions is the college
+-- pool's ledger, so they only lose their user links.
+
+ALTER TABLE folders ALTER COLUMN created_by DROP NOT NULL;
+ALTER TABLE products ALTER COLUMN created_by DROP NOT NULL;
+
+DO $$
+DECLARE
+    fk RECORD;
+    old_fk RECORD;
+BEGIN
+    FOR fk IN
+        SELECT * FROM (VALUES
+            ('posts',                   'author_id',   'users', 'CASCADE',  'c', true),
+            ('reward_points',           'user_id',     'users', 'CASCADE',  'c', false),
+            ('rewards',                 'giver_id',    'users', 'CASCADE',  'c', true),
+            ('rewards',                 'receiver_id', 'users', 'CASCADE',  'c', true),
+            ('rewards',                 'post_id',     'posts', 'SET NULL', 'n', false),
+            ('files',                   'uploaded_by', 'users', 'CASCADE',  'c', false),
+            ('folders',                 'created_by',  'users', 'SET NULL', 'n', false),
+            ('products',                'created_by',  'users', 'SET NULL', 'n', false),
+            ('ai_conversations',        'user_id',     'users', 'CASCADE',  'c', false),
+            ('alerts',                  'user_id',     'users', 'CASCADE',  'c', false),
+            ('alerts',                  'created_by',  'users', 'CASCADE',  'c', false),
+            ('alerts',                  'post_id',     'posts', 'SET NULL', 'n', false),
+            ('orders',                  'user_id',     'users', 'CASCADE',  'c', false),
+            ('carts',                   'user_id',     'users', 'CASCADE',  'c', false),
+            ('point_transactions',      'user_id',     'users', 'CASCADE',  'c', false),
+            ('pool_transactions',       'beneficiary_user_id', 'users', 'SET NULL', 'n', false),
+            ('pool_transactions',       'created_by',  'users', 'SET NULL', 'n', false),
+            ('wishlist_items',          'user_id',     'users', 'CASCADE',  'c', false),
+            ('user_custom_permissions', 'user_id',     'users', 'CASCADE',  'c', false),
+            ('user_custom_permissions', 'granted_by',  'users', 'SET NULL', 'n', false)
+        ) AS t(table_name, column_name, parent_table, on_delete, deltype, is_deferred)
+    LOOP
+        CONTINUE WHEN to_regclass(fk.table_name) IS NULL;
+
+        -- Replace any existing FK on the column that doesn't already have this action
+        IF EXISTS (
+            SELECT 1
+            FROM pg_constraint c
+            JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = ANY (c.conkey)
+            WHERE c.contype = 'f'
+              AND c.conrelid = fk.table_name::regclass
+              AND a.attname = fk.column_name
+              AND c.confdeltype = fk.deltype
+        ) THEN
+            CONTINUE;
+        END IF;
+
+        FOR old_fk IN
+            SELECT c.conname
+            FROM pg_constraint c
+            JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = ANY (c.conkey)
+            WHERE c.contype = 'f'
+              AND c.conrelid = fk.table_name::regclass
+              AND a.attname = fk.column_name
+        LOOP
+            EXECUTE format('ALTER TABLE %I DROP CONSTRAINT %I', fk.table_name, old_fk.conname);
+        END LOOP;
+
+        EXECUTE format(
+            'ALTER TABLE %I ADD CONSTRAINT %I FOREIGN KEY (%I) REFERENCES %I(id) ON DELETE %s%s',
+            fk.table_name, fk.table_name || '_' || fk.column_name || '_fkey', fk.column_name, fk.parent_table,
+            fk.on_delete, CASE WHEN fk.is_deferred THEN ' DEFERRABLE INITIALLY DEFERRED' ELSE '' END
+        );
+    END LOOP;
+END $$;
@@ -52,8 +52,9 @@ fi
 
 echo ""
 echo "3. Database schema verification..."
-# Check database
+# Check database: files address their folder by folder_path, folders live in their own table
 db_check=$(docker-compose exec -T db psql -U postgres -d college_community -c "\d files" 2>&1)
+folders_check=$(docker-compose exec -T db psql -U postgres -d college_community -c "\d folders" 2>&1)
 
 if echo "$db_check" | grep -q "folder_path"; then
     echo "   ✅ folder_path column exists"
@@ -61,22 +62,22 @@ else
     echo "   ❌ folder_path column missing"
 fi
 
-if echo "$db_check" | grep -q "is_folder"; then
-    echo "   ✅ is_folder column exists"
+if echo "$db_check" | grep -q "ix_files_college_folder_path"; then
+    echo "   ✅ folder_path index exists"
 else
-    echo "   ❌ is_folder column missing"
+    echo "   ⚠️  folder_path index missing"
 fi
 
-if echo "$db_check" | grep -q "parent_folder_id"; then
-    echo "   ✅ parent_folder_id column exists"
+if echo "$folders_check" | grep -q "parent_id"; then
+    echo "   ✅ folders table exists"
 else
-    echo "   ❌ parent_folder_id column missing"
+    echo "   ❌ folders table missing (run migrations/20241120_140000_split_folders_table.sql)"
 fi
 
-if echo "$db_check" | grep -q "idx_files_folder_path"; then
-    echo "   ✅ folder_path index exists"
+if echo "$folders_check" | grep -q "ix_folders_college_path"; then
+    echo "   ✅ folders path index exists"
 else
-    echo "   ⚠️  folder_path index missing"
+    echo "   ⚠️  folders path index missing"
 fi
 
 echo ""
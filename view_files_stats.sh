@@ -17,10 +17,9 @@ SELECT
     id,
     original_filename,
     file_size,
-    file_type,
+    (ARRAY['DOCUMENT', 'PRESENTATION', 'SPREADSHEET', 'IMAGE', 'VIDEO', 'AUDIO', 'ARCHIVE', 'TEXT', 'OTHER'])[file_type + 1] AS file_type,
     department,
     folder_path,
-    is_folder,
     created_at
 FROM files
 ORDER BY created_at DESC
@@ -38,7 +37,6 @@ SELECT
     ROUND(SUM(file_size)::numeric / 1024 / 1024, 2) as total_mb,
     ROUND(SUM(file_size)::numeric / 1024 / 1024 / 1024, 2) as total_gb
 FROM files
-WHERE is_folder = FALSE
 GROUP BY department
 ORDER BY total_bytes DESC;
 EOF
@@ -49,8 +47,7 @@ echo "-------------------------------------------"
 docker-compose exec -T db psql -U postgres -d college_community << 'EOF'
 SELECT COUNT(*) as orphaned_count
 FROM files 
-WHERE is_folder = FALSE 
-  AND (file_path IS NULL OR file_path = '');
+WHERE file_path IS NULL OR file_path = '';
 EOF
 
 echo ""